@@ -0,0 +1,91 @@
+# DJANGO IMPORTS
+from django.db import connections, transaction
+from django.db.models import Max, Value
+
+# MODELS
+from posts.models import Posts
+from likes.models import Likes
+from comments.models import Comments
+from .models import ArchivedPosts, ArchivedComments, ArchivedLikes
+
+# CACHE
+from base.cache import bump_generation
+
+
+def copy_rows(queryset, model, **values):
+    '''
+    Copies the rows of the queryset to the table of the model with a single INSERT ... SELECT (no row goes through Python).
+    Both tables share their column names, values fills the columns the source table doesn't have (e.g. archived_at)
+    '''
+    connection = connections[queryset.db]
+    fields = [field for field in model._meta.concrete_fields if field.attname not in values]
+    extra = [model._meta.get_field(name) for name in values]
+
+    select = queryset.order_by().annotate(**{
+        f'copy_{field.attname}': Value(values[field.attname], output_field=field) for field in extra
+    }).values_list(*[field.attname for field in fields], *[f'copy_{field.attname}' for field in extra])
+
+    sql, params = select.query.sql_with_params()
+    columns = ', '.join(connection.ops.quote_name(field.column) for field in fields + extra)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'INSERT INTO {connection.ops.quote_name(model._meta.db_table)} ({columns}) {sql}', params)
+        return cursor.rowcount
+
+
+def archive_posts(ids, archived_at):
+    '''
+    Moves the posts and all their comments and likes (whatever their state) to the archive tables. Returns how many posts were moved
+    '''
+    with transaction.atomic():
+        archived = copy_rows(Posts.objects.filter(id__in=ids), ArchivedPosts, archived_at=archived_at)
+        copy_rows(Comments.objects.filter(post_id__in=ids), ArchivedComments, archived_at=archived_at)
+        copy_rows(Likes.objects.filter(post_id__in=ids), ArchivedLikes, archived_at=archived_at)
+
+        # Cascades to their comments, likes, feed entries and trending scores (the post_delete signals invalidate the caches)
+        Posts.objects.filter(id__in=ids).delete()
+
+    return archived
+
+
+def archive_rows(model, ids, archived_at):
+    '''
+    Moves the comments or likes (model) to their archive table. Returns how many rows were moved
+    '''
+    archive = {Comments: ArchivedComments, Likes: ArchivedLikes}[model]
+
+    with transaction.atomic():
+        archived = copy_rows(model.objects.filter(id__in=ids), archive, archived_at=archived_at)
+        model.objects.filter(id__in=ids).delete()
+
+    return archived
+
+
+def restore_post(pk):
+    '''
+    Moves the archived post back to the hot tables, as it was (same id, still inactive), with its comments and likes.
+    Returns how many posts were restored (0 when it isn't archived). Raises IntegrityError if another post took its title meanwhile
+    '''
+    likes = ArchivedLikes.objects.filter(post_id=pk)
+    # A like archived on its own (unliked) may have been given again later, and (user, post) is unique: only the newest row of each user comes back
+    latest_likes = likes.order_by().values('user_id').annotate(latest=Max('id')).values('latest')
+
+    with transaction.atomic():
+        restored = copy_rows(ArchivedPosts.objects.filter(pk=pk), Posts)
+
+        if not restored:
+            return 0
+
+        copy_rows(ArchivedComments.objects.filter(post_id=pk), Comments)
+        copy_rows(likes.filter(id__in=latest_likes), Likes)
+
+        ArchivedPosts.objects.filter(pk=pk).delete()
+        ArchivedComments.objects.filter(post_id=pk).delete()
+        likes.delete()
+
+    # INSERT ... SELECT doesn't send post_save signals
+    bump_generation('posts')
+    bump_generation(f'likes:{pk}')
+    bump_generation(f'comments:{pk}')
+
+    return restored
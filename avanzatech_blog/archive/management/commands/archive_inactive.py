@@ -0,0 +1,53 @@
+# PYTHON IMPORTS
+from datetime import timedelta
+
+# DJANGO IMPORTS
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+# MODELS
+from posts.models import Posts
+from likes.models import Likes
+from comments.models import Comments
+
+# ARCHIVE
+from archive.archiving import archive_posts, archive_rows
+
+
+class Command(BaseCommand):
+    help = (
+        'Moves the posts, comments and likes soft deleted (inactive) for longer than --days to the archive tables, with the comments and likes '
+        'of the archived posts. Each batch is its own transaction, so it can be stopped and run again at any time (schedule it, e.g. daily with cron)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=float, default=settings.ARCHIVE_INACTIVE_AFTER_DAYS)
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        before = now - timedelta(days=options['days'])
+
+        # Posts first, so the comments and likes of the archived posts leave with them
+        posts = self.archive(Posts, before, options['batch_size'], lambda ids: archive_posts(ids, now))
+        comments = self.archive(Comments, before, options['batch_size'], lambda ids: archive_rows(Comments, ids, now))
+        likes = self.archive(Likes, before, options['batch_size'], lambda ids: archive_rows(Likes, ids, now))
+
+        self.stdout.write(self.style.SUCCESS(f'{posts} posts, {comments} comments and {likes} likes archived'))
+
+    def archive(self, model, before, batch_size, move):
+        # Walks the primary key once: the rows of a batch leave the table, and the rest of it only gets newer ids
+        last_id = 0
+        archived = 0
+
+        while True:
+            ids = list(
+                model.objects.filter(id__gt=last_id, is_active=False, updated_at__lt=before).order_by('id').values_list('id', flat=True)[:batch_size]
+            )
+
+            if not ids:
+                return archived
+
+            archived += move(ids)
+            last_id = ids[-1]
@@ -0,0 +1,41 @@
+# DJANGO IMPORTS
+from django.db import models
+
+# MODELS
+from base.models import BaseModel
+
+
+class ArchivedModel(BaseModel):
+    '''
+    Cold copy of a row moved out of its hot table by the archive_inactive command. It keeps the same id and columns, so
+    it can be copied back as it was (see archive/archiving.py)
+    '''
+    id = models.BigIntegerField(primary_key=True)
+    archived_at = models.DateTimeField()
+
+    class Meta(BaseModel.Meta):
+        abstract = True
+
+
+class ArchivedPosts(ArchivedModel):
+    # No foreign key constraints: users are never deleted for real, and the archive must not block anything
+    author = models.ForeignKey('user.CustomUsers', on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    title = models.CharField(max_length=100)
+    content = models.TextField(blank=True)
+    read_permission = models.CharField(max_length=13)
+    edit_permission = models.CharField(max_length=13)
+    author_team = models.CharField(max_length=30, blank=True)
+    likes_count = models.PositiveIntegerField(default=0)
+    comments_count = models.PositiveIntegerField(default=0)
+
+
+class ArchivedComments(ArchivedModel):
+    user = models.ForeignKey('user.CustomUsers', on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    # The post is either archived too or still in the hot table
+    post_id = models.BigIntegerField(db_index=True)
+    content = models.TextField(blank=True)
+
+
+class ArchivedLikes(ArchivedModel):
+    user = models.ForeignKey('user.CustomUsers', on_delete=models.DO_NOTHING, db_constraint=False, related_name='+')
+    post_id = models.BigIntegerField(db_index=True)
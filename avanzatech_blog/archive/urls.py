@@ -0,0 +1,10 @@
+# DJANGO IMPORTS
+from django.urls import path
+
+# VIEWS
+from . import views
+
+
+urlpatterns = [
+    path('posts/restore/<int:pk>/', views.ArchivedPostsRestoreAPIView.as_view(), name='archive-restore_post'),
+]
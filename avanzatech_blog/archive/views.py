@@ -0,0 +1,42 @@
+# DJANGO IMPORTS
+from django.db import IntegrityError
+from django.http import Http404
+
+# DJANGO REST FRAMEWORK IMPORTS
+from rest_framework import generics, status
+from rest_framework.response import Response
+
+# MODELS
+from posts.models import Posts
+
+# SERIALIZERS
+from posts.serializers import PostsRetrieveModelSerializer
+
+# ARCHIVE
+from .archiving import restore_post
+
+# PERMISSIONS
+from base.permissions import IsAdmin
+
+
+class ArchivedPostsRestoreAPIView(generics.GenericAPIView):
+    '''
+    It restores the specified archived post (path param), with its comments and likes, and makes it active again on the blogging platform. Only accessible for ADMIN
+    '''
+    serializer_class = PostsRetrieveModelSerializer
+    permission_classes = [IsAdmin]
+
+    def post(self, request, *args, **kwargs):
+        try:
+            restored = restore_post(kwargs['pk'])
+        except IntegrityError:
+            error = {'errors': ['A post with the same title already exists.']}
+            return Response(error, status=status.HTTP_400_BAD_REQUEST)
+
+        if not restored:
+            raise Http404
+
+        post = Posts.objects.get(pk=kwargs['pk'])
+        post.save_changes(is_active=True)
+
+        return Response(self.get_serializer(post).data)
@@ -9,8 +9,18 @@ https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
 
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
+from django.core.handlers.asgi import ASGIRequest
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'avanzatech_blog.settings')
 
 application = get_asgi_application()
+
+
+class AsyncURLConfASGIRequest(ASGIRequest):
+    # Requests resolve their urlconf attribute instead of ROOT_URLCONF
+    urlconf = settings.ASGI_ROOT_URLCONF
+
+
+application.request_class = AsyncURLConfASGIRequest
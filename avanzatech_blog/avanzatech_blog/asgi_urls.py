@@ -0,0 +1,15 @@
+"""
+URL configuration of the ASGI workers (see asgi.py and the ASGI_ROOT_URLCONF setting): the routes of avanzatech_blog.urls,
+with the async-native variants of the posts read endpoints (posts/async_urls.py).
+"""
+# DJANGO IMPORTS
+from django.urls import path, include
+
+# URLS
+from .urls import urlpatterns as sync_urlpatterns
+
+
+urlpatterns = [
+    path('api/posts/', include('posts.async_urls')) if str(pattern.pattern) == 'api/posts/' else pattern
+    for pattern in sync_urlpatterns
+]
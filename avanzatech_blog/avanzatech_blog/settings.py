@@ -47,6 +47,7 @@ INSTALLED_APPS = [
     'posts',
     'likes',
     'comments',
+    'archive',
     'doc',
 ]
 
@@ -62,6 +63,9 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'avanzatech_blog.urls'
 
+# URL configuration of the ASGI workers (asgi.py): the async-native read endpoints. Set it to ROOT_URLCONF to serve the sync views under ASGI
+ASGI_ROOT_URLCONF = 'avanzatech_blog.asgi_urls'
+
 AUTH_USER_MODEL = 'user.CustomUsers'
 
 SESSION_ENGINE = 'django.contrib.sessions.backends.db'
@@ -101,6 +105,64 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+
+# LocMemCache is per process: the cached pages/counts and the generation counters that invalidate them on writes
+# (base/cache.py) aren't shared, so a write only invalidates the caches of the process that made it. Serve with a single
+# process (threads are fine), or switch to a shared backend (e.g. django.core.cache.backends.redis.RedisCache) before
+# running several workers. The visibility index (base/visibility.py) only skips queries with a shared backend
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        # 300 by default, less than the pages of a few busy viewers
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    }
+}
+
+# Seconds a cached total_count (count=cached query param) is served before it's recounted
+PAGINATION_COUNT_CACHE_TIMEOUT = 60
+
+# Seconds a posts list page is served from the cache (writes to posts invalidate it before that, likes/comments don't: their counters lag)
+POSTS_LIST_CACHE_TIMEOUT = 60
+
+# Most results a search (api/posts/search/) returns: the best matches among the posts the viewer can read
+POSTS_SEARCH_MAX_RESULTS = 1000
+
+# How much more a match in the title counts than a match in the content (bm25 column weight)
+POSTS_SEARCH_TITLE_WEIGHT = 10.0
+
+# Readers a post is fanned out to one by one (api/posts/feed/). Posts with a bigger audience get a single team/all entry instead
+FEED_FANOUT_LIMIT = 10000
+
+# Trending scores (compute_trending command): likes/comments older than the window are ignored, and the weight of
+# the rest halves every TRENDING_HALF_LIFE_HOURS
+TRENDING_WINDOW_DAYS = 7
+TRENDING_HALF_LIFE_HOURS = 24
+TRENDING_LIKE_WEIGHT = 1.0
+TRENDING_COMMENT_WEIGHT = 2.0
+
+# Soft deleted posts, comments and likes older than this are moved to the archive tables (archive_inactive command)
+ARCHIVE_INACTIVE_AFTER_DAYS = 90
+
+
+# Django REST framework
+# https://www.django-rest-framework.org/api-guide/settings/
+
+REST_FRAMEWORK = {
+    # The browsable API is only rendered while developing
+    'DEFAULT_RENDERER_CLASSES': [
+        'base.renderers.FastJSONRenderer',
+        *(['rest_framework.renderers.BrowsableAPIRenderer'] if DEBUG else []),
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'base.parsers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
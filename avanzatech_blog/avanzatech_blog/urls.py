@@ -24,6 +24,7 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/users/', include('user.urls')),
     path('api/posts/', include('posts.urls')),
+    path('api/archive/', include('archive.urls')),
     path('api/doc/', TemplateView.as_view(
         template_name='swagger-ui/swagger-ui.html',
         extra_context={'schema_url': 'openapi-schema'}
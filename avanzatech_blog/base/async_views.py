@@ -0,0 +1,64 @@
+# DJANGO IMPORTS
+from django.http import HttpResponse
+from django.views import View
+
+# DJANGO REST FRAMEWORK IMPORTS
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import exception_handler
+
+# RENDERERS
+from .renderers import FastJSONRenderer
+
+
+class AsyncReadAPIView(View):
+    '''
+    Async-native (ASGI) GET endpoint on top of a DRF read view (view_class): the DRF view still builds the queryset, the
+    serializer and the paginator, which doesn't touch the database, and its async method (action) runs the queries with
+    the async ORM, so a request waiting on the database doesn't hold a worker thread.
+
+    Users are authenticated by their session (request.auser()) and responses are always JSON (FastJSONRenderer)
+    '''
+    view_class = None
+    action = 'alist'
+    http_method_names = ['get', 'head', 'options']
+
+    async def get(self, request, *args, **kwargs):
+        view = self.initialize_view(request, await request.auser(), *args, **kwargs)
+
+        try:
+            view.check_permissions(view.request)
+            response = await getattr(view, self.action)(view.request, *args, **kwargs)
+        except Exception as exc:
+            # Same error bodies as the DRF views (e.g. {'detail': 'Not found.'}, {'errors': [...]})
+            response = exception_handler(exc, {'view': view, 'args': args, 'kwargs': kwargs, 'request': view.request})
+
+            if response is None:
+                raise
+
+        # e.g. the 304s of the retrieve endpoint
+        if not isinstance(response, Response):
+            return response
+
+        return self.render(response)
+
+    def initialize_view(self, request, user, *args, **kwargs):
+        drf_request = Request(request, parsers=[], authenticators=[])
+        drf_request.user = user
+        drf_request.accepted_renderer = FastJSONRenderer()
+        drf_request.accepted_media_type = FastJSONRenderer.media_type
+
+        return self.view_class(args=args, kwargs=kwargs, request=drf_request, format_kwarg=None, headers={})
+
+    def render(self, response):
+        http_response = HttpResponse(
+            FastJSONRenderer().render(response.data),
+            status=response.status_code,
+            content_type=FastJSONRenderer.media_type
+        )
+
+        for header, value in response.items():
+            if header != 'Content-Type':
+                http_response[header] = value
+
+        return http_response
@@ -0,0 +1,87 @@
+# PYTHON IMPORTS
+import random
+import statistics
+import time
+from contextlib import contextmanager
+
+# DJANGO IMPORTS
+from django.db import transaction
+
+# MODELS
+from user.models import CustomUsers
+from posts.models import Posts
+from likes.models import Likes
+from comments.models import Comments
+
+
+PERMISSIONS = [permission for permission, _ in Posts.PERMISSIONS]
+
+
+@contextmanager
+def rollback():
+    '''
+    Runs the block inside a transaction that is always rolled back, so benchmarks never leave data (or schema changes) behind
+    '''
+    with transaction.atomic():
+        yield
+        transaction.set_rollback(True)
+
+
+def measure(function, repeat=5):
+    '''
+    Returns the median wall time of the function in milliseconds
+    '''
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(timings)
+
+
+def seed_users(users, teams, prefix='benchmark'):
+    return CustomUsers.objects.bulk_create([
+        CustomUsers(email=f'{prefix}_{i}@example.com', team=f'team {i % teams}')
+        for i in range(users)
+    ], batch_size=1000)
+
+
+def seed_posts(authors, posts, seed=0, prefix='Benchmark'):
+    generator = random.Random(seed)
+
+    instances = [
+        Posts(
+            author=generator.choice(authors),
+            title=f'{prefix} post {i}',
+            content='Lorem ipsum dolor sit amet. ' * 20,
+            read_permission=generator.choice(PERMISSIONS),
+            edit_permission=generator.choice(PERMISSIONS),
+            is_active=generator.random() > 0.1
+        )
+        for i in range(posts)
+    ]
+
+    # bulk_create() skips Posts.save()
+    for post in instances:
+        post.author_team = post.author.team
+
+    return Posts.objects.bulk_create(instances, batch_size=1000)
+
+
+def seed_likes(users, posts, likes):
+    # One like per (user, post) pair, the users of the first post first
+    return Likes.objects.bulk_create([
+        Likes(user=users[i % len(users)], post=posts[i // len(users)])
+        for i in range(min(likes, len(users) * len(posts)))
+    ], batch_size=1000)
+
+
+def seed_comments(users, posts, comments, seed=0):
+    generator = random.Random(seed)
+
+    return Comments.objects.bulk_create([
+        Comments(user=generator.choice(users), post=posts[i % len(posts)], content='Lorem ipsum dolor sit amet. ' * 5)
+        for i in range(comments)
+    ], batch_size=1000)
@@ -0,0 +1,34 @@
+# PYTHON IMPORTS
+import hashlib
+import time
+
+# DJANGO IMPORTS
+from django.core.cache import cache
+
+
+def get_generation(scope):
+    '''
+    Returns the current generation of the scope. Cache keys built with it become unreachable after bump_generation(scope)
+    '''
+    key = f'generation:{scope}'
+    generation = cache.get(key)
+
+    if generation is None:
+        # Seeded from the clock, so a counter that was evicted never comes back with an already used value
+        cache.add(key, time.time_ns(), None)
+        generation = cache.get(key)
+
+    return generation
+
+
+def bump_generation(scope):
+    try:
+        return cache.incr(f'generation:{scope}')
+    except ValueError:
+        return get_generation(scope)
+
+
+def build_cache_key(prefix, scope, *parts):
+    digest = hashlib.md5(repr(parts).encode()).hexdigest()
+
+    return f'{prefix}:{scope}:{get_generation(scope)}:{digest}'
@@ -0,0 +1,81 @@
+# PYTHON IMPORTS
+from datetime import datetime, time
+
+# DJANGO IMPORTS
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+# DJANGO REST FRAMEWORK IMPORTS
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+# MODELS
+from posts.models import Posts
+
+
+# Params of filter_posts()
+POSTS_FILTERS = ('author', 'team', 'read_permission', 'created_after', 'created_before')
+
+
+def parse_created_at(value):
+    '''
+    Accepts ISO 8601 datetimes (naive ones are taken in the current time zone) and dates (midnight)
+    '''
+    try:
+        moment = parse_datetime(value)
+
+        if moment is None:
+            day = parse_date(value)
+            moment = datetime.combine(day, time.min) if day else None
+    except ValueError:
+        moment = None
+
+    if moment is not None and timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+
+    return moment
+
+
+def filter_posts(queryset, params):
+    '''
+    Narrows the (already visibility filtered) posts with the author, team, read_permission, created_after (inclusive)
+    and created_before (exclusive) query params. Every filter is served by one of the Posts indexes
+    '''
+    filters = {}
+    errors = []
+
+    if params.get('author'):
+        try:
+            filters['author'] = int(params['author'])
+        except ValueError:
+            errors.append('Author query param must be an integer (user id).')
+
+    if params.get('team'):
+        filters['author_team'] = params['team']
+
+    if params.get('read_permission'):
+        permissions = [permission for permission, _ in Posts.PERMISSIONS]
+
+        if params['read_permission'] in permissions:
+            filters['read_permission'] = params['read_permission']
+        else:
+            errors.append(f'Read_permission query param must be one of: {", ".join(permissions)}.')
+
+    for param, lookup in (('created_after', 'created_at__gte'), ('created_before', 'created_at__lt')):
+        if params.get(param):
+            moment = parse_created_at(params[param])
+
+            if moment is None:
+                errors.append(f'{param.capitalize()} query param must be an ISO 8601 date or datetime.')
+            else:
+                filters[lookup] = moment
+
+    if errors:
+        raise ValidationError({'errors': errors})
+
+    return queryset.filter(**filters) if filters else queryset
+
+
+class PostsFilterBackend(BaseFilterBackend):
+    def filter_queryset(self, request, queryset, view):
+        return filter_posts(queryset, request.query_params)
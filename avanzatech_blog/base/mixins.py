@@ -0,0 +1,162 @@
+# DJANGO REST FRAMEWORK IMPORTS
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+# QUERY SET
+from .query_set import get_visibility_key
+
+# CACHE
+from .cache import build_cache_key
+
+# SERIALIZERS
+from .serializers import get_values_fields, serialize_values
+
+
+class SparseFieldsMixin():
+    '''
+    The fields query param (e.g. ?fields=id,title) restricts the serialized fields. The restriction is pushed down to the
+    ORM with only(), so the columns that weren't requested (like the content of the posts) are never read.
+
+    The optional fields of the serializer (Meta.optional_fields) are only computed when requested, with fields or with the
+    include query param (e.g. ?include=liked_by_me adds it to the default fields): the view annotates them with its
+    annotate_fields(queryset, fields)
+    '''
+    fields_query_param = 'fields'
+    include_query_param = 'include'
+    # Columns the view itself reads from the instances, whatever the client requested
+    required_fields = ()
+
+    def get_requested_fields(self):
+        if not hasattr(self, '_requested_fields'):
+            self._requested_fields = None
+
+            value = self.request.query_params.get(self.fields_query_param)
+            include = self.request.query_params.get(self.include_query_param)
+
+            if value is not None or include is not None:
+                meta = self.get_serializer_class().Meta
+                available = meta.fields
+                optional = getattr(meta, 'optional_fields', ())
+
+                if value is not None:
+                    requested = [field for field in value.split(',') if field]
+                    unknown = [field for field in requested if field not in available]
+
+                    if not requested:
+                        raise ValidationError({'errors': ['Fields query param may not be blank.']})
+
+                    if unknown:
+                        raise ValidationError({'errors': [f'Unknown fields: {", ".join(unknown)}. Available fields: {", ".join(available)}.']})
+                else:
+                    requested = [field for field in available if field not in optional]
+
+                if include is not None:
+                    included = [field for field in include.split(',') if field]
+                    unknown = [field for field in included if field not in optional]
+
+                    if not included:
+                        raise ValidationError({'errors': ['Include query param may not be blank.']})
+
+                    if unknown:
+                        raise ValidationError({'errors': [f'Unknown optional fields: {", ".join(unknown)}. Optional fields: {", ".join(optional) or "none"}.']})
+
+                    requested += included
+
+                self._requested_fields = [field for field in available if field in requested]
+
+        return self._requested_fields
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        fields = self.get_requested_fields()
+
+        if fields is None:
+            return queryset
+
+        optional = [field for field in fields if field in getattr(self.get_serializer_class().Meta, 'optional_fields', ())]
+
+        if optional:
+            queryset = self.annotate_fields(queryset, optional)
+
+        return queryset.only(*[field for field in fields if field not in optional], *self.required_fields)
+
+    def get_serializer(self, *args, **kwargs):
+        fields = self.get_requested_fields()
+
+        if fields is not None:
+            kwargs['fields'] = fields
+
+        return super().get_serializer(*args, **kwargs)
+
+
+class PostsCountCacheKeyMixin():
+    '''
+    Cache key of the total counts of the posts lists (count=cached, see CountStrategyPagination): one per viewer visibility
+    class and filters of the request. The params that don't change the count (paging, fields...) are left out
+    '''
+    count_cache_prefix = 'count'
+    count_cache_ignored_params = ('page', 'page_size', 'count', 'fields', 'include')
+
+    def get_count_cache_key(self):
+        filters = sorted((key, value) for key, value in self.request.query_params.items() if key not in self.count_cache_ignored_params)
+
+        return build_cache_key(self.count_cache_prefix, 'posts', get_visibility_key(self.request.user), filters)
+
+
+class ValuesListMixin():
+    '''
+    List endpoints whose serializer is a plain passthrough of model columns (see get_values_fields) read values() rows
+    and build the response dicts from them: no model instance nor field serializer is created per row. Any other
+    serializer keeps the usual path. alist() is the same list for the async views (base/async_views.py)
+    '''
+
+    def get_values_fields(self):
+        if not hasattr(self, '_values_fields'):
+            self._values_fields = get_values_fields(self.get_serializer())
+
+        return self._values_fields
+
+    def list(self, request, *args, **kwargs):
+        return self.get_list_response(self.filter_queryset(self.get_queryset()))
+
+    def get_list_response(self, queryset):
+        fields = self.get_values_fields()
+
+        if fields is not None:
+            # The primary key and the required fields are also read by the paginations (e.g. cursors)
+            queryset = queryset.values(*dict.fromkeys(['pk', *fields.values(), *getattr(self, 'required_fields', ())]))
+
+        page = self.paginate_queryset(queryset)
+        rows = queryset if page is None else page
+
+        if fields is not None:
+            data = serialize_values(rows, fields)
+        else:
+            data = self.get_serializer(rows, many=True).data
+
+        if page is not None:
+            return self.get_paginated_response(data)
+
+        return Response(data)
+
+    async def alist(self, request, *args, **kwargs):
+        return await self.aget_list_response(self.filter_queryset(self.get_queryset()))
+
+    async def aget_list_response(self, queryset):
+        fields = self.get_values_fields()
+
+        if fields is not None:
+            queryset = queryset.values(*dict.fromkeys(['pk', *fields.values(), *getattr(self, 'required_fields', ())]))
+
+        page = None if self.paginator is None else await self.paginator.apaginate_queryset(queryset, self.request, view=self)
+        rows = [row async for row in queryset] if page is None else page
+
+        if fields is not None:
+            data = serialize_values(rows, fields)
+        else:
+            data = self.get_serializer(rows, many=True).data
+
+        if page is not None:
+            return self.get_paginated_response(data)
+
+        return Response(data)
@@ -1,8 +1,21 @@
 # DJANGO IMPORTS
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 
+class BaseQuerySet(models.QuerySet):
+    def soft_delete(self):
+        '''
+        Soft deletes the active rows of the queryset with a single UPDATE (no instance is loaded nor saved, so no signal is
+        sent and the callers invalidate their own caches). Returns how many rows were deleted
+        '''
+        return self.filter(is_active=True).update(is_active=False, updated_at=timezone.now())
+
+
+BaseManager = models.Manager.from_queryset(BaseQuerySet)
+
+
 class BaseModel(models.Model):
     created_at = models.DateTimeField(_("created at"), auto_now_add=True)
     updated_at = models.DateTimeField(_("created at"), auto_now=True)
@@ -11,3 +24,18 @@ class BaseModel(models.Model):
     class Meta:
         abstract = True
         ordering = ['created_at']
+
+    def save_changes(self, **values):
+        '''
+        Sets the values that differ from the current ones and writes only those columns (plus updated_at). Returns the
+        changed fields: when nothing changed the row isn't written at all, so updated_at (and the caches) stay as they are
+        '''
+        changed = [field for field, value in values.items() if getattr(self, field) != value]
+
+        for field in changed:
+            setattr(self, field, values[field])
+
+        if changed:
+            self.save(update_fields=[*changed, 'updated_at'])
+
+        return changed
@@ -1,17 +1,139 @@
 # PYTHON IMPORTS
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from collections import OrderedDict
+from functools import partial
+
+# DJANGO IMPORTS
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import InvalidPage, Paginator
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
 
 # DJANGO REST FRAMEWORK IMPORTS
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination, _positive_int
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
-class ListPostsCommentsPagination(PageNumberPagination):
-    page_size = 10
+class CachedCountPaginator(Paginator):
+    '''
+    Paginator whose COUNT(*) is cached under a key that already identifies the viewer visibility class and the data
+    generation (so writes invalidate it)
+    '''
+
+    def __init__(self, *args, cache_key, cache_timeout, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_key = cache_key
+        self.cache_timeout = cache_timeout
+
+    @cached_property
+    def count(self):
+        count = cache.get(self.cache_key)
+
+        if count is None:
+            count = self.object_list.count()
+            cache.set(self.cache_key, count, self.cache_timeout)
+
+        return count
+
+
+class CountStrategyPagination(PageNumberPagination):
+    '''
+    The count query param chooses how the total of the page-number envelope is obtained:
+    - exact (default): COUNT(*) on every request
+    - cached: COUNT(*) cached per viewer visibility class (see get_count_cache_key of the view) until the TTL expires or the data changes
+    - false: no COUNT(*) at all, page_size + 1 rows are fetched and has_more replaces total_pages/total_count
+    '''
     page_size_query_param = 'page_size'
     max_page_size = 1000
+    count_query_param = 'count'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count_mode = request.query_params.get(self.count_query_param, 'exact')
+
+        if self.count_mode == 'false':
+            return self.paginate_queryset_without_count(queryset, request, view)
+
+        if self.count_mode == 'cached' and hasattr(view, 'get_count_cache_key'):
+            self.django_paginator_class = partial(CachedCountPaginator, cache_key=view.get_count_cache_key(), cache_timeout=settings.PAGINATION_COUNT_CACHE_TIMEOUT)
+        else:
+            self.count_mode = 'exact'
+
+        return super().paginate_queryset(queryset, request, view)
+
+    def paginate_queryset_without_count(self, queryset, request, view=None):
+        return self.set_results_without_count(list(self.get_queryset_without_count(queryset, request)))
+
+    def get_queryset_without_count(self, queryset, request):
+        self.request = request
+        self.page_size_without_count = self.get_page_size(request)
+
+        try:
+            self.page_number = _positive_int(request.query_params.get(self.page_query_param, 1), strict=True)
+        except ValueError:
+            raise NotFound(self.invalid_page_message.format(page_number=request.query_params.get(self.page_query_param), message='Invalid page.'))
+
+        offset = (self.page_number - 1) * self.page_size_without_count
+
+        return queryset[offset:offset + self.page_size_without_count + 1]
+
+    def set_results_without_count(self, results):
+        if not results and self.page_number > 1:
+            raise NotFound(self.invalid_page_message.format(page_number=self.page_number, message='That page contains no results'))
+
+        self.has_more = len(results) > self.page_size_without_count
+
+        return results[:self.page_size_without_count]
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        '''
+        paginate_queryset() for the async views: the same pages and count strategies, queried with the async ORM
+        '''
+        self.count_mode = request.query_params.get(self.count_query_param, 'exact')
+
+        if self.count_mode == 'false':
+            return self.set_results_without_count([row async for row in self.get_queryset_without_count(queryset, request)])
+
+        if self.count_mode == 'cached' and hasattr(view, 'get_count_cache_key'):
+            cache_key = view.get_count_cache_key()
+            count = await cache.aget(cache_key)
+
+            if count is None:
+                count = await queryset.acount()
+                await cache.aset(cache_key, count, settings.PAGINATION_COUNT_CACHE_TIMEOUT)
+        else:
+            self.count_mode = 'exact'
+            count = await queryset.acount()
+
+        paginator = Paginator(queryset, self.get_page_size(request))
+        # Already counted, so the paginator doesn't query
+        paginator.count = count
+        page_number = self.get_page_number(request, paginator)
+
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=str(exc)))
+
+        self.page.object_list = [row async for row in self.page.object_list]
+        self.request = request
+
+        return list(self.page)
 
     def get_paginated_response(self, data):
+        if self.count_mode == 'false':
+            return Response(OrderedDict([
+                ('current_page', self.page_number),
+                ('has_more', self.has_more),
+                ('next', self.get_next_link()),
+                ('previous', self.get_previous_link()),
+                ('results', data)
+            ]))
+
         return Response(OrderedDict([
             ('current_page', self.page.number),
             ('total_pages', self.page.paginator.num_pages),
@@ -20,19 +142,136 @@ class ListPostsCommentsPagination(PageNumberPagination):
             ('previous', self.get_previous_link()),
             ('results', data)
         ]))
+
+    def get_next_link(self):
+        if self.count_mode != 'false':
+            return super().get_next_link()
+
+        if not self.has_more:
+            return None
+
+        return replace_query_param(self.request.build_absolute_uri(), self.page_query_param, self.page_number + 1)
+
+    def get_previous_link(self):
+        if self.count_mode != 'false':
+            return super().get_previous_link()
+
+        if self.page_number == 1:
+            return None
+
+        if self.page_number == 2:
+            return remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+
+        return replace_query_param(self.request.build_absolute_uri(), self.page_query_param, self.page_number - 1)
+
+
+class ListPostsCommentsPagination(CountStrategyPagination):
+    page_size = 10
     
 
-class ListLikesPagination(PageNumberPagination):
+class ListLikesPagination(CountStrategyPagination):
     page_size = 20
+
+
+class ListPostsCursorPagination(BasePagination):
+    '''
+    Keyset pagination over (created_at, id). Every page is a range scan that starts right after the cursor, so deep
+    pages cost the same as the first one (no OFFSET)
+    '''
+    page_size = 10
     page_size_query_param = 'page_size'
     max_page_size = 1000
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.set_page(list(self.get_page_queryset(queryset, request)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        return self.set_page([row async for row in self.get_page_queryset(queryset, request)])
+
+    def get_page_queryset(self, queryset, request):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.cursor = self.decode_cursor(request)
+        self.reverse = False
+
+        if self.cursor is not None:
+            created_at, pk, self.reverse = self.cursor
+
+            if self.reverse:
+                queryset = queryset.filter(Q(created_at__lte=created_at) & (Q(created_at__lt=created_at) | Q(id__lt=pk)))
+            else:
+                queryset = queryset.filter(Q(created_at__gte=created_at) & (Q(created_at__gt=created_at) | Q(id__gt=pk)))
+
+        ordering = ('-created_at', '-id') if self.reverse else ('created_at', 'id')
+
+        # One extra row tells whether there is a following page, without counting
+        return queryset.order_by(*ordering)[:self.page_size + 1]
+
+    def set_page(self, results):
+        has_following = len(results) > self.page_size
+
+        self.page = results[:self.page_size]
+
+        if self.reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = self.cursor is not None, has_following
+        else:
+            self.has_next, self.has_previous = has_following, self.cursor is not None
+
+        return self.page
 
     def get_paginated_response(self, data):
         return Response(OrderedDict([
-            ('current_page', self.page.number),
-            ('total_pages', self.page.paginator.num_pages),
-            ('total_count', self.page.paginator.count),
             ('next', self.get_next_link()),
             ('previous', self.get_previous_link()),
             ('results', data)
         ]))
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(request.query_params[self.page_size_query_param], strict=True, cutoff=self.max_page_size)
+        except (KeyError, ValueError):
+            return self.page_size
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+
+        if encoded is None:
+            return None
+
+        try:
+            created_at, pk, reverse = json.loads(urlsafe_b64decode(encoded.encode('ascii')))
+            created_at = parse_datetime(created_at)
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if created_at is None or not isinstance(pk, int):
+            raise NotFound(self.invalid_cursor_message)
+
+        return created_at, pk, bool(reverse)
+
+    def encode_cursor(self, instance, reverse):
+        # Model instances or values() rows (see ValuesListMixin)
+        if isinstance(instance, dict):
+            created_at, pk = instance['created_at'], instance['pk']
+        else:
+            created_at, pk = instance.created_at, instance.pk
+
+        position = json.dumps([created_at.isoformat(), pk, int(reverse)])
+        encoded = urlsafe_b64encode(position.encode('ascii')).decode('ascii')
+
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, encoded)
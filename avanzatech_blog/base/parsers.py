@@ -0,0 +1,32 @@
+# DJANGO IMPORTS
+from django.conf import settings
+
+# DJANGO REST FRAMEWORK IMPORTS
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONParser(JSONParser):
+    '''
+    JSON request bodies parsed by orjson (strict, like JSONParser: NaN/Infinity are rejected). Without orjson installed it's DRF's JSONParser
+    '''
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+
+        encoding = (parser_context or {}).get('encoding', settings.DEFAULT_CHARSET)
+
+        try:
+            content = stream.read()
+
+            if encoding.lower().replace('-', '') != 'utf8':
+                content = content.decode(encoding)
+
+            return orjson.loads(content)
+        except ValueError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
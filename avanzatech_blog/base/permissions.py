@@ -9,3 +9,12 @@ class IsSuperuser(BasePermission):
 
     def has_permission(self, request, view):
         return bool(request.user and request.user.is_superuser)
+
+
+class IsAdmin(BasePermission):
+    """
+    Allows access only to authenticated users with the admin role.
+    """
+
+    def has_permission(self, request, view):
+        return bool(request.user and request.user.is_authenticated and request.user.role == 'admin')
@@ -1,24 +1,216 @@
+# PYTHON IMPORTS
+from asgiref.sync import sync_to_async
+
 # DJANGO IMPORTS
-from django.db.models import Q
+from django.db.models import Count, Exists, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.http import Http404
+
+# DJANGO REST FRAMEWORK IMPORTS
+from rest_framework.exceptions import ValidationError
 
 # MODELS
 from posts.models import Posts
+from likes.models import Likes
+from comments.models import Comments
+
+# FILTERS
+from base.filters import POSTS_FILTERS, filter_posts
+
+# VISIBILITY
+from base.visibility import visibility_index
+
+# CACHE
+from base.cache import get_generation
+
+
+def get_posts_queryset(user, method):
+    if hasattr(user, 'role'):
+        if user.role == 'admin':
+            return Posts.objects.all()
+
+        # is_active is repeated in every branch: SQLite only reads a partial index (WHERE is_active) for the branch of an OR
+        # that implies its condition by itself
+        active = Q(is_active=True)
+
+        if method == 'GET' or method == 'POST':
+            # Check read permissions
+            return Posts.objects.filter((Q(read_permission='public') & active) | (Q(read_permission='authenticated') & active) | (Q(read_permission='team') & Q(author_team=user.team) & active) | (Q(read_permission='owner') & Q(author=user) & active))
+
+        if method == 'PUT' or method == 'PATCH' or method == 'DELETE':
+            # Check edit permissions
+            return Posts.objects.filter((Q(edit_permission='public') & active) | (Q(edit_permission='authenticated') & active) | (Q(edit_permission='team') & Q(author_team=user.team) & active) | (Q(edit_permission='owner') & Q(author=user) & active))
+    else:
+        return Posts.objects.filter(Q(read_permission='public') & Q(is_active=True))
+
+
+def get_visibility_key(user):
+    '''
+    Identifies the set of posts the user can read: every anonymous user sees the same posts, so does every admin.
+    Bloggers also see their own owner-only posts, so their key is personal
+    '''
+    if not hasattr(user, 'role'):
+        return 'anonymous'
+
+    if user.role == 'admin':
+        return 'admin'
+
+    return f'blogger:{user.pk}:{user.team}'
+
+
+def annotate_posts(queryset, user, fields):
+    '''
+    Annotates the optional fields of the posts serializers (fields) on the posts: one correlated EXISTS per row on the
+    (user, post) unique index for liked_by_me and a correlated COUNT of the active likes/comments for like_count and
+    comment_count, so a page is still a single query
+    '''
+    annotations = {}
+
+    if 'liked_by_me' in fields:
+        if hasattr(user, 'role'):
+            annotations['liked_by_me'] = Exists(Likes.objects.filter(Q(user=user.pk) & Q(post=OuterRef('pk')) & Q(is_active=True)))
+        else:
+            annotations['liked_by_me'] = Value(False)
+
+    if 'like_count' in fields:
+        annotations['like_count'] = count_rows(Likes.objects.filter(Q(post=OuterRef('pk')) & Q(is_active=True)))
+
+    if 'comment_count' in fields:
+        annotations['comment_count'] = count_rows(Comments.objects.filter(Q(post=OuterRef('pk')) & Q(is_active=True)))
+
+    return queryset.annotate(**annotations)
+
+
+def count_rows(queryset):
+    '''
+    Scalar subquery with the number of rows of the (correlated) queryset, 0 instead of NULL when there are none
+    '''
+    count = queryset.order_by().values('post').annotate(count=Count('id')).values('count')
+
+    return Coalesce(Subquery(count), 0)
+
+
+def get_viewer_key(user, fields):
+    '''
+    get_visibility_key(), made personal when the fields depend on the viewer (liked_by_me). The generation of the
+    viewer's likes makes the key change with each of his/her likes
+    '''
+    key = get_visibility_key(user)
+
+    if fields is not None and 'liked_by_me' in fields and hasattr(user, 'role'):
+        key = f'{key}:{user.pk}:{get_generation(f"user_likes:{user.pk}")}'
+
+    return key
 
 
 class BasePostsQuerySet():
     def get_queryset(self, *args, **kwargs):
-        user = self.request.user
+        return get_posts_queryset(self.request.user, self.request.method)
 
-        if hasattr(user, 'role'):
-            if user.role == 'admin':
-                return Posts.objects.all()
+    def annotate_fields(self, queryset, fields):
+        return annotate_posts(queryset, self.request.user, fields)
 
-            if self.request.method == 'GET' or self.request.method == 'POST':
-                # Check read permissions
-                return Posts.objects.filter((Q(read_permission='public') | Q(read_permission='authenticated') | (Q(read_permission='team') & Q(author__team=user.team)) | (Q(read_permission='owner') & Q(author=user))) & Q(is_active=True))
+    def check_visibility(self):
+        '''
+        Pre-check of the post of the path (pk) against the in-memory visibility index: the ones it knows and the user can't
+        access are 404s without any query. It only skips requests, what it allows is still checked in the database
+        '''
+        if visibility_index.denies(self.request.user, self.kwargs['pk'], self.request.method):
+            raise Http404
 
-            if self.request.method == 'PUT' or self.request.method == 'PATCH' or self.request.method == 'DELETE':
-                # Check edit permissions
-                return Posts.objects.filter((Q(edit_permission='public') | Q(edit_permission='authenticated') | (Q(edit_permission='team') & Q(author__team=user.team)) | (Q(edit_permission='owner') & Q(author=user))) & Q(is_active=True))
-        else:
-            return Posts.objects.filter(Q(read_permission='public') & Q(is_active=True))
+    def get_object(self):
+        self.check_visibility()
+
+        return super().get_object()
+
+    def get_post(self):
+        '''
+        For the views that only need the id of the post (likes and comments): an unsaved Posts(pk=...), so the post row isn't
+        loaded. The access is confirmed in the database (an EXISTS on the visibility rules), the index may be stale
+        '''
+        self.check_visibility()
+
+        if not self.get_queryset().filter(pk=self.kwargs['pk']).exists():
+            raise Http404
+
+        return Posts(pk=self.kwargs['pk'])
+
+    async def acheck_visibility(self):
+        # The index may reload from the database
+        if await sync_to_async(visibility_index.denies)(self.request.user, self.kwargs['pk'], self.request.method):
+            raise Http404
+
+    async def aget_object(self):
+        await self.acheck_visibility()
+
+        try:
+            instance = await self.filter_queryset(self.get_queryset()).aget(pk=self.kwargs['pk'])
+        except Posts.DoesNotExist:
+            raise Http404
+
+        self.check_object_permissions(self.request, instance)
+
+        return instance
+
+    async def aget_post(self):
+        await self.acheck_visibility()
+
+        if not await self.get_queryset().filter(pk=self.kwargs['pk']).aexists():
+            raise Http404
+
+        return Posts(pk=self.kwargs['pk'])
+
+
+class BulkPostsQuerySet():
+    '''
+    The posts the user can edit (whatever the HTTP method of the bulk endpoint), narrowed by the ids (a list) and/or the
+    filters (an object with the posts list filters: author, team, read_permission, created_after, created_before) of the request body
+    '''
+    max_ids = 1000
+
+    def get_queryset(self, *args, **kwargs):
+        data = self.request.data
+
+        if not isinstance(data, dict):
+            raise ValidationError({'errors': ['Request body must be an object.']})
+
+        ids = data.get('ids')
+        filters = data.get('filters')
+
+        if filters is not None:
+            if not isinstance(filters, dict):
+                raise ValidationError({'errors': ['Filters must be an object.']})
+
+            # filter_posts() skips the params it doesn't know and the blank ones, which here would select every post
+            filters = {key: '' if value is None else str(value).strip() for key, value in filters.items()}
+            errors = []
+            unknown = [key for key in filters if key not in POSTS_FILTERS]
+            blank = [key for key, value in filters.items() if key in POSTS_FILTERS and not value]
+
+            if unknown:
+                errors.append(f'Unknown filters: {", ".join(unknown)}. Filters: {", ".join(POSTS_FILTERS)}.')
+
+            if blank:
+                errors.append(f'Filters can\'t be blank: {", ".join(blank)}.')
+
+            if errors:
+                raise ValidationError({'errors': errors})
+
+        if ids is None and not filters:
+            raise ValidationError({'errors': ['Send ids and/or filters to select the posts.']})
+
+        queryset = get_posts_queryset(self.request.user, 'PATCH')
+
+        if filters:
+            queryset = filter_posts(queryset, filters)
+
+        if ids is not None:
+            if not isinstance(ids, list) or not all(isinstance(pk, int) and not isinstance(pk, bool) for pk in ids):
+                raise ValidationError({'errors': ['Ids must be a list of integers.']})
+
+            if len(ids) > self.max_ids:
+                raise ValidationError({'errors': [f'No more than {self.max_ids} ids per request.']})
+
+            queryset = queryset.filter(id__in=ids)
+
+        return queryset
@@ -0,0 +1,27 @@
+# DJANGO REST FRAMEWORK IMPORTS
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    '''
+    Compact UTF-8 JSON rendered by orjson (several times faster than the json module on big pages). Without orjson
+    installed, or when the client asks for an indent (e.g. Accept: application/json; indent=4), it's DRF's JSONRenderer
+    '''
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if data is None:
+            return b''
+
+        # Lazy translations, Decimals, querysets... are encoded like DRF does
+        content = orjson.dumps(data, default=JSONEncoder().default, option=orjson.OPT_NON_STR_KEYS)
+
+        # Same escaping as JSONRenderer: the JSON stays valid JavaScript
+        return content.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -0,0 +1,62 @@
+# DJANGO REST FRAMEWORK IMPORTS
+from rest_framework import serializers
+
+
+# Fields whose to_representation() returns the column value unchanged (for the values the model fields can hold)
+PASSTHROUGH_FIELDS = (
+    serializers.IntegerField,
+    serializers.CharField,
+    serializers.ChoiceField,
+    serializers.BooleanField,
+    serializers.PrimaryKeyRelatedField,
+)
+
+
+class DynamicFieldsModelSerializer(serializers.ModelSerializer):
+    '''
+    ModelSerializer that takes an optional fields argument restricting the fields it serializes. The Meta.optional_fields
+    (computed by the views, e.g. annotations) are left out unless the fields argument names them
+    '''
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+
+        super().__init__(*args, **kwargs)
+
+        if fields is None:
+            fields = [field for field in self.fields if field not in getattr(self.Meta, 'optional_fields', ())]
+
+        for field_name in set(self.fields) - set(fields):
+            self.fields.pop(field_name)
+
+
+def get_values_fields(serializer):
+    '''
+    Returns {field name: column} when the model serializer only passes model columns through (plain model fields and
+    primary keys of foreign keys), so values() rows can stand in for it. Returns None for anything else: sources,
+    SerializerMethodFields, nested serializers, custom to_representation()...
+    '''
+    if type(serializer).to_representation is not serializers.ModelSerializer.to_representation:
+        return None
+
+    model = serializer.Meta.model
+    optional_fields = getattr(serializer.Meta, 'optional_fields', ())
+    fields = {}
+
+    for name, field in serializer.fields.items():
+        if type(field) not in PASSTHROUGH_FIELDS or field.source != name or getattr(field, 'pk_field', None) is not None:
+            return None
+
+        # The optional fields are annotations, selected by their name
+        fields[name] = name if name in optional_fields else model._meta.get_field(name).attname
+
+    return fields
+
+
+def serialize_values(rows, fields):
+    '''
+    Builds the serializer's output from values() rows, without model instances nor field serializers
+    '''
+    items = list(fields.items())
+
+    return [{name: row[column] for name, column in items} for row in rows]
@@ -0,0 +1,353 @@
+# PYTHON IMPORTS
+import threading
+from array import array
+from collections import defaultdict
+
+# DJANGO IMPORTS
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# MODELS
+from posts.models import Posts
+
+# CACHE
+from base.cache import bump_generation, get_generation
+
+
+# Permissions as small ints, in the order of Posts.PERMISSIONS (owner < team < authenticated < public)
+PERMISSIONS = {permission: level for level, (permission, _) in enumerate(Posts.PERMISSIONS)}
+OWNER, TEAM, AUTHENTICATED, PUBLIC = (PERMISSIONS[permission] for permission in ('owner', 'team', 'authenticated', 'public'))
+
+# Columns of the posts the index keeps
+COLUMNS = ('id', 'author_id', 'author_team', 'read_permission', 'edit_permission', 'is_active')
+# Fields whose changes have to reach the index (see posts/signals.py)
+FIELDS = ('author', 'author_team', 'read_permission', 'edit_permission', 'is_active')
+
+# The other methods check the edit permission
+READ_METHODS = ('GET', 'POST')
+
+# Cache backends private to each process: the generations bumped by a process never reach the others through them
+PER_PROCESS_CACHES = ('django.core.cache.backends.locmem.LocMemCache', 'django.core.cache.backends.dummy.DummyCache')
+
+# Most generations a copy catches up on by reloading the changed rows, further behind it reloads everything
+MAX_CHANGES = 100
+
+
+def iter_rows(mask):
+    '''
+    Yields the positions of the bits set in the mask, lowest first
+    '''
+    bits = bin(mask)[:1:-1]
+    row = bits.find('1')
+
+    while row != -1:
+        yield row
+        row = bits.find('1', row + 1)
+
+
+def build_mask(rows):
+    '''
+    The mask with the bits of the rows (ascending) set, built in a bytearray: or-ing the bits one by one into an int copies
+    the whole int each time, O(n²) for a full load
+    '''
+    if not rows:
+        return 0
+
+    bits = bytearray((rows[-1] >> 3) + 1)
+
+    for row in rows:
+        bits[row >> 3] |= 1 << (row & 7)
+
+    return int.from_bytes(bits, 'little')
+
+
+class VisibilityIndex():
+    '''
+    In-process copy of the ACL columns of every post (one array slot per post, permissions and teams as small ints) that
+    answers the visibility rules of get_posts_queryset without a query: can_access() in O(1), visible_ids() with bitset masks
+    (one Python int per permission/team/author, combined with a few big-int ANDs/ORs).
+
+    Copies are versioned by a generation in the cache: every write bumps it once its transaction commits, and the process
+    that wrote patches its copy then and records the ids it changed under the new generation. A copy that finds its
+    generation behind reloads those rows on next use (everything when the changes are too many or expired).
+
+    Other processes only see the bumps with a shared cache backend. With a per-process one (the default LocMemCache, see
+    settings.CACHES) a copy stays stale for as long as its process lives, so denies() never skips a request and the
+    database decides alone. Either way the database stays the authority of what the index allows (see BasePostsQuerySet.get_post)
+    '''
+    scope = 'visibility'
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.generation = None
+
+    def load(self):
+        with self.lock:
+            # Read before the rows, so a write that lands in between bumps it again and triggers another reload
+            generation = get_generation(self.scope)
+
+            self.positions = {}
+            self.ids = array('q')
+            self.authors = array('q')
+            self.teams = array('l')
+            self.read = array('b')
+            self.edit = array('b')
+            self.active = array('b')
+            self.team_ids = {}
+
+            # The rows of each mask, the masks are built at the end in one pass each
+            active_rows = []
+            read_rows = [[] for _ in PERMISSIONS]
+            edit_rows = [[] for _ in PERMISSIONS]
+            team_rows = defaultdict(list)
+            author_rows = defaultdict(list)
+
+            rows = Posts.objects.order_by('id').values_list(*COLUMNS).iterator(chunk_size=10000)
+
+            for row, (pk, author_id, author_team, read_permission, edit_permission, is_active) in enumerate(rows):
+                team = self.get_team_id(author_team)
+                read = PERMISSIONS[read_permission]
+                edit = PERMISSIONS[edit_permission]
+
+                self.positions[pk] = row
+                self.ids.append(pk)
+                self.authors.append(author_id)
+                self.teams.append(team)
+                self.read.append(read)
+                self.edit.append(edit)
+                self.active.append(is_active)
+
+                read_rows[read].append(row)
+                edit_rows[edit].append(row)
+                team_rows[team].append(row)
+                author_rows[author_id].append(row)
+
+                if is_active:
+                    active_rows.append(row)
+
+            self.present_mask = (1 << len(self.ids)) - 1
+            self.active_mask = build_mask(active_rows)
+            self.read_masks = [build_mask(rows) for rows in read_rows]
+            self.edit_masks = [build_mask(rows) for rows in edit_rows]
+            self.team_masks = {team: build_mask(rows) for team, rows in team_rows.items()}
+            self.author_masks = {author: build_mask(rows) for author, rows in author_rows.items()}
+
+            self.generation = generation
+
+    def sync(self):
+        with self.lock:
+            generation = get_generation(self.scope)
+
+            if self.generation == generation:
+                return
+
+            ids = self.get_changes(generation)
+
+            if ids is None:
+                self.load()
+            else:
+                self.reload_rows(ids)
+                self.generation = generation
+
+    def get_changes(self, generation):
+        '''
+        The ids changed since this copy was in sync up to the generation, None when they can't all be found
+        '''
+        if self.generation is None or not 0 < generation - self.generation <= MAX_CHANGES:
+            return None
+
+        keys = [self.get_changes_key(previous) for previous in range(self.generation + 1, generation + 1)]
+        changes = cache.get_many(keys)
+
+        if len(changes) != len(keys):
+            return None
+
+        return {pk for ids in changes.values() for pk in ids}
+
+    def get_changes_key(self, generation):
+        return f'changes:{self.scope}:{generation}'
+
+    def reload_rows(self, ids):
+        # Deleted posts leave the index
+        rows = list(Posts.objects.filter(id__in=ids).values_list(*COLUMNS))
+        found = {row[0] for row in rows}
+
+        for row in rows:
+            self.set_row(*row)
+
+        for pk in ids:
+            if pk not in found:
+                self.remove_row(pk)
+
+    def set_row(self, pk, author_id, author_team, read_permission, edit_permission, is_active):
+        row = self.positions.get(pk)
+
+        if row is None:
+            row = self.positions[pk] = len(self.ids)
+            self.ids.append(pk)
+            self.authors.append(author_id)
+            self.teams.append(self.get_team_id(author_team))
+            self.read.append(PERMISSIONS[read_permission])
+            self.edit.append(PERMISSIONS[edit_permission])
+            self.active.append(is_active)
+        else:
+            self.clear_bits(row)
+            self.authors[row] = author_id
+            self.teams[row] = self.get_team_id(author_team)
+            self.read[row] = PERMISSIONS[read_permission]
+            self.edit[row] = PERMISSIONS[edit_permission]
+            self.active[row] = is_active
+
+        bit = 1 << row
+
+        self.present_mask |= bit
+        self.read_masks[self.read[row]] |= bit
+        self.edit_masks[self.edit[row]] |= bit
+        self.team_masks[self.teams[row]] = self.team_masks.get(self.teams[row], 0) | bit
+        self.author_masks[author_id] = self.author_masks.get(author_id, 0) | bit
+
+        if is_active:
+            self.active_mask |= bit
+
+    def remove_row(self, pk):
+        # The slot is left empty (a hole in the masks), positions are never reused
+        row = self.positions.pop(pk, None)
+
+        if row is not None:
+            self.clear_bits(row)
+            self.present_mask &= ~(1 << row)
+
+    def clear_bits(self, row):
+        bit = ~(1 << row)
+
+        self.active_mask &= bit
+        self.read_masks[self.read[row]] &= bit
+        self.edit_masks[self.edit[row]] &= bit
+        self.team_masks[self.teams[row]] &= bit
+        self.author_masks[self.authors[row]] &= bit
+
+    def get_team_id(self, team):
+        return self.team_ids.setdefault(team, len(self.team_ids))
+
+    def can_access(self, user, pk, method='GET'):
+        '''
+        Whether get_posts_queryset(user, method) contains the post
+        '''
+        with self.lock:
+            self.sync()
+
+            row = self.positions.get(pk)
+
+            if row is None:
+                return False
+
+            if not hasattr(user, 'role'):
+                return bool(self.active[row]) and self.read[row] == PUBLIC
+
+            if user.role == 'admin':
+                return True
+
+            if not self.active[row]:
+                return False
+
+            level = self.read[row] if method in READ_METHODS else self.edit[row]
+
+            if level == TEAM:
+                return self.teams[row] == self.team_ids.get(user.team)
+
+            if level == OWNER:
+                return self.authors[row] == user.pk
+
+            return True
+
+    def denies(self, user, pk, method='GET'):
+        '''
+        Whether the post is in the index and get_posts_queryset(user, method) leaves it out. Posts the index doesn't know
+        (e.g. created by another process) aren't denied, nor is any post when the copies can't be kept in sync (is_shared())
+        '''
+        if not self.is_shared():
+            return False
+
+        with self.lock:
+            return not self.can_access(user, pk, method) and pk in self.positions
+
+    def visible_ids(self, user, method='GET'):
+        '''
+        The ids of get_posts_queryset(user, method), ascending
+        '''
+        with self.lock:
+            self.sync()
+
+            if not hasattr(user, 'role'):
+                mask = self.active_mask & self.read_masks[PUBLIC]
+            elif user.role == 'admin':
+                mask = self.present_mask
+            else:
+                levels = self.read_masks if method in READ_METHODS else self.edit_masks
+                team = self.team_masks.get(self.team_ids.get(user.team), 0)
+                author = self.author_masks.get(user.pk, 0)
+
+                mask = self.active_mask & (levels[PUBLIC] | levels[AUTHENTICATED] | (levels[TEAM] & team) | (levels[OWNER] & author))
+
+            # Restored posts are appended with their old ids
+            return sorted(self.ids[row] for row in iter_rows(mask))
+
+    def is_shared(self):
+        '''
+        Whether every process sees the generation of the index, i.e. the cache backend is shared
+        '''
+        return settings.CACHES['default']['BACKEND'] not in PER_PROCESS_CACHES
+
+    def changed(self, ids, apply):
+        '''
+        Bumps the generation, records the changed ids under it and applies the change to this process once the transaction
+        commits (a rolled back change leaves them alone). Bumping before the commit would let a load() in between pair the
+        new generation with the old rows
+        '''
+        ids = list(ids)
+
+        def on_commit():
+            with self.lock:
+                generation = bump_generation(self.scope)
+                cache.set(self.get_changes_key(generation), ids)
+
+                # Only when nothing else happened since this copy was last in sync
+                if self.generation is not None and generation == self.generation + 1:
+                    apply()
+                    self.generation = generation
+
+        transaction.on_commit(on_commit)
+
+    def patch(self, posts):
+        '''
+        Writes the posts (saved instances) to the index
+        '''
+        rows = [(post.pk, post.author_id, post.author_team, post.read_permission, post.edit_permission, post.is_active) for post in posts]
+
+        def apply():
+            for row in rows:
+                self.set_row(*row)
+
+        self.changed([row[0] for row in rows], apply)
+
+    def refresh(self, ids):
+        '''
+        Reloads the posts from the database once the transaction commits, e.g. after an update() (deleted ids are removed)
+        '''
+        ids = list(ids)
+
+        self.changed(ids, lambda: self.reload_rows(ids))
+
+    def remove(self, ids):
+        ids = list(ids)
+
+        def apply():
+            for pk in ids:
+                self.remove_row(pk)
+
+        self.changed(ids, apply)
+
+
+# The index of this process, loaded on first use (Django doesn't allow queries while the apps load)
+visibility_index = VisibilityIndex()
@@ -0,0 +1,20 @@
+# Generated by Django 5.0 on 2026-10-18 07:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('comments', '0001_initial'),
+        ('posts', '0012_posts_partial_active_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comments',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['post', 'created_at'], name='comments_post_active_idx'),
+        ),
+    ]
@@ -1,11 +1,20 @@
 # DJANGO IMPORTS
 from django.db import models
+from django.db.models import Q
 
 # MODELS
-from base.models import BaseModel
+from base.models import BaseManager, BaseModel
 
 
 class Comments(BaseModel):
     user = models.ForeignKey('user.CustomUsers', blank=True, on_delete=models.CASCADE)
     post = models.ForeignKey('posts.Posts', blank=True, on_delete=models.CASCADE)
     content = models.TextField(blank=True)
+
+    objects = BaseManager()
+
+    class Meta(BaseModel.Meta):
+        indexes = [
+            # Comments list of a post + default ordering, live rows only (soft deleted comments are never listed to bloggers)
+            models.Index(fields=['post', 'created_at'], condition=Q(is_active=True), name='comments_post_active_idx'),
+        ]
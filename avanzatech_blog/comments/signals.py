@@ -0,0 +1,15 @@
+# DJANGO IMPORTS
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# MODELS
+from .models import Comments
+
+# CACHE
+from base.cache import bump_generation
+
+
+@receiver(post_save, sender=Comments)
+@receiver(post_delete, sender=Comments)
+def invalidate_comments_caches(sender, instance, **kwargs):
+    bump_generation(f'comments:{instance.post_id}')
@@ -0,0 +1,147 @@
+# PYTHON IMPORTS
+import itertools
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+
+# DJANGO IMPORTS
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, connection
+from django.db.models import Count
+from django.test.utils import setup_databases, teardown_databases
+
+# MODELS
+from likes.models import Likes
+
+# BENCHMARKS
+from base.benchmarks import seed_users, seed_posts
+
+
+def toggle_with_get_or_create(user_id, post_id):
+    # Former PostsLikeAPIView.create: SELECT + INSERT, then a full save() to flip the like
+    like, created = Likes.objects.get_or_create(user_id=user_id, post_id=post_id)
+
+    if not created:
+        like.is_active = not like.is_active
+        like.save()
+
+
+def toggle_with_upsert(user_id, post_id):
+    Likes.objects.toggle(user_id, post_id)
+
+
+@contextmanager
+def scratch_database():
+    '''
+    Points the default connection to a new test database (created by the migrations, destroyed on exit), so the benchmark
+    never touches the project's data or schema
+    '''
+    with tempfile.TemporaryDirectory() as directory:
+        test_settings = connection.settings_dict.setdefault('TEST', {})
+        name = test_settings.get('NAME')
+
+        if connection.vendor == 'sqlite':
+            # A file: the in-memory test database of SQLite doesn't lock like the real one across the threads
+            test_settings['NAME'] = os.path.join(directory, 'benchmark.sqlite3')
+
+        old_config = setup_databases(verbosity=0, interactive=False, aliases={connection.alias})
+
+        try:
+            yield
+        finally:
+            teardown_databases(old_config, verbosity=0)
+            test_settings['NAME'] = name
+
+
+@contextmanager
+def without_unique_constraint(posts):
+    '''
+    The get_or_create() toggle ran before likes_unique_user_post existed, and its racing INSERTs duplicated likes: the
+    constraint is dropped while it runs (it would turn them into failed toggles), then the benchmark likes are deleted and it's added back.
+    Only ever used inside scratch_database()
+    '''
+    constraint = next(constraint for constraint in Likes._meta.constraints if constraint.name == 'likes_unique_user_post')
+
+    with connection.schema_editor() as editor:
+        editor.remove_constraint(Likes, constraint)
+
+    try:
+        yield
+    finally:
+        Likes.objects.filter(post__in=posts).delete()
+
+        with connection.schema_editor() as editor:
+            editor.add_constraint(Likes, constraint)
+
+
+class Command(BaseCommand):
+    help = (
+        'Toggles likes from concurrent threads and reports toggles/sec, failed toggles, lost toggles and duplicated likes of the single-statement toggle '
+        'and of the former get_or_create() + save() one (run without the unique (user, post) constraint, as it was). It runs in a scratch test database, never in the project one'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8)
+        parser.add_argument('--toggles', type=int, default=200, help='Toggles per thread')
+        parser.add_argument('--pairs', type=int, default=4, help='Distinct (user, post) pairs all threads toggle')
+
+    def handle(self, *args, **options):
+        with scratch_database():
+            users = seed_users(options['pairs'], 1)
+            posts = seed_posts(users, 1)
+            pairs = [(user.pk, posts[0].pk) for user in users]
+
+            self.stdout.write(f'{"toggle":<22} {"toggles/s":>10} {"failed":>7} {"lost":>5} {"duplicated":>11}')
+
+            for name, toggle, context in [
+                ('get_or_create + save', toggle_with_get_or_create, without_unique_constraint(posts)),
+                ('upsert', toggle_with_upsert, nullcontext()),
+            ]:
+                Likes.objects.filter(post__in=posts).delete()
+
+                with context:
+                    elapsed, failed = self.hammer(toggle, pairs, options['threads'], options['toggles'])
+                    succeeded = options['threads'] * options['toggles'] - failed
+
+                    self.stdout.write(f'{name:<22} {succeeded / elapsed:>10.0f} {failed:>7} {self.count_lost(pairs, options):>5} {self.count_duplicated(posts):>11}')
+
+    def hammer(self, toggle, pairs, threads, toggles):
+        # All threads start together, so they race on the first like of each pair too
+        barrier = threading.Barrier(threads)
+
+        def worker(offset):
+            failed = 0
+            barrier.wait()
+
+            try:
+                for user_id, post_id in itertools.islice(itertools.cycle(pairs), offset, offset + toggles):
+                    try:
+                        toggle(user_id, post_id)
+                    except (DatabaseError, Likes.MultipleObjectsReturned):
+                        # IntegrityError on a racing INSERT, "database is locked" on SQLite, get() on a duplicated like...: a 500 for the client
+                        failed += 1
+            finally:
+                connection.close()
+
+            return failed
+
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            failed = sum(executor.map(worker, range(threads)))
+
+        return time.perf_counter() - start, failed
+
+    def count_lost(self, pairs, options):
+        # Every pair is toggled the same number of times, so all of them must end up with the same is_active
+        toggles_per_pair = options['threads'] * options['toggles'] // len(pairs)
+        expected = toggles_per_pair % 2 == 1
+        final = dict(((like['user'], like['post']), like['is_active']) for like in Likes.objects.filter(post_id=pairs[0][1]).values('user', 'post', 'is_active'))
+
+        return sum(1 for pair in pairs if final.get(pair, False) != expected)
+
+    def count_duplicated(self, posts):
+        return Likes.objects.filter(post__in=posts).order_by().values('user', 'post').annotate(count=Count('id')).filter(count__gt=1).count()
@@ -0,0 +1,40 @@
+# Generated by Django 5.0 on 2026-10-18 07:22
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def delete_duplicated_likes(apps, schema_editor):
+    Likes = apps.get_model('likes', 'Likes')
+    Posts = apps.get_model('posts', 'Posts')
+
+    duplicated = Likes.objects.order_by().values('user', 'post').annotate(count=Count('id')).filter(count__gt=1)
+    posts = set()
+
+    for pair in duplicated:
+        # The last toggled like is the one that counts
+        likes = Likes.objects.filter(user=pair['user'], post=pair['post']).order_by('-updated_at', '-id')
+        Likes.objects.filter(id__in=list(likes.values_list('id', flat=True)[1:])).delete()
+        posts.add(pair['post'])
+
+    # posts/0007 backfilled likes_count with the duplicates
+    for post in posts:
+        Posts.objects.filter(pk=post).update(likes_count=Likes.objects.filter(post=post, is_active=True).count())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('likes', '0002_rename_author_likes_user'),
+        ('posts', '0007_posts_likes_count_comments_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicated_likes, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='likes',
+            constraint=models.UniqueConstraint(fields=('user', 'post'), name='likes_unique_user_post'),
+        ),
+    ]
@@ -1,10 +1,76 @@
 # DJANGO IMPORTS
-from django.db import models
+from django.db import IntegrityError, connections, models, transaction
+from django.db.models import Case, Q, Value, When
+from django.utils import timezone
 
 # MODELS
-from base.models import BaseModel
+from base.models import BaseManager, BaseModel
+
+
+class LikesManager(BaseManager):
+    def toggle(self, user_id, post_id):
+        '''
+        Creates the like (active) or flips its is_active if it already exists, and returns the resulting is_active.
+        Where the database supports RETURNING and ON CONFLICT (PostgreSQL, SQLite 3.35+) each toggle is a single UPDATE ...
+        RETURNING statement (or, for the first like, a single INSERT ... ON CONFLICT DO UPDATE one), so concurrent toggles
+        can neither race nor create duplicates
+        '''
+        connection = connections[self.db]
+        features = connection.features
+
+        # Django 5.0 runs on SQLite 3.27+, RETURNING came in 3.35
+        if not (features.can_return_columns_from_insert and features.supports_update_conflicts_with_target):
+            return self._toggle_without_upsert(user_id, post_id)
+
+        table = connection.ops.quote_name(self.model._meta.db_table)
+        now = connection.ops.adapt_datetimefield_value(timezone.now())
+
+        with connection.cursor() as cursor:
+            # Existing likes are flipped with a plain UPDATE, because a conflicting INSERT burns an id of the sequence
+            cursor.execute(
+                f'UPDATE {table} SET is_active = NOT is_active, updated_at = %s WHERE user_id = %s AND post_id = %s RETURNING is_active',
+                [now, user_id, post_id]
+            )
+            row = cursor.fetchone()
+
+            if row is None:
+                cursor.execute(
+                    f'INSERT INTO {table} (user_id, post_id, is_active, created_at, updated_at) VALUES (%s, %s, %s, %s, %s) '
+                    f'ON CONFLICT (user_id, post_id) DO UPDATE SET is_active = NOT {table}.is_active, updated_at = excluded.updated_at '
+                    f'RETURNING is_active',
+                    [user_id, post_id, True, now, now]
+                )
+                row = cursor.fetchone()
+
+        return bool(row[0])
+
+    def _toggle_without_upsert(self, user_id, post_id):
+        flipped = Case(When(is_active=True, then=Value(False)), default=Value(True))
+
+        with transaction.atomic(using=self.db):
+            if not self.filter(user_id=user_id, post_id=post_id).update(is_active=flipped, updated_at=timezone.now()):
+                try:
+                    with transaction.atomic(using=self.db):
+                        self.create(user_id=user_id, post_id=post_id)
+                        return True
+                except IntegrityError:
+                    # Created by a concurrent request in the meantime
+                    self.filter(user_id=user_id, post_id=post_id).update(is_active=flipped, updated_at=timezone.now())
+
+            return self.filter(user_id=user_id, post_id=post_id).values_list('is_active', flat=True).get()
 
 
 class Likes(BaseModel):
     user = models.ForeignKey('user.CustomUsers', blank=True, on_delete=models.CASCADE)
     post = models.ForeignKey('posts.Posts', blank=True, on_delete=models.CASCADE)
+
+    objects = LikesManager()
+
+    class Meta(BaseModel.Meta):
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'post'], name='likes_unique_user_post'),
+        ]
+        indexes = [
+            # Likes list of a post + default ordering, live rows only (unliked rows stay as tombstones, see toggle())
+            models.Index(fields=['post', 'created_at'], condition=Q(is_active=True), name='likes_post_active_idx'),
+        ]
@@ -0,0 +1,16 @@
+# DJANGO IMPORTS
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# MODELS
+from .models import Likes
+
+# CACHE
+from base.cache import bump_generation
+
+
+@receiver(post_save, sender=Likes)
+@receiver(post_delete, sender=Likes)
+def invalidate_likes_caches(sender, instance, **kwargs):
+    bump_generation(f'likes:{instance.post_id}')
+    bump_generation(f'user_likes:{instance.user_id}')
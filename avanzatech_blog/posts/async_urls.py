@@ -0,0 +1,21 @@
+# DJANGO IMPORTS
+from django.urls import path
+
+# VIEWS
+from . import async_views
+from .urls import urlpatterns as sync_urlpatterns
+
+
+# The read endpoints that have an async-native variant, by URL name
+ASYNC_VIEWS = {
+    'posts-list': async_views.AsyncPostsListAPIView,
+    'posts-retrieve': async_views.AsyncPostsRetrieveAPIView,
+    'posts-list_likes': async_views.AsyncPostsListLikesAPIView,
+    'posts-list_comments': async_views.AsyncPostsListCommentsAPIView,
+}
+
+# Same routes and names as posts/urls.py
+urlpatterns = [
+    path(str(pattern.pattern), ASYNC_VIEWS[pattern.name].as_view(), name=pattern.name) if pattern.name in ASYNC_VIEWS else pattern
+    for pattern in sync_urlpatterns
+]
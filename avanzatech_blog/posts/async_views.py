@@ -0,0 +1,34 @@
+# ASYNC VIEWS
+from base.async_views import AsyncReadAPIView
+
+# VIEWS
+from .views import PostsListAPIView, PostsRetrieveAPIView, PostsListLikesAPIView, PostsListCommentsAPIView
+
+
+class AsyncPostsListAPIView(AsyncReadAPIView):
+    '''
+    Async-native PostsListAPIView (same query params, cache and pages)
+    '''
+    view_class = PostsListAPIView
+
+
+class AsyncPostsRetrieveAPIView(AsyncReadAPIView):
+    '''
+    Async-native PostsRetrieveAPIView (same ETag validation)
+    '''
+    view_class = PostsRetrieveAPIView
+    action = 'aretrieve'
+
+
+class AsyncPostsListLikesAPIView(AsyncReadAPIView):
+    '''
+    Async-native PostsListLikesAPIView
+    '''
+    view_class = PostsListLikesAPIView
+
+
+class AsyncPostsListCommentsAPIView(AsyncReadAPIView):
+    '''
+    Async-native PostsListCommentsAPIView
+    '''
+    view_class = PostsListCommentsAPIView
@@ -0,0 +1,136 @@
+# DJANGO IMPORTS
+from django.conf import settings
+from django.db import transaction
+
+# MODELS
+from user.models import CustomUsers
+from .models import Posts, FeedEntries
+
+# QUERY SET
+from base.query_set import annotate_posts, get_posts_queryset
+
+
+ALL_AUDIENCE = 'all'
+
+# Columns fan_out() reads from the posts
+FAN_OUT_FIELDS = ('id', 'author', 'read_permission', 'author_team', 'is_active', 'created_at')
+
+
+def user_audience(user_id):
+    return f'user:{user_id}'
+
+
+def team_audience(team):
+    return f'team:{team}'
+
+
+def get_feed_audiences(user):
+    '''
+    Every audience whose feed entries the user reads: his/her own ones, plus the hybrid mode ones of his/her team and of
+    everybody, but only if there are any (a single audience is a single range of the audience index, no sorting needed)
+    '''
+    groups = [team_audience(user.team), ALL_AUDIENCE]
+
+    return [user_audience(user.pk)] + [audience for audience in groups if FeedEntries.objects.filter(audience=audience).exists()]
+
+
+def get_post_audiences(post):
+    '''
+    Returns the audiences the post is fanned out to. Bloggers who can read it get one entry each, unless they are more than
+    settings.FEED_FANOUT_LIMIT: then (hybrid mode) the post gets a single team/all entry, read by all of them. Admins read
+    the posts table directly, so they never get entries
+    '''
+    readers = CustomUsers.objects.exclude(role='admin')
+
+    if post.read_permission == 'owner':
+        return [user_audience(pk) for pk in readers.filter(pk=post.author_id).values_list('pk', flat=True)]
+
+    if post.read_permission == 'team':
+        readers = readers.filter(team=post.author_team)
+        group = team_audience(post.author_team)
+    else:
+        group = ALL_AUDIENCE
+
+    limit = settings.FEED_FANOUT_LIMIT
+    readers = list(readers.values_list('pk', flat=True)[:limit + 1])
+
+    if len(readers) > limit:
+        return [group]
+
+    return [user_audience(pk) for pk in readers]
+
+
+def fan_out(posts):
+    '''
+    (Re)writes the feed entries of the posts: deleted posts lose them, active ones get one per audience
+    '''
+    posts = list(posts)
+    entries = []
+    # Posts with the same readers (e.g. the public ones) share the query that finds them
+    audiences = {}
+
+    for post in posts:
+        if not post.is_active:
+            continue
+
+        key = (post.read_permission, post.author_team, post.author_id if post.read_permission == 'owner' else None)
+
+        if key not in audiences:
+            audiences[key] = get_post_audiences(post)
+
+        entries.extend(FeedEntries(audience=audience, post=post, created_at=post.created_at) for audience in audiences[key])
+
+    with transaction.atomic():
+        FeedEntries.objects.filter(post__in=[post.pk for post in posts]).delete()
+        FeedEntries.objects.bulk_create(entries, batch_size=1000)
+
+    return len(entries)
+
+
+def clear_feed(posts):
+    '''
+    Deletes the feed entries of the posts (a queryset, in one statement), e.g. before they are soft deleted in bulk
+    '''
+    return FeedEntries.objects.filter(post__in=posts.values('id')).delete()[0]
+
+
+def rebuild_feed(user, batch_size=1000):
+    '''
+    (Re)writes the personal entries of the user (new users, team or role changes), skipping the posts that already reach
+    him/her through a hybrid mode team/all entry
+    '''
+    audience = user_audience(user.pk)
+
+    with transaction.atomic():
+        FeedEntries.objects.filter(audience=audience).delete()
+
+        if user.role == 'admin':
+            return 0
+
+        posts = (
+            get_posts_queryset(user, 'GET')
+            .exclude(feed_entries__audience__in=[team_audience(user.team), ALL_AUDIENCE])
+            .values_list('id', 'created_at')
+        )
+        entries = [FeedEntries(audience=audience, post_id=pk, created_at=created_at) for pk, created_at in posts]
+
+        return len(FeedEntries.objects.bulk_create(entries, batch_size=batch_size))
+
+
+def get_feed_queryset(user):
+    '''
+    The user's timeline, newest first. For bloggers it's read from the feed entries instead of evaluating the visibility
+    filter over the whole posts table: one range of the audience index, or a sort of a few of them in hybrid mode
+    '''
+    if user.role == 'admin':
+        return Posts.objects.order_by('-created_at', '-id')
+
+    return Posts.objects.filter(feed_entries__audience__in=get_feed_audiences(user)).order_by('-feed_entries__created_at', '-feed_entries__post_id')
+
+
+class BaseFeedQuerySet():
+    def get_queryset(self, *args, **kwargs):
+        return get_feed_queryset(self.request.user)
+
+    def annotate_fields(self, queryset, fields):
+        return annotate_posts(queryset, self.request.user, fields)
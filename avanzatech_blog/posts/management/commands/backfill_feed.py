@@ -0,0 +1,31 @@
+# DJANGO IMPORTS
+from django.core.management.base import BaseCommand
+
+# MODELS
+from posts.models import Posts
+
+# FEED
+from posts.feed import FAN_OUT_FIELDS, fan_out
+
+
+class Command(BaseCommand):
+    help = 'Rewrites the feed entries of every post in batches (run it once after deploying the feed, it is safe to run again)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        last_id = 0
+        posts_count = entries_count = 0
+
+        while True:
+            posts = list(Posts.objects.filter(id__gt=last_id).order_by('id').only(*FAN_OUT_FIELDS)[:options['batch_size']])
+
+            if not posts:
+                break
+
+            entries_count += fan_out(posts)
+            posts_count += len(posts)
+            last_id = posts[-1].id
+
+        self.stdout.write(self.style.SUCCESS(f'{posts_count} posts fanned out, {entries_count} feed entries written'))
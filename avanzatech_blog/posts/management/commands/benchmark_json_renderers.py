@@ -0,0 +1,70 @@
+# PYTHON IMPORTS
+import io
+
+# DJANGO IMPORTS
+from django.core.management.base import BaseCommand
+
+# DJANGO REST FRAMEWORK IMPORTS
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+# MODELS
+from posts.models import Posts
+from likes.models import Likes
+from comments.models import Comments
+
+# SERIALIZERS
+from posts.serializers import PostsListModelSerializer
+from likes.serializers import ListLikesModelSerializer
+from comments.serializers import ListCommentsModelSerializer
+
+# RENDERERS / PARSERS
+from base.renderers import FastJSONRenderer
+from base.parsers import FastJSONParser
+
+# BENCHMARKS
+from base.benchmarks import rollback, measure, seed_users, seed_posts, seed_likes, seed_comments
+
+
+class Command(BaseCommand):
+    help = 'Compares serialize, render and parse times of DRF JSONRenderer/JSONParser and FastJSONRenderer/FastJSONParser on full pages of the posts, likes and comments lists (synthetic data, always rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--page-size', type=int, default=1000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        page_size = options['page_size']
+
+        with rollback():
+            users = seed_users(page_size, 10)
+            posts = seed_posts(users, page_size)
+            seed_likes(users, posts, page_size)
+            seed_comments(users, posts[:1], page_size)
+
+            post_id = posts[0].pk
+            # Querysets and serializers of the list endpoints
+            endpoints = [
+                ('posts list', PostsListModelSerializer, Posts.objects.all()),
+                ('likes list', ListLikesModelSerializer, Likes.objects.filter(post_id=post_id)),
+                ('comments list', ListCommentsModelSerializer, Comments.objects.filter(post_id=post_id)),
+            ]
+
+            self.stdout.write(f'{"endpoint":<14} {"items":>6} {"serialize":>12} {"render":>10} {"fast render":>12} {"parse":>10} {"fast parse":>11} {"size":>10}')
+
+            for name, serializer_class, queryset in endpoints:
+                def serialize():
+                    return {'results': serializer_class(queryset[:page_size], many=True).data}
+
+                data = serialize()
+                content = JSONRenderer().render(data)
+
+                self.stdout.write(' '.join([
+                    f'{name:<14} {len(data["results"]):>6}',
+                    f'{measure(serialize, options["repeat"]):>9.2f} ms',
+                    f'{measure(lambda: JSONRenderer().render(data), options["repeat"]):>7.2f} ms',
+                    f'{measure(lambda: FastJSONRenderer().render(data), options["repeat"]):>9.2f} ms',
+                    f'{measure(lambda: JSONParser().parse(io.BytesIO(content)), options["repeat"]):>7.2f} ms',
+                    f'{measure(lambda: FastJSONParser().parse(io.BytesIO(content)), options["repeat"]):>8.2f} ms',
+                    f'{len(content) / 1024:>7.0f} KB',
+                ]))
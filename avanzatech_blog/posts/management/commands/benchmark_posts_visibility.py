@@ -0,0 +1,83 @@
+# DJANGO IMPORTS
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+# MODELS
+from user.models import CustomUsers
+from posts.models import Posts
+
+# QUERY SET
+from base.query_set import get_posts_queryset
+
+# BENCHMARKS
+from base.benchmarks import rollback, measure, seed_users, seed_posts
+
+
+class Command(BaseCommand):
+    help = 'Compares query plans and latency of the posts visibility filter with and without the posts indexes (synthetic data, always rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--posts', type=int, default=100000)
+        parser.add_argument('--users', type=int, default=200)
+        parser.add_argument('--teams', type=int, default=10)
+        parser.add_argument('--page-size', type=int, default=10)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        with rollback():
+            authors = seed_users(options['users'], options['teams'])
+            seed_posts(authors, options['posts'])
+
+            # Planner statistics, as a production database would have them
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE')
+
+            blogger = CustomUsers.objects.get(pk=authors[0].pk)
+            viewers = [
+                ('anonymous', AnonymousUser(), 'GET'),
+                ('blogger (read)', blogger, 'GET'),
+                ('blogger (edit)', blogger, 'PATCH'),
+                ('admin', CustomUsers(role='admin'), 'GET'),
+            ]
+
+            with_indexes = self.run(viewers, options, 'with indexes')
+
+            with connection.cursor() as cursor:
+                for index in Posts._meta.indexes:
+                    cursor.execute(f'DROP INDEX {connection.ops.quote_name(index.name)}')
+
+            without_indexes = self.run(viewers, options, 'without indexes')
+
+        self.stdout.write('')
+        self.stdout.write(f'{"viewer":<16} {"page (no idx)":>14} {"page (idx)":>11} {"count (no idx)":>15} {"count (idx)":>12}')
+
+        for name, _, _ in viewers:
+            before, after = without_indexes[name], with_indexes[name]
+            self.stdout.write(f'{name:<16} {before["page"]:>11.2f} ms {after["page"]:>8.2f} ms {before["count"]:>12.2f} ms {after["count"]:>9.2f} ms')
+
+    def run(self, viewers, options, label):
+        results = {}
+
+        for name, user, method in viewers:
+            queryset = get_posts_queryset(user, method)
+            page = queryset[:options['page_size']]
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f'{name} ({label})'))
+            self.stdout.write(self.explain(page, label))
+
+            results[name] = {
+                'page': measure(lambda: list(page.all()), options['repeat']),
+                'count': measure(queryset.count, options['repeat']),
+            }
+
+        return results
+
+    def explain(self, queryset, label):
+        sql, params = queryset.query.sql_with_params()
+
+        # The label keeps the statement text unique, otherwise the connection's statement cache
+        # replays the plan that was prepared before the indexes were dropped
+        with connection.cursor() as cursor:
+            cursor.execute(f'{connection.ops.explain_query_prefix()} {sql} /* {label} */', params)
+            return '\n'.join(' '.join(str(column) for column in row) for row in cursor.fetchall())
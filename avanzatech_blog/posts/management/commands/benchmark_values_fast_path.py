@@ -0,0 +1,53 @@
+# DJANGO IMPORTS
+from django.core.management.base import BaseCommand
+
+# MODELS
+from posts.models import Posts
+from likes.models import Likes
+from comments.models import Comments
+
+# SERIALIZERS
+from base.serializers import get_values_fields, serialize_values
+from posts.serializers import PostsListModelSerializer
+from likes.serializers import ListLikesModelSerializer
+from comments.serializers import ListCommentsModelSerializer
+
+# BENCHMARKS
+from base.benchmarks import rollback, measure, seed_users, seed_posts, seed_likes, seed_comments
+
+
+class Command(BaseCommand):
+    help = 'Compares rows/s of the list serializers and of the values() fast path (ValuesListMixin) on full pages of the posts, likes and comments lists (synthetic data, always rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--page-size', type=int, default=1000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        page_size = options['page_size']
+
+        with rollback():
+            users = seed_users(page_size, 10)
+            posts = seed_posts(users, page_size)
+            seed_likes(users, posts, page_size)
+            seed_comments(users, posts[:1], page_size)
+
+            post_id = posts[0].pk
+            endpoints = [
+                ('posts list', PostsListModelSerializer, Posts.objects.all()),
+                ('likes list', ListLikesModelSerializer, Likes.objects.filter(post_id=post_id)),
+                ('comments list', ListCommentsModelSerializer, Comments.objects.filter(post_id=post_id)),
+            ]
+
+            self.stdout.write(f'{"endpoint":<14} {"items":>6} {"serializer":>14} {"values()":>14} {"speedup":>8}')
+
+            for name, serializer_class, queryset in endpoints:
+                fields = get_values_fields(serializer_class())
+                page = queryset[:page_size]
+                rows = len(page)
+
+                # Both include the query, like a list request does
+                serializer = measure(lambda: serializer_class(page.all(), many=True).data, options['repeat'])
+                values = measure(lambda: serialize_values(page.values(*fields.values()), fields), options['repeat'])
+
+                self.stdout.write(f'{name:<14} {rows:>6} {rows / serializer * 1000:>8.0f} row/s {rows / values * 1000:>8.0f} row/s {serializer / values:>7.1f}x')
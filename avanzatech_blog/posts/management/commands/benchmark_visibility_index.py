@@ -0,0 +1,63 @@
+# PYTHON IMPORTS
+import random
+
+# DJANGO IMPORTS
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+
+# MODELS
+from user.models import CustomUsers
+
+# QUERY SET
+from base.query_set import get_posts_queryset
+
+# VISIBILITY
+from base.visibility import visibility_index
+
+# BENCHMARKS
+from base.benchmarks import rollback, measure, seed_users, seed_posts
+
+
+class Command(BaseCommand):
+    help = 'Compares the visibility checks of the views (can the user access a post, which posts can the user see) in SQL and in the in-memory visibility index (synthetic data, always rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--posts', type=int, default=100000)
+        parser.add_argument('--users', type=int, default=200)
+        parser.add_argument('--teams', type=int, default=10)
+        parser.add_argument('--checks', type=int, default=1000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        with rollback():
+            authors = seed_users(options['users'], options['teams'])
+            posts = seed_posts(authors, options['posts'])
+
+            load = measure(visibility_index.load, 1)
+            self.stdout.write(f'index loaded in {load:.2f} ms ({options["posts"]} posts)')
+
+            generator = random.Random(0)
+            ids = [generator.choice(posts).pk for _ in range(options['checks'])]
+            viewers = [
+                ('anonymous', AnonymousUser()),
+                ('blogger', CustomUsers.objects.get(pk=authors[0].pk)),
+                ('admin', CustomUsers(role='admin')),
+            ]
+
+            self.stdout.write('')
+            self.stdout.write(f'{"viewer":<10} {"access (SQL)":>13} {"access (idx)":>13} {"ids (SQL)":>11} {"ids (idx)":>11}')
+
+            for name, user in viewers:
+                queryset = get_posts_queryset(user, 'GET')
+                ids_queryset = queryset.order_by('id').values_list('id', flat=True)
+
+                # Per check, like a get_object() of the likes/comments views
+                access_sql = measure(lambda: [queryset.filter(pk=pk).exists() for pk in ids], options['repeat']) / len(ids)
+                access_index = measure(lambda: [visibility_index.can_access(user, pk) for pk in ids], options['repeat']) / len(ids)
+                ids_sql = measure(lambda: list(ids_queryset.all()), options['repeat'])
+                ids_index = measure(lambda: visibility_index.visible_ids(user), options['repeat'])
+
+                self.stdout.write(f'{name:<10} {access_sql:>10.4f} ms {access_index:>10.4f} ms {ids_sql:>8.2f} ms {ids_index:>8.2f} ms')
+
+        # The index holds rows that were rolled back
+        visibility_index.generation = None
@@ -0,0 +1,47 @@
+# PYTHON IMPORTS
+from collections import defaultdict
+from datetime import timedelta
+
+# DJANGO IMPORTS
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+# MODELS
+from posts.models import TrendingScores
+from likes.models import Likes
+from comments.models import Comments
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the trending scores of the posts from their recent likes and comments (schedule it, e.g. every 10 minutes with cron)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--window-days', type=float, default=settings.TRENDING_WINDOW_DAYS)
+        parser.add_argument('--half-life-hours', type=float, default=settings.TRENDING_HALF_LIFE_HOURS)
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        since = now - timedelta(days=options['window_days'])
+        half_life = options['half_life_hours'] * 3600
+        scores = defaultdict(float)
+
+        # Only (post_id, timestamp) tuples are read, in one pass per table. A like's updated_at is the moment it was (re)activated
+        engagements = [
+            (Likes.objects.filter(is_active=True, post__is_active=True, updated_at__gte=since).values_list('post_id', 'updated_at'), settings.TRENDING_LIKE_WEIGHT),
+            (Comments.objects.filter(is_active=True, post__is_active=True, created_at__gte=since).values_list('post_id', 'created_at'), settings.TRENDING_COMMENT_WEIGHT),
+        ]
+
+        for rows, weight in engagements:
+            for post_id, moment in rows.iterator(chunk_size=options['batch_size']):
+                scores[post_id] += weight * 0.5 ** ((now - moment).total_seconds() / half_life)
+
+        with transaction.atomic():
+            TrendingScores.objects.all().delete()
+            TrendingScores.objects.bulk_create([
+                TrendingScores(post_id=post_id, score=score, computed_at=now) for post_id, score in scores.items()
+            ], batch_size=options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(f'{len(scores)} trending posts scored'))
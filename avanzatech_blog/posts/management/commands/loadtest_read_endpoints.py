@@ -0,0 +1,110 @@
+# PYTHON IMPORTS
+import asyncio
+import statistics
+import time
+from urllib.parse import urlsplit
+
+# DJANGO IMPORTS
+from django.core.management.base import BaseCommand, CommandError
+
+
+PATHS = ['/api/posts/', '/api/posts/{post}/', '/api/posts/list_likes/{post}/', '/api/posts/list_comments/{post}/']
+
+
+class Command(BaseCommand):
+    help = (
+        'Load-tests the posts read endpoints of running servers (e.g. wsgi=http://127.0.0.1:8000 served by gunicorn and '
+        'asgi=http://127.0.0.1:8001 served by uvicorn) and compares their throughput and latency percentiles at each concurrency'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('targets', nargs='+', help='name=base URL of each server, e.g. wsgi=http://127.0.0.1:8000')
+        parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 10, 50])
+        parser.add_argument('--requests', type=int, default=500, help='Requests per endpoint and concurrency level')
+        parser.add_argument('--post', type=int, default=1, help='Post of the retrieve, list_likes and list_comments endpoints')
+        parser.add_argument('--paths', nargs='+', default=PATHS)
+        parser.add_argument('--session', help='Session cookie (sessionid) to load-test as an authenticated user')
+        parser.add_argument('--timeout', type=float, default=30)
+
+    def handle(self, *args, **options):
+        targets = []
+
+        for target in options['targets']:
+            name, _, url = target.partition('=')
+            parts = urlsplit(url)
+
+            if not name or parts.scheme != 'http' or not parts.hostname:
+                raise CommandError(f'Invalid target {target!r}, expected name=http://host:port')
+
+            targets.append((name, parts.hostname, parts.port or 80))
+
+        self.stdout.write(f'{"target":<8} {"endpoint":<32} {"conc.":>5} {"req/s":>8} {"p50":>9} {"p95":>9} {"p99":>9} {"errors":>6}')
+
+        for path in options['paths']:
+            path = path.format(post=options['post'])
+
+            for concurrency in options['concurrency']:
+                for name, host, port in targets:
+                    elapsed, timings, errors = asyncio.run(self.run(host, port, path, concurrency, options))
+                    p50, p95, p99 = self.percentiles(timings)
+
+                    self.stdout.write(
+                        f'{name:<8} {path:<32} {concurrency:>5} {len(timings) / elapsed:>8.1f} '
+                        f'{p50:>6.1f} ms {p95:>6.1f} ms {p99:>6.1f} ms {errors:>6}'
+                    )
+
+    async def run(self, host, port, path, concurrency, options):
+        request = (
+            f'GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\nAccept: application/json\r\nConnection: close\r\n'
+            + (f'Cookie: sessionid={options["session"]}\r\n' if options['session'] else '')
+            + '\r\n'
+        ).encode()
+
+        remaining = options['requests']
+        timings = []
+        errors = 0
+
+        async def worker():
+            nonlocal remaining, errors
+
+            while remaining > 0:
+                remaining -= 1
+                start = time.perf_counter()
+
+                try:
+                    status = await asyncio.wait_for(self.fetch(host, port, request), options['timeout'])
+                except (OSError, asyncio.TimeoutError):
+                    status = None
+
+                if status == 200:
+                    timings.append((time.perf_counter() - start) * 1000)
+                else:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+        return time.perf_counter() - start, timings, errors
+
+    async def fetch(self, host, port, request):
+        # A plain HTTP/1.1 client (no dependency): one connection per request, the body is read until the server closes it
+        reader, writer = await asyncio.open_connection(host, port)
+
+        try:
+            writer.write(request)
+            await writer.drain()
+
+            status_line = await reader.readline()
+            await reader.read()
+        finally:
+            writer.close()
+
+        return int(status_line.split()[1]) if status_line.startswith(b'HTTP/') else None
+
+    def percentiles(self, timings):
+        if len(timings) < 2:
+            return (timings[0],) * 3 if timings else (0.0,) * 3
+
+        quantiles = statistics.quantiles(timings, n=100)
+
+        return quantiles[49], quantiles[94], quantiles[98]
@@ -0,0 +1,47 @@
+# DJANGO IMPORTS
+from django.core.management.base import BaseCommand
+from django.db.models import F, OuterRef, Q
+
+# MODELS
+from posts.models import Posts
+from likes.models import Likes
+from comments.models import Comments
+
+# QUERY SET
+from base.query_set import count_rows
+
+# CACHE
+from base.cache import bump_generation
+
+
+class Command(BaseCommand):
+    help = 'Recomputes likes_count and comments_count of the posts in batches and fixes the ones that drifted'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        last_id = 0
+        checked = fixed = 0
+
+        while True:
+            ids = list(Posts.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:options['batch_size']])
+
+            if not ids:
+                break
+
+            # Counted and written in the same UPDATE, so the likes/comments (and add_to_counter calls) that commit while the
+            # command runs are never overwritten with an older count. Only the posts that drifted are written
+            likes = count_rows(Likes.objects.filter(Q(post=OuterRef('pk')) & Q(is_active=True)))
+            comments = count_rows(Comments.objects.filter(Q(post=OuterRef('pk')) & Q(is_active=True)))
+
+            drifted = Posts.objects.filter(id__in=ids).alias(active_likes=likes, active_comments=comments).filter(~Q(likes_count=F('active_likes')) | ~Q(comments_count=F('active_comments')))
+
+            fixed += drifted.update(likes_count=likes, comments_count=comments)
+            checked += len(ids)
+            last_id = ids[-1]
+
+        if fixed:
+            bump_generation('posts')
+
+        self.stdout.write(self.style.SUCCESS(f'{checked} posts checked, {fixed} fixed'))
@@ -0,0 +1,31 @@
+# Generated by Django 5.0 on 2026-10-18 07:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0004_alter_posts_title'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='posts',
+            index=models.Index(fields=['read_permission', 'created_at', 'is_active'], name='posts_read_created_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='posts',
+            index=models.Index(fields=['edit_permission', 'created_at', 'is_active'], name='posts_edit_created_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='posts',
+            index=models.Index(fields=['author', 'created_at'], name='posts_author_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='posts',
+            index=models.Index(fields=['created_at'], name='posts_created_idx'),
+        ),
+    ]
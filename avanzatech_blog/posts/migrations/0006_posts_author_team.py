@@ -0,0 +1,37 @@
+# Generated by Django 5.0 on 2026-10-18 07:14
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def stamp_author_team(apps, schema_editor):
+    Posts = apps.get_model('posts', 'Posts')
+    CustomUsers = apps.get_model('user', 'CustomUsers')
+
+    Posts.objects.update(author_team=Subquery(CustomUsers.objects.filter(pk=OuterRef('author_id')).values('team')[:1]))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0005_posts_visibility_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='posts',
+            name='author_team',
+            field=models.CharField(blank=True, max_length=30),
+        ),
+        migrations.RunPython(stamp_author_team, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='posts',
+            index=models.Index(fields=['read_permission', 'author_team', 'created_at', 'is_active'], name='posts_read_team_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='posts',
+            index=models.Index(fields=['edit_permission', 'author_team', 'created_at', 'is_active'], name='posts_edit_team_created_idx'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.0 on 2026-10-18 07:20
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_likes_and_comments(apps, schema_editor):
+    Posts = apps.get_model('posts', 'Posts')
+    Likes = apps.get_model('likes', 'Likes')
+    Comments = apps.get_model('comments', 'Comments')
+
+    def active_count(model):
+        rows = model.objects.filter(post=OuterRef('pk'), is_active=True).order_by().values('post').annotate(count=Count('pk')).values('count')
+        return Coalesce(Subquery(rows), 0)
+
+    Posts.objects.update(likes_count=active_count(Likes), comments_count=active_count(Comments))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0006_posts_author_team'),
+        ('likes', '0002_rename_author_likes_user'),
+        ('comments', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='posts',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='posts',
+            name='likes_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(count_likes_and_comments, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.0 on 2026-10-18 09:10
+
+from django.db import migrations
+
+
+# External content FTS5 table over posts_posts (it stores only the index, the text stays in posts_posts).
+# Only active posts are indexed, and the triggers keep it in sync with every INSERT/UPDATE/DELETE,
+# including queryset.update() and raw SQL that bypass Posts.save()
+CREATE_SEARCH_INDEX = [
+    '''
+    CREATE VIRTUAL TABLE posts_posts_search USING fts5(
+        title, content, content='posts_posts', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    )
+    ''',
+    '''
+    CREATE TRIGGER posts_posts_search_insert AFTER INSERT ON posts_posts WHEN new.is_active BEGIN
+        INSERT INTO posts_posts_search (rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    ''',
+    # Only the indexed columns, so counters and permissions updates don't touch the index
+    '''
+    CREATE TRIGGER posts_posts_search_update AFTER UPDATE OF title, content, is_active ON posts_posts BEGIN
+        INSERT INTO posts_posts_search (posts_posts_search, rowid, title, content)
+            SELECT 'delete', old.id, old.title, old.content WHERE old.is_active;
+        INSERT INTO posts_posts_search (rowid, title, content)
+            SELECT new.id, new.title, new.content WHERE new.is_active;
+    END
+    ''',
+    '''
+    CREATE TRIGGER posts_posts_search_delete AFTER DELETE ON posts_posts WHEN old.is_active BEGIN
+        INSERT INTO posts_posts_search (posts_posts_search, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+    END
+    ''',
+    'INSERT INTO posts_posts_search (rowid, title, content) SELECT id, title, content FROM posts_posts WHERE is_active',
+]
+
+DROP_SEARCH_INDEX = [
+    'DROP TRIGGER IF EXISTS posts_posts_search_insert',
+    'DROP TRIGGER IF EXISTS posts_posts_search_update',
+    'DROP TRIGGER IF EXISTS posts_posts_search_delete',
+    'DROP TABLE IF EXISTS posts_posts_search',
+]
+
+
+def run(statements):
+    def operation(apps, schema_editor):
+        # Other databases fall back to icontains (see PostsManager.search)
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0007_posts_likes_count_comments_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(run(CREATE_SEARCH_INDEX), run(DROP_SEARCH_INDEX)),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.0 on 2026-10-18 07:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0009_posts_team_created_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeedEntries',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('audience', models.CharField(max_length=40)),
+                ('created_at', models.DateTimeField()),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='feed_entries', to='posts.posts')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['audience', 'created_at', 'post'], name='feed_audience_created_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='feedentries',
+            constraint=models.UniqueConstraint(fields=('audience', 'post'), name='feed_unique_audience_post'),
+        ),
+    ]
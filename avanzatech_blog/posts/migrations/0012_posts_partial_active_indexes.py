@@ -0,0 +1,53 @@
+# Generated by Django 5.0 on 2026-10-18 07:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('posts', '0011_trendingscores'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='posts',
+            name='posts_read_created_active_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='posts',
+            name='posts_edit_created_active_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='posts',
+            name='posts_read_team_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='posts',
+            name='posts_edit_team_created_idx',
+        ),
+        # Created before the partial indexes of the same columns: without planner statistics SQLite picks the index
+        # created last among equivalent ones, and the bloggers' queries should read the (smaller) partial one
+        migrations.AddIndex(
+            model_name='posts',
+            index=models.Index(fields=['read_permission', 'created_at'], name='posts_read_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='posts',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['read_permission', 'created_at'], name='posts_read_created_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='posts',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['edit_permission', 'created_at'], name='posts_edit_created_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='posts',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['read_permission', 'author_team', 'created_at'], name='posts_read_team_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='posts',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['edit_permission', 'author_team', 'created_at'], name='posts_edit_team_created_idx'),
+        ),
+    ]
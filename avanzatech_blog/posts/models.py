@@ -1,8 +1,75 @@
 # DJANGO IMPORTS
-from django.db import models
+from django.conf import settings
+from django.db import connection, models
+from django.db.models import F, Q
+from django.db.models.functions import Greatest
 
 # MODELS
-from base.models import BaseModel
+from base.models import BaseManager, BaseModel
+
+# CACHE
+from base.cache import bump_generation
+
+
+class PostsManager(BaseManager):
+    def restamp_author_team(self, author, team, batch_size=1000):
+        '''
+        Copies the author's new team to all of his/her posts in short batches, so big authors don't lock the table for long
+        '''
+        restamped = 0
+
+        while True:
+            batch = list(self.filter(author=author).exclude(author_team=team).values_list('id', flat=True)[:batch_size])
+
+            if not batch:
+                if restamped:
+                    bump_generation('posts')
+
+                return restamped
+
+            restamped += self.filter(id__in=batch).update(author_team=team)
+
+    def add_to_counter(self, post_id, counter, delta):
+        '''
+        Atomically adds delta to likes_count/comments_count in the database (no read-modify-write race).
+
+        It doesn't bump the posts generation: flushing every cached list page of every viewer on each like/comment would
+        leave the list cache nearly empty on a busy blog. The counters of cached list pages lag for up to POSTS_LIST_CACHE_TIMEOUT
+        seconds instead (the retrieve endpoint reads them live)
+        '''
+        return self.filter(pk=post_id).update(**{counter: Greatest(F(counter) + delta, 0)})
+
+    def search(self, query, queryset=None, limit=None):
+        '''
+        Returns the ids of the active posts that match all the words of the query, best matches first (bm25, title matches weigh more).
+        Only the posts of queryset (e.g. the ones the viewer can read) are ranked, so the limit applies to them
+        '''
+        limit = limit or settings.POSTS_SEARCH_MAX_RESULTS
+        queryset = (self.all() if queryset is None else queryset).filter(is_active=True).order_by()
+        words = query.split()
+
+        if not words:
+            return []
+
+        if connection.vendor != 'sqlite':
+            match = Q()
+
+            for word in words:
+                match &= Q(title__icontains=word) | Q(content__icontains=word)
+
+            return list(queryset.filter(match).order_by('-created_at').values_list('id', flat=True)[:limit])
+
+        # Every word is quoted, so user input is never parsed as FTS5 query syntax (AND, NEAR, column filters...)
+        match = ' '.join('"{}"'.format(word.replace('"', '""')) for word in words)
+        posts_sql, posts_params = queryset.values('id').query.sql_with_params()
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT rowid FROM posts_posts_search WHERE posts_posts_search MATCH %s AND rowid IN ({posts_sql}) '
+                'ORDER BY bm25(posts_posts_search, %s, 1.0) LIMIT %s',
+                [match, *posts_params, settings.POSTS_SEARCH_TITLE_WEIGHT, limit]
+            )
+            return [row[0] for row in cursor.fetchall()]
 
 
 class Posts(BaseModel):
@@ -18,3 +85,70 @@ class Posts(BaseModel):
     content = models.TextField(blank=True)
     read_permission = models.CharField(max_length=13, choices=PERMISSIONS, default='owner')
     edit_permission = models.CharField(max_length=13, choices=PERMISSIONS, default='owner')
+    # Denormalized copy of author.team, so the team branch of the visibility filter doesn't need a JOIN
+    author_team = models.CharField(max_length=30, blank=True)
+    # Denormalized number of active likes/comments, kept by PostsManager.add_to_counter (see reconcile_post_counters)
+    likes_count = models.PositiveIntegerField(default=0)
+    comments_count = models.PositiveIntegerField(default=0)
+
+    objects = PostsManager()
+
+    class Meta(BaseModel.Meta):
+        indexes = [
+            # Visibility filter of BasePostsQuerySet (GET/POST) + default ordering. Partial (live rows only), since every
+            # non-admin read filters is_active: soft deleted posts don't grow (nor get scanned from) these indexes
+            models.Index(fields=['read_permission', 'created_at'], condition=Q(is_active=True), name='posts_read_created_active_idx'),
+            # Visibility filter of BasePostsQuerySet (PUT/PATCH/DELETE) + default ordering
+            models.Index(fields=['edit_permission', 'created_at'], condition=Q(is_active=True), name='posts_edit_created_active_idx'),
+            # Team branch of the visibility filter (GET/POST)
+            models.Index(fields=['read_permission', 'author_team', 'created_at'], condition=Q(is_active=True), name='posts_read_team_created_idx'),
+            # Team branch of the visibility filter (PUT/PATCH/DELETE)
+            models.Index(fields=['edit_permission', 'author_team', 'created_at'], condition=Q(is_active=True), name='posts_edit_team_created_idx'),
+            # Owner branch of the visibility filter + default ordering
+            models.Index(fields=['author', 'created_at'], name='posts_author_created_idx'),
+            # Default ordering for admins (no visibility filter)
+            models.Index(fields=['created_at'], name='posts_created_idx'),
+            # Team filter of the posts list for admins (no visibility filter)
+            models.Index(fields=['author_team', 'created_at'], name='posts_team_created_idx'),
+            # Read permission filter of the posts list for admins (no visibility filter, so the partial indexes don't apply)
+            models.Index(fields=['read_permission', 'created_at'], name='posts_read_created_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        if self._state.adding and not self.author_team:
+            self.author_team = self.author.team
+
+        super().save(*args, **kwargs)
+
+
+class FeedEntries(models.Model):
+    '''
+    One row per (audience, post) of the fan-out-on-write timeline (see posts/feed.py). The audience is a user (user:<pk>),
+    or in hybrid mode a whole team (team:<name>) or every blogger (all)
+    '''
+    audience = models.CharField(max_length=40)
+    post = models.ForeignKey(Posts, on_delete=models.CASCADE, related_name='feed_entries')
+    # Copy of post.created_at, so a feed page is a range scan of the audience index
+    created_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['audience', 'post'], name='feed_unique_audience_post'),
+        ]
+        indexes = [
+            models.Index(fields=['audience', 'created_at', 'post'], name='feed_audience_created_idx'),
+        ]
+
+
+class TrendingScores(models.Model):
+    '''
+    Time-decayed engagement score of the posts with recent likes/comments, precomputed by the compute_trending command
+    '''
+    post = models.OneToOneField(Posts, primary_key=True, on_delete=models.CASCADE, related_name='trending')
+    score = models.FloatField()
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-score'], name='trending_score_idx'),
+        ]
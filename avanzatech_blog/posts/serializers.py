@@ -4,8 +4,15 @@ from rest_framework import serializers
 # MODELS
 from .models import Posts
 
+# SERIALIZERS
+from base.serializers import DynamicFieldsModelSerializer
 
-class PostsListModelSerializer(serializers.ModelSerializer):
+
+class PostsListModelSerializer(DynamicFieldsModelSerializer):
+    # Annotated by the views, only when requested (see SparseFieldsMixin and annotate_posts)
+    liked_by_me = serializers.BooleanField(read_only=True)
+    like_count = serializers.IntegerField(read_only=True)
+    comment_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Posts
@@ -15,19 +22,34 @@ class PostsListModelSerializer(serializers.ModelSerializer):
             'title',
             'content',
             'read_permission',
-            'edit_permission'
+            'edit_permission',
+            'likes_count',
+            'comments_count',
+            'liked_by_me',
+            'like_count',
+            'comment_count'
         )
+        optional_fields = ('liked_by_me', 'like_count', 'comment_count')
 
 
-class PostsRetrieveModelSerializer(serializers.ModelSerializer):
+class PostsRetrieveModelSerializer(DynamicFieldsModelSerializer):
+    liked_by_me = serializers.BooleanField(read_only=True)
+    like_count = serializers.IntegerField(read_only=True)
+    comment_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Posts
         fields = (
             'author',
             'title',
-            'content'
+            'content',
+            'likes_count',
+            'comments_count',
+            'liked_by_me',
+            'like_count',
+            'comment_count'
         )
+        optional_fields = ('liked_by_me', 'like_count', 'comment_count')
 
 
 class PostsCreateUpdateModelSerializer(serializers.ModelSerializer):
@@ -42,6 +64,15 @@ class PostsCreateUpdateModelSerializer(serializers.ModelSerializer):
         )
 
 
+class PostsBulkCreateModelSerializer(PostsCreateUpdateModelSerializer):
+    '''
+    Titles uniqueness is checked by PostsBulkCreateAPIView for the whole batch at once (one query instead of one per post)
+    '''
+
+    class Meta(PostsCreateUpdateModelSerializer.Meta):
+        extra_kwargs = {'title': {'validators': []}}
+
+
 class PostsDeleteModelSerializer(serializers.ModelSerializer):
 
     class Meta:
@@ -0,0 +1,46 @@
+# DJANGO IMPORTS
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# MODELS
+from user.models import CustomUsers
+from .models import Posts
+
+# FEED
+from .feed import fan_out, rebuild_feed
+
+# CACHE
+from base.cache import bump_generation
+
+# VISIBILITY
+from base.visibility import FIELDS as VISIBILITY_FIELDS, visibility_index
+
+
+@receiver(post_save, sender=Posts)
+@receiver(post_delete, sender=Posts)
+def invalidate_posts_caches(sender, instance, **kwargs):
+    bump_generation('posts')
+
+
+@receiver(post_save, sender=Posts)
+def fan_out_post(sender, instance, created, update_fields=None, **kwargs):
+    # Saves that don't touch who can read the post (e.g. title/content edits) keep its feed entries
+    if created or update_fields is None or {'read_permission', 'author_team', 'is_active'} & set(update_fields):
+        fan_out([instance])
+
+
+@receiver(post_save, sender=CustomUsers)
+def build_new_user_feed(sender, instance, created, **kwargs):
+    if created:
+        rebuild_feed(instance)
+
+
+@receiver(post_save, sender=Posts)
+def patch_visibility_index(sender, instance, created, update_fields=None, **kwargs):
+    if created or update_fields is None or set(VISIBILITY_FIELDS) & set(update_fields):
+        visibility_index.patch([instance])
+
+
+@receiver(post_delete, sender=Posts)
+def remove_from_visibility_index(sender, instance, **kwargs):
+    visibility_index.remove([instance.pk])
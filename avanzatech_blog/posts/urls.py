@@ -9,9 +9,17 @@ urlpatterns = [
     # posts
     path('', views.PostsListAPIView.as_view(), name='posts-list'),
     path('<int:pk>/', views.PostsRetrieveAPIView.as_view(), name='posts-retrieve'),
+    path('feed/', views.PostsFeedAPIView.as_view(), name='posts-feed'),
+    path('trending/', views.PostsTrendingAPIView.as_view(), name='posts-trending'),
+    path('search/', views.PostsSearchAPIView.as_view(), name='posts-search'),
+    path('export/', views.PostsExportAPIView.as_view(), name='posts-export'),
+    path('batch/', views.PostsBatchRetrieveAPIView.as_view(), name='posts-batch'),
     path('create/', views.PostsCreateAPIView.as_view(), name='posts-create'),
+    path('bulk_create/', views.PostsBulkCreateAPIView.as_view(), name='posts-bulk_create'),
     path('update/<int:pk>/', views.PostsUpdateAPIView.as_view(), name='posts-update'),
     path('delete/<int:pk>/', views.PostsDeleteAPIView.as_view(), name='posts-delete'),
+    path('bulk_delete/', views.PostsBulkDeleteAPIView.as_view(), name='posts-bulk_delete'),
+    path('bulk_update_permissions/', views.PostsBulkUpdatePermissionsAPIView.as_view(), name='posts-bulk_update_permissions'),
 
     # likes
     path('list_likes/<int:pk>/', views.PostsListLikesAPIView.as_view(), name='posts-list_likes'),
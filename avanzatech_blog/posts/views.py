@@ -1,41 +1,331 @@
+# PYTHON IMPORTS
+import hashlib
+import itertools
+import zlib
+from collections import OrderedDict
+
 # DJANGO IMPORTS
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
-from django.db.models import Q
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils import timezone
+from django.utils.http import quote_etag
+from django.db.models import Case, Q, When
 
 # DJANGO REST FRAMEWORK IMPORTS
 from rest_framework import generics, permissions, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
 # MODELS
+from .models import Posts
 from likes.models import Likes
 from comments.models import Comments
 
 # QUERY SET
-from base.query_set import BasePostsQuerySet
+from base.query_set import BasePostsQuerySet, BulkPostsQuerySet, get_posts_queryset, get_viewer_key
+
+# MIXINS
+from base.mixins import PostsCountCacheKeyMixin, SparseFieldsMixin, ValuesListMixin
+
+# FEED
+from .feed import FAN_OUT_FIELDS, BaseFeedQuerySet, clear_feed, fan_out
+
+# FILTERS
+from base.filters import PostsFilterBackend
+
+# VISIBILITY
+from base.visibility import visibility_index
+
+# CACHE
+from base.cache import build_cache_key, bump_generation
+
+# RENDERERS
+from base.renderers import FastJSONRenderer
 
 # SERIALIZERS
-from .serializers import PostsCreateUpdateModelSerializer, PostsListModelSerializer, PostsRetrieveModelSerializer, PostsDeleteModelSerializer
+from base.serializers import get_values_fields, serialize_values
+from .serializers import PostsCreateUpdateModelSerializer, PostsBulkCreateModelSerializer, PostsListModelSerializer, PostsRetrieveModelSerializer, PostsDeleteModelSerializer
 from likes.serializers import LikeModelSerializer, ListLikesModelSerializer
 from comments.serializers import CommentModelSerializer, ListCommentsModelSerializer, DeleteCommentModelSerializer
 
 # PAGINATION
-from base.paginations import ListPostsCommentsPagination, ListLikesPagination
+from base.paginations import ListPostsCommentsPagination, ListLikesPagination, ListPostsCursorPagination
 
 
-class PostsListAPIView(BasePostsQuerySet, generics.ListAPIView):
+class PostsListAPIView(SparseFieldsMixin, ValuesListMixin, PostsCountCacheKeyMixin, BasePostsQuerySet, generics.ListAPIView):
     '''
-    It shows all the posts on the blogging platform, according to the read permission of each post
+    It shows all the posts on the blogging platform, according to the read permission of each post. Send pagination=cursor (query param) to get (created_at, id) cursors instead of page numbers.
+    Pages are cached per viewer visibility class until any post changes. Send fields (query param) to get only some fields, e.g. fields=id,title.
+    Send author, team, read_permission, created_after and/or created_before (query params) to filter the posts. Send include (query param) to add
+    liked_by_me, like_count and/or comment_count, e.g. include=liked_by_me (pages with liked_by_me are cached per user)
     '''
     serializer_class = PostsListModelSerializer
     pagination_class = ListPostsCommentsPagination
+    filter_backends = [PostsFilterBackend]
+    cursor_pagination_class = ListPostsCursorPagination
+    # Cursors are built from created_at
+    required_fields = ('created_at',)
+
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            if self.request.query_params.get('pagination') == 'cursor':
+                self._paginator = self.cursor_pagination_class()
+            else:
+                self._paginator = self.pagination_class()
+
+        return self._paginator
+
+    def list(self, request, *args, **kwargs):
+        cache_key = build_cache_key('list', 'posts', get_viewer_key(request.user, self.get_requested_fields()), request.get_host(), request.get_full_path())
+        data = cache.get(cache_key)
+
+        if data is not None:
+            return Response(data)
 
+        response = super().list(request, *args, **kwargs)
+        cache.set(cache_key, response.data, settings.POSTS_LIST_CACHE_TIMEOUT)
 
-class PostsRetrieveAPIView(BasePostsQuerySet, generics.RetrieveAPIView):
+        return response
+
+    async def alist(self, request, *args, **kwargs):
+        cache_key = build_cache_key('list', 'posts', get_viewer_key(request.user, self.get_requested_fields()), request.get_host(), request.get_full_path())
+        data = await cache.aget(cache_key)
+
+        if data is not None:
+            return Response(data)
+
+        response = await super().alist(request, *args, **kwargs)
+        await cache.aset(cache_key, response.data, settings.POSTS_LIST_CACHE_TIMEOUT)
+
+        return response
+
+
+class PostsRetrieveAPIView(SparseFieldsMixin, BasePostsQuerySet, generics.RetrieveAPIView):
     '''
-    It shows the specified post (path param) on the blogging platform, according to the read permission of the post
+    It shows the specified post (path param) on the blogging platform, according to the read permission of the post. Responses carry an ETag
+    header, and If-None-Match requests get a 304 when the post didn't change. Send fields (query param) to get only some fields, e.g. fields=title.
+    Send include (query param) to add liked_by_me, like_count and/or comment_count, e.g. include=liked_by_me,like_count
     '''
     serializer_class = PostsRetrieveModelSerializer
 
+    def retrieve(self, request, *args, **kwargs):
+        # Only the version columns (the counters change without touching updated_at) are read to validate the client's copy,
+        # the content column is loaded just for 200s
+        self.check_visibility()
+
+        version = get_object_or_404(self.filter_queryset(self.get_queryset()).values('id', 'updated_at', 'likes_count', 'comments_count'), pk=kwargs['pk'])
+
+        etag = self.get_etag(version)
+
+        # Only the ETag validates the client's copy: If-Modified-Since would compare a one second resolution
+        # updated_at that the counters (and liked_by_me) don't touch, so no Last-Modified is sent
+        response = get_conditional_response(request, etag=etag)
+
+        if response is None:
+            response = super().retrieve(request, *args, **kwargs)
+
+        response['ETag'] = etag
+
+        return response
+
+    async def aretrieve(self, request, *args, **kwargs):
+        await self.acheck_visibility()
+
+        version = await self.filter_queryset(self.get_queryset()).values('id', 'updated_at', 'likes_count', 'comments_count').filter(pk=kwargs['pk']).afirst()
+
+        if version is None:
+            raise Http404
+
+        etag = self.get_etag(version)
+
+        response = get_conditional_response(request, etag=etag)
+
+        if response is None:
+            response = Response(self.get_serializer(await self.aget_object()).data)
+
+        response['ETag'] = etag
+
+        return response
+
+    def get_etag(self, version):
+        # The representation also depends on the renderer (JSON or browsable API), the requested fields and, for liked_by_me, the viewer
+        parts = [self.request.accepted_renderer.format, get_viewer_key(self.request.user, self.get_requested_fields()), str(self.get_requested_fields())] + [str(value) for value in version.values()]
+
+        return quote_etag(hashlib.md5(':'.join(parts).encode()).hexdigest())
+
+
+class PostsFeedAPIView(SparseFieldsMixin, ValuesListMixin, PostsCountCacheKeyMixin, BaseFeedQuerySet, generics.ListAPIView):
+    '''
+    It shows the timeline of the user (the posts he/she can read, newest first), but only if the user is authenticated. It's read from the
+    feed entries written when the posts are created/updated instead of the visibility filter. Send fields (query param) to get only some fields, e.g. fields=id,title
+    '''
+    serializer_class = PostsListModelSerializer
+    pagination_class = ListPostsCommentsPagination
+    permission_classes = [permissions.IsAuthenticated]
+    count_cache_prefix = 'feed'
+
+
+class PostsTrendingAPIView(SparseFieldsMixin, BasePostsQuerySet, generics.ListAPIView):
+    '''
+    It shows the top trending posts (most recent likes/comments, scored periodically by compute_trending), according to the read permission of each post.
+    Send limit (query param, 10 by default, at most 100) to choose how many. Send fields (query param) to get only some fields, e.g. fields=id,title
+    '''
+    serializer_class = PostsListModelSerializer
+    pagination_class = None
+    default_limit = 10
+    max_limit = 100
+
+    def get_queryset(self):
+        return super().get_queryset().filter(trending__isnull=False).order_by('-trending__score', 'id')
+
+    def list(self, request, *args, **kwargs):
+        try:
+            limit = int(request.query_params.get('limit', self.default_limit))
+        except ValueError:
+            limit = 0
+
+        if not 1 <= limit <= self.max_limit:
+            error = {'errors': [f'Limit query param must be an integer between 1 and {self.max_limit}.']}
+            return Response(error, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = self.get_serializer(self.filter_queryset(self.get_queryset())[:limit], many=True)
+
+        return Response({'results': serializer.data})
+
+
+class PostsSearchAPIView(SparseFieldsMixin, ValuesListMixin, PostsCountCacheKeyMixin, BasePostsQuerySet, generics.ListAPIView):
+    '''
+    It shows the posts whose title or content match all the words of the q query param (full-text search, best matches first), according to the read permission of each post.
+    Send fields (query param) to get only some fields, e.g. fields=id,title
+    '''
+    serializer_class = PostsListModelSerializer
+    pagination_class = ListPostsCommentsPagination
+    count_cache_prefix = 'search'
+
+    def get_queryset(self):
+        query = self.request.query_params.get('q', '').strip()
+
+        if not query:
+            raise ValidationError({'errors': ['No query param in the URL (q).']})
+
+        # The visibility filter is applied before the ranking and its limit, not to the limited results
+        ids = Posts.objects.search(query, get_posts_queryset(self.request.user, self.request.method))
+
+        if not ids:
+            return Posts.objects.none()
+
+        ranking = Case(*[When(id=pk, then=position) for position, pk in enumerate(ids)])
+
+        return super().get_queryset().filter(id__in=ids).order_by(ranking)
+
+
+class PostsExportAPIView(SparseFieldsMixin, BasePostsQuerySet, generics.GenericAPIView):
+    '''
+    It streams all the posts the user can read as newline-delimited JSON (one post per line), gzip compressed if the client accepts it (Accept-Encoding).
+    The posts are read in chunks, so memory stays flat however many there are. Send fields and/or the posts list filters (query params) to narrow the export
+    '''
+    serializer_class = PostsListModelSerializer
+    filter_backends = [PostsFilterBackend]
+    chunk_size = 2000
+
+    def get(self, request, *args, **kwargs):
+        # Everything that can fail (unknown fields, invalid filters) is checked before the first byte is sent
+        queryset = self.filter_queryset(self.get_queryset())
+        fields = get_values_fields(self.get_serializer())
+        gzipped = 'gzip' in request.META.get('HTTP_ACCEPT_ENCODING', '')
+
+        content = self.stream_chunks(queryset, fields)
+
+        if gzipped:
+            content = self.gzip_chunks(content)
+
+        response = StreamingHttpResponse(content, content_type='application/x-ndjson')
+        patch_vary_headers(response, ['Accept-Encoding'])
+
+        if gzipped:
+            response['Content-Encoding'] = 'gzip'
+
+        return response
+
+    def stream_chunks(self, queryset, fields):
+        renderer = FastJSONRenderer()
+
+        if fields is not None:
+            rows = queryset.values(*fields.values()).iterator(chunk_size=self.chunk_size)
+        else:
+            rows = queryset.iterator(chunk_size=self.chunk_size)
+
+        while True:
+            chunk = list(itertools.islice(rows, self.chunk_size))
+
+            if not chunk:
+                return
+
+            data = serialize_values(chunk, fields) if fields is not None else self.get_serializer(chunk, many=True).data
+
+            yield b''.join(renderer.render(row) + b'\n' for row in data)
+
+    def gzip_chunks(self, chunks):
+        compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+
+        for chunk in chunks:
+            yield compressor.compress(chunk)
+
+        yield compressor.flush()
+
+
+class PostsBatchRetrieveAPIView(SparseFieldsMixin, BasePostsQuerySet, generics.GenericAPIView):
+    '''
+    It shows the specified posts (ids query param, e.g. ids=1,2,3) on the blogging platform with a single query, according to the read permission of each post.
+    Results are keyed by id; ids of posts that don't exist are marked as not_found and ids of posts the user can't read as forbidden
+    '''
+    serializer_class = PostsListModelSerializer
+    max_batch_size = 100
+
+    def get(self, request, *args, **kwargs):
+        ids = request.query_params.get('ids')
+
+        if not ids:
+            error = {'errors': ['No query param in the URL (ids).']}
+            return Response(error, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            ids = list(dict.fromkeys(int(pk) for pk in ids.split(',') if pk))
+        except ValueError:
+            error = {'errors': ['Ids query param must be a comma-separated list of integers.']}
+            return Response(error, status=status.HTTP_400_BAD_REQUEST)
+
+        if len(ids) > self.max_batch_size:
+            error = {'errors': [f'No more than {self.max_batch_size} ids per request.']}
+            return Response(error, status=status.HTTP_400_BAD_REQUEST)
+
+        # The in-memory visibility index only leaves out the posts it denies, the database decides the rest
+        queried = [pk for pk in ids if not visibility_index.denies(request.user, pk)]
+        posts = list(self.get_queryset().filter(id__in=queried)) if queried else []
+        serializer = self.get_serializer(posts, many=True)
+        visible = {post.pk: data for post, data in zip(posts, serializer.data)}
+
+        missing = [pk for pk in ids if pk not in visible]
+        # Posts that exist but the visibility rules hid (deleted posts don't exist for non-admins, like in the retrieve endpoint)
+        hidden = set(Posts.objects.filter(id__in=missing, is_active=True).values_list('id', flat=True)) if missing else set()
+
+        results = OrderedDict()
+
+        for pk in ids:
+            if pk in visible:
+                results[str(pk)] = visible[pk]
+            elif pk in hidden:
+                results[str(pk)] = {'error': 'forbidden'}
+            else:
+                results[str(pk)] = {'error': 'not_found'}
+
+        return Response({'results': results})
+
 
 class PostsCreateAPIView(generics.CreateAPIView):
     '''
@@ -70,6 +360,80 @@ class PostsCreateAPIView(generics.CreateAPIView):
         return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
 
+class PostsBulkCreateAPIView(generics.GenericAPIView):
+    '''
+    It creates several posts (a list of posts, at most 500) on the blogging platform with configurable read/edit permissions, but only if the user is authenticated.
+    The posts are validated together and created in one transaction: if any of them is invalid, none is created and the errors of each post are returned
+    '''
+    serializer_class = PostsBulkCreateModelSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    max_batch_size = 500
+
+    def post(self, request, *args, **kwargs):
+        items = request.data
+
+        if not isinstance(items, list) or not items:
+            error = {'errors': ['Request body must be a non-empty list of posts.']}
+            return Response(error, status=status.HTTP_400_BAD_REQUEST)
+
+        if len(items) > self.max_batch_size:
+            error = {'errors': [f'No more than {self.max_batch_size} posts per request.']}
+            return Response(error, status=status.HTTP_400_BAD_REQUEST)
+
+        author = request.user
+        errors = []
+        posts = []
+        titles = {}
+
+        for index, item in enumerate(items):
+            serializer = self.get_serializer(data=item)
+            item_errors = []
+
+            if serializer.is_valid():
+                title = serializer.validated_data.get('title')
+                content = serializer.validated_data.get('content')
+
+                if not title:
+                    item_errors.append('Post must have a title.')
+                elif title in titles:
+                    item_errors.append(f'Title is repeated in post {titles[title]}.')
+                else:
+                    titles[title] = index
+
+                if not content:
+                    item_errors.append('Post must have content.')
+
+                posts.append(Posts(author=author, author_team=author.team, **serializer.validated_data))
+            else:
+                for field, messages in serializer.errors.items():
+                    item_errors.extend(messages if field == 'non_field_errors' else [f'{field}: {message}' for message in messages])
+
+            if item_errors:
+                errors.append({'index': index, 'errors': item_errors})
+
+        # Titles already taken in the database, one query for the whole batch
+        for title in Posts.objects.filter(title__in=list(titles)).values_list('title', flat=True):
+            errors.append({'index': titles[title], 'errors': ['posts with this title already exists.']})
+
+        if errors:
+            return Response({'errors': sorted(errors, key=lambda error: error['index'])}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            with transaction.atomic():
+                posts = Posts.objects.bulk_create(posts)
+        except IntegrityError:
+            # A title was taken by a concurrent request in the meantime
+            error = {'errors': ['One or more titles already exist. No post was created.']}
+            return Response(error, status=status.HTTP_400_BAD_REQUEST)
+
+        # bulk_create() doesn't send post_save signals
+        bump_generation('posts')
+        fan_out(posts)
+        visibility_index.patch(posts)
+
+        return Response(PostsListModelSerializer(posts, many=True).data, status=status.HTTP_201_CREATED)
+
+
 class PostsUpdateAPIView(BasePostsQuerySet, generics.UpdateAPIView):
     '''
     It edits the specified post (path param) on the blogging platform, but only if the user is authenticated and according to the edit permission of the post
@@ -95,7 +459,7 @@ class PostsUpdateAPIView(BasePostsQuerySet, generics.UpdateAPIView):
         if not content:
             content = serializer.instance.content
 
-        serializer.save(title=title, content=content)
+        instance.save_changes(**{**serializer.validated_data, 'title': title, 'content': content})
 
         if getattr(instance, '_prefetched_objects_cache', None):
             instance._prefetched_objects_cache = {}
@@ -110,32 +474,122 @@ class PostsDeleteAPIView(BasePostsQuerySet, generics.DestroyAPIView):
     serializer_class = PostsDeleteModelSerializer
     permission_classes = [permissions.IsAuthenticated]
 
-    def perform_destroy(self, instance):
-        instance.is_active = False
-        instance.save()
+    def destroy(self, request, *args, **kwargs):
+        # A single UPDATE of the visible post, instead of loading the whole row (content included) just to flip is_active
+        posts = self.get_queryset().filter(pk=kwargs['pk'])
+
+        with transaction.atomic():
+            clear_feed(posts.filter(is_active=True))
+            deleted = posts.soft_delete()
+
+        # Admins can delete an already deleted post again (nothing to write)
+        if not deleted and not posts.exists():
+            raise Http404
 
+        # update() doesn't send post_save signals
+        if deleted:
+            bump_generation('posts')
+            visibility_index.refresh([kwargs['pk']])
 
-class PostsListLikesAPIView(BasePostsQuerySet, generics.ListAPIView):
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class PostsBulkDeleteAPIView(BulkPostsQuerySet, generics.GenericAPIView):
+    '''
+    It deletes (soft delete) the selected posts (ids and/or filters in the body) on the blogging platform with a single UPDATE, but only if the user
+    is authenticated and according to the edit permission of each post. It returns how many posts were deleted
+    '''
+    serializer_class = PostsDeleteModelSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        posts = self.get_queryset().filter(is_active=True)
+
+        with transaction.atomic():
+            ids = list(posts.values_list('id', flat=True))
+            clear_feed(posts)
+            deleted = posts.soft_delete()
+
+        # update() doesn't send post_save signals
+        if deleted:
+            bump_generation('posts')
+            visibility_index.refresh(ids)
+
+        return Response({'deleted': deleted})
+
+
+class PostsBulkUpdatePermissionsAPIView(BulkPostsQuerySet, generics.GenericAPIView):
+    '''
+    It changes the read and/or edit permission of the selected posts (ids and/or filters in the body) on the blogging platform with a single UPDATE,
+    but only if the user is authenticated and according to the edit permission of each post. It returns how many posts were changed
+    '''
+    serializer_class = PostsCreateUpdateModelSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        error = {'errors': []}
+        changes = {}
+        permissions_choices = [permission for permission, _ in Posts.PERMISSIONS]
+
+        for field in ('read_permission', 'edit_permission'):
+            value = request.data.get(field) if isinstance(request.data, dict) else None
+
+            if value is None:
+                continue
+
+            if value in permissions_choices:
+                changes[field] = value
+            else:
+                error['errors'].append(f'{field.capitalize()} must be one of: {", ".join(permissions_choices)}.')
+
+        if not changes and not error['errors']:
+            error['errors'].append('Send read_permission and/or edit_permission.')
+
+        if error['errors']:
+            return Response(error, status=status.HTTP_400_BAD_REQUEST)
+
+        # Posts that already have the permissions aren't rewritten
+        posts = self.get_queryset().exclude(**changes)
+
+        with transaction.atomic():
+            ids = list(posts.values_list('id', flat=True))
+            updated = posts.update(**changes, updated_at=timezone.now())
+
+            # Who can read the posts changes, so they are fanned out again
+            if ids and 'read_permission' in changes:
+                fan_out(Posts.objects.filter(id__in=ids).only(*FAN_OUT_FIELDS))
+
+        if updated:
+            bump_generation('posts')
+            visibility_index.refresh(ids)
+
+        return Response({'updated': updated})
+
+
+class PostsListLikesAPIView(ValuesListMixin, BasePostsQuerySet, generics.ListAPIView):
     '''
     It shows all the likes linked to the specified post (path param) on the blogging platform, according to the read permission of each post
     '''
     serializer_class = ListLikesModelSerializer
     pagination_class = ListLikesPagination
 
+    def get_count_cache_key(self):
+        # Everyone who can read the post sees the same likes
+        return build_cache_key('count', f'likes:{self.kwargs["pk"]}')
+
     def list(self, request, *args, **kwargs):
-        post = self.get_object()
+        post = self.get_post()
 
         likes = Likes.objects.filter(Q(post=post) & Q(is_active=True))
 
-        page = self.paginate_queryset(likes)
-        
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+        return self.get_list_response(likes)
 
-        serializer = self.get_serializer(likes, many=True)
+    async def alist(self, request, *args, **kwargs):
+        post = await self.aget_post()
 
-        return Response(serializer.data)
+        likes = Likes.objects.filter(Q(post=post) & Q(is_active=True))
+
+        return await self.aget_list_response(likes)
 
 
 class PostsLikeAPIView(BasePostsQuerySet, generics.CreateAPIView):
@@ -146,44 +600,42 @@ class PostsLikeAPIView(BasePostsQuerySet, generics.CreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def create(self, request, *args, **kwargs):
-        post = self.get_object()
+        post = self.get_post()
 
-        like, created = Likes.objects.get_or_create(user=request.user, post=post)
+        with transaction.atomic():
+            is_active = Likes.objects.toggle(request.user.pk, post.pk)
+            Posts.objects.add_to_counter(post.pk, 'likes_count', 1 if is_active else -1)
 
-        if not created:
-            like.is_active = not like.is_active
-            like.save()
+        # The upsert doesn't go through Likes.save(), so its signals don't fire
+        bump_generation(f'likes:{post.pk}')
+        bump_generation(f'user_likes:{request.user.pk}')
 
         return Response(status=status.HTTP_200_OK)
 
 
-class PostsListCommentsAPIView(BasePostsQuerySet, generics.ListAPIView):
+class PostsListCommentsAPIView(ValuesListMixin, BasePostsQuerySet, generics.ListAPIView):
     '''
     It shows all the comments linked to the specified post (path param) on the blogging platform, according to the read permission of each post
     '''
     serializer_class = ListCommentsModelSerializer
     pagination_class = ListPostsCommentsPagination
 
+    def get_count_cache_key(self):
+        # Admins also see the deleted comments
+        return build_cache_key('count', f'comments:{self.kwargs["pk"]}', getattr(self.request.user, 'role', None) == 'admin')
+
     def list(self, request, *args, **kwargs):
-        post = self.get_object()
+        return self.get_list_response(self.get_comments(self.get_post()))
 
-        if hasattr(request.user, 'role'):
-            if request.user.role == 'admin':
-                comments = Comments.objects.filter(post=post)
-            else:
-                comments = Comments.objects.filter(Q(post=post) & Q(is_active=True))
-        else:
-            comments = Comments.objects.filter(Q(post=post) & Q(is_active=True))
-        
-        page = self.paginate_queryset(comments)
-        
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+    async def alist(self, request, *args, **kwargs):
+        return await self.aget_list_response(self.get_comments(await self.aget_post()))
 
-        serializer = self.get_serializer(comments, many=True)
+    def get_comments(self, post):
+        if hasattr(self.request.user, 'role'):
+            if self.request.user.role == 'admin':
+                return Comments.objects.filter(post=post)
 
-        return Response(serializer.data)
+        return Comments.objects.filter(Q(post=post) & Q(is_active=True))
 
 
 class PostsCommentAPIView(BasePostsQuerySet, generics.CreateAPIView):
@@ -194,7 +646,7 @@ class PostsCommentAPIView(BasePostsQuerySet, generics.CreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def create(self, request, *args, **kwargs):
-        post = self.get_object()
+        post = self.get_post()
 
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -210,7 +662,9 @@ class PostsCommentAPIView(BasePostsQuerySet, generics.CreateAPIView):
         if error['errors']:
             return Response(error, status=status.HTTP_400_BAD_REQUEST)
 
-        serializer.save(user=user, post=post)
+        with transaction.atomic():
+            serializer.save(user=user, post=post)
+            Posts.objects.add_to_counter(post.pk, 'comments_count', 1)
 
         headers = self.get_success_headers(serializer.data)
 
@@ -225,7 +679,7 @@ class PostsDeleteCommentAPIView(BasePostsQuerySet, generics.DestroyAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def destroy(self, request, *args, **kwargs):
-        post = self.get_object()
+        post = self.get_post()
 
         comment_pk = self.request.query_params.get('comment_id')
 
@@ -233,13 +687,23 @@ class PostsDeleteCommentAPIView(BasePostsQuerySet, generics.DestroyAPIView):
             error = {'errors': ['No query param in the URL (comment_id).']}
             return Response(error, status=status.HTTP_400_BAD_REQUEST)
 
-        if request.user.role == 'admin':
-            comment = get_object_or_404(Comments, Q(pk=comment_pk) & Q(post=post))
-        
+        comments = Comments.objects.filter(Q(pk=comment_pk) & Q(post=post))
+
         if request.user.role == 'blogger':
-            comment = get_object_or_404(Comments, Q(pk=comment_pk) & Q(user=request.user) & Q(post=post) & Q(is_active=True))
+            comments = comments.filter(Q(user=request.user) & Q(is_active=True))
+
+        with transaction.atomic():
+            deleted = comments.soft_delete()
+
+            if deleted:
+                Posts.objects.add_to_counter(post.pk, 'comments_count', -1)
+
+        # Admins can delete an already deleted comment again (nothing to write)
+        if not deleted and not comments.exists():
+            raise Http404
 
-        comment.is_active = False
-        comment.save()
+        # update() doesn't send post_save signals
+        if deleted:
+            bump_generation(f'comments:{post.pk}')
 
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,12 @@
+# PYTEST IMPORTS
+import pytest
+
+# DJANGO IMPORTS
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # The database is rolled back after each test, the cache isn't
+    cache.clear()
+    yield
@@ -0,0 +1,148 @@
+# PYTHON IMPORTS
+from datetime import timedelta
+from io import StringIO
+
+# DJANGO IMPORTS
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+# DJANGO REST FRAMEWORK IMPORTS
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+
+# MODELS
+from user.models import CustomUsers
+from posts.models import Posts
+from likes.models import Likes
+from comments.models import Comments
+from archive.models import ArchivedPosts, ArchivedComments, ArchivedLikes
+
+# FACTORIES
+from . import factories
+
+
+class ArchiveInactive(APITestCase):
+
+    def setUp(self):
+        factories.CustomUsersFactory(email='test_1@example.com').save()
+        factories.CustomUsersFactory(email='test_2@example.com').save()
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 2').save()
+
+        for post in Posts.objects.all():
+            factories.CommentsFactory(user=CustomUsers.objects.get(pk=1), post=post).save()
+            factories.CommentsFactory(user=CustomUsers.objects.get(pk=2), post=post).save()
+            factories.LikesFactory(user=CustomUsers.objects.get(pk=1), post=post).save()
+            factories.LikesFactory(user=CustomUsers.objects.get(pk=2), post=post).save()
+    
+    def age(self, model, days=100, **filters):
+        # Soft deleted long ago
+        model.objects.filter(**filters).update(is_active=False, updated_at=timezone.now() - timedelta(days=days))
+    
+    def archive(self, **options):
+        output = StringIO()
+        call_command('archive_inactive', stdout=output, **options)
+
+        return output.getvalue()
+    
+    def test_1_old_inactive_posts_are_archived_with_their_comments_and_likes(self):
+        self.age(Posts, pk=1)
+
+        self.assertIn('1 posts, 0 comments and 0 likes archived', self.archive(batch_size=1))
+        self.assertEqual(list(Posts.objects.values_list('id', flat=True)), [2])
+        self.assertEqual(list(ArchivedPosts.objects.values_list('id', 'title', 'is_active')), [(1, 'Post 1', False)])
+        self.assertEqual(sorted(ArchivedComments.objects.values_list('id', 'post_id')), [(1, 1), (2, 1)])
+        self.assertEqual(sorted(ArchivedLikes.objects.values_list('id', 'post_id')), [(1, 1), (2, 1)])
+        self.assertFalse(Comments.objects.filter(post_id=1).exists())
+        self.assertFalse(Likes.objects.filter(post_id=1).exists())
+    
+    def test_2_old_inactive_comments_and_likes_of_active_posts_are_archived(self):
+        self.age(Comments, pk=3)
+        self.age(Likes, pk=4)
+
+        self.assertIn('0 posts, 1 comments and 1 likes archived', self.archive())
+        self.assertEqual(list(ArchivedComments.objects.values_list('id', flat=True)), [3])
+        self.assertEqual(list(ArchivedLikes.objects.values_list('id', flat=True)), [4])
+        self.assertEqual(Comments.objects.filter(post_id=2).count(), 1)
+        self.assertEqual(Likes.objects.filter(post_id=2).count(), 1)
+    
+    def test_3_recently_deleted_and_active_rows_stay_in_the_hot_tables(self):
+        self.age(Posts, days=10, pk=1)
+        self.age(Comments, days=10, pk=3)
+
+        self.assertIn('0 posts, 0 comments and 0 likes archived', self.archive())
+        self.assertIn('1 posts, 1 comments and 0 likes archived', self.archive(days=5))
+    
+    def test_4_running_it_again_archives_nothing_new(self):
+        self.age(Posts, pk=1)
+        self.archive()
+
+        self.assertIn('0 posts, 0 comments and 0 likes archived', self.archive())
+        self.assertEqual(ArchivedPosts.objects.count(), 1)
+
+
+class ArchivedPostsRestore(APITestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.endpoint = reverse('archive-restore_post', kwargs={'pk': 1})
+
+        factories.CustomUsersFactory(email='test_1@example.com', role='admin').save()
+        factories.CustomUsersFactory(email='test_2@example.com').save()
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=2), title='Post 1', read_permission='public', likes_count=1).save()
+        factories.CommentsFactory(user=CustomUsers.objects.get(pk=2), post=Posts.objects.get(pk=1)).save()
+        factories.LikesFactory(user=CustomUsers.objects.get(pk=2), post=Posts.objects.get(pk=1)).save()
+
+        Posts.objects.filter(pk=1).update(is_active=False, updated_at=timezone.now() - timedelta(days=100))
+        call_command('archive_inactive', stdout=StringIO())
+    
+    def test_1_forbidden_restore_by_authenticated_blogger(self):
+        self.client.force_authenticate(user=CustomUsers.objects.get(pk=2))
+        response = self.client.post(self.endpoint)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(response.data['detail'], 'You do not have permission to perform this action.')
+    
+    def test_2_forbidden_restore_by_unauthenticated_user(self):
+        response = self.client.post(self.endpoint)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(response.data['detail'], 'Authentication credentials were not provided.')
+    
+    def test_3_restore_by_authenticated_admin_brings_back_the_post_with_its_comments_and_likes(self):
+        self.client.force_authenticate(user=CustomUsers.objects.get(pk=1))
+
+        response = self.client.post(self.endpoint)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], 'Post 1')
+        self.assertEqual(response.data['likes_count'], 1)
+
+        self.assertTrue(Posts.objects.get(pk=1).is_active)
+        self.assertEqual(Comments.objects.filter(post_id=1).count(), 1)
+        self.assertEqual(Likes.objects.filter(post_id=1).count(), 1)
+        self.assertFalse(ArchivedPosts.objects.exists())
+        self.assertFalse(ArchivedComments.objects.exists())
+        self.assertFalse(ArchivedLikes.objects.exists())
+
+        # Visible (and searchable) again
+        self.client.force_authenticate(user=CustomUsers.objects.get(pk=2))
+        response = self.client.get(reverse('posts-search'), {'q': 'Post'})
+        self.assertEqual([post['title'] for post in response.data['results']], ['Post 1'])
+    
+    def test_4_restore_of_post_not_archived_by_authenticated_admin(self):
+        self.client.force_authenticate(user=CustomUsers.objects.get(pk=1))
+
+        response = self.client.post(reverse('archive-restore_post', kwargs={'pk': 2}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data['detail'], 'Not found.')
+    
+    def test_5_restore_of_post_whose_title_was_taken_by_authenticated_admin(self):
+        self.client.force_authenticate(user=CustomUsers.objects.get(pk=1))
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=2), title='Post 1').save()
+
+        response = self.client.post(self.endpoint)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['errors'], ['A post with the same title already exists.'])
+        self.assertTrue(ArchivedPosts.objects.filter(pk=1).exists())
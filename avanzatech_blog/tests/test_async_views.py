@@ -0,0 +1,104 @@
+# PYTHON IMPORTS
+from asgiref.sync import async_to_sync
+
+# DJANGO IMPORTS
+from django.core.cache import cache
+from django.test import AsyncClient
+from django.urls import resolve
+
+# DJANGO REST FRAMEWORK IMPORTS
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+
+# MODELS
+from user.models import CustomUsers
+from posts.models import Posts
+
+# VIEWS
+from posts import async_views
+
+# FACTORIES
+from . import factories
+
+
+ASGI_URLCONF = 'avanzatech_blog.asgi_urls'
+
+
+class AsyncReadEndpoints(APITestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+
+        factories.CustomUsersFactory(email='test_1@example.com', team='team 1').save()
+        factories.CustomUsersFactory(email='test_2@example.com', team='team 2').save()
+        factories.CustomUsersFactory(email='test_3@example.com', role='admin').save()
+
+        for i, read_permission in enumerate(('public', 'authenticated', 'team', 'owner', 'public')):
+            factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title=f'Post {i}', read_permission=read_permission).save()
+
+        for user in (1, 2, 3):
+            factories.LikesFactory(user=CustomUsers.objects.get(pk=user), post=Posts.objects.get(pk=1)).save()
+            factories.CommentsFactory(user=CustomUsers.objects.get(pk=user), post=Posts.objects.get(pk=1), content=f'Comment {user}').save()
+
+        factories.CommentsFactory(user=CustomUsers.objects.get(pk=2), post=Posts.objects.get(pk=1), content='Deleted', is_active=False).save()
+
+    def get_async(self, url, headers=None):
+        # Sessions are the only authentication of the async views, the async client reuses the session cookie of the sync one
+        client = AsyncClient()
+        client.cookies = self.client.cookies
+
+        with self.settings(ROOT_URLCONF=ASGI_URLCONF):
+            return async_to_sync(client.get)(url, headers=headers)
+
+    def test_1_async_endpoints_answer_like_the_sync_ones(self):
+        urls = [
+            '/api/posts/', '/api/posts/?page_size=2&page=2', '/api/posts/?count=false&page_size=2', '/api/posts/?pagination=cursor&page_size=2',
+            '/api/posts/?read_permission=public&fields=id,title', '/api/posts/1/', '/api/posts/3/?fields=title', '/api/posts/4/',
+            '/api/posts/list_likes/1/', '/api/posts/list_comments/1/', '/api/posts/list_comments/4/',
+            '/api/posts/?include=liked_by_me,like_count', '/api/posts/1/?include=liked_by_me,comment_count',
+        ]
+
+        for user in (None, 1, 2, 3):
+            if user is None:
+                self.client.logout()
+            else:
+                self.client.force_login(CustomUsers.objects.get(pk=user))
+
+            for url in urls:
+                with self.subTest(user=user, url=url):
+                    cache.clear()
+                    expected = self.client.get(url, HTTP_ACCEPT='application/json')
+
+                    cache.clear()
+                    response = self.get_async(url)
+
+                    self.assertEqual(response.status_code, expected.status_code)
+                    self.assertEqual(response.json(), expected.json())
+
+    def test_2_errors_have_the_bodies_of_the_sync_endpoints(self):
+        response = self.get_async('/api/posts/4/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.json(), {'detail': 'Not found.'})
+
+        response = self.get_async('/api/posts/?page=9')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.get_async('/api/posts/?created_after=yesterday')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('errors', response.json())
+
+    def test_3_retrieve_validates_the_client_copy(self):
+        response = self.get_async('/api/posts/1/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/json')
+
+        response = self.get_async('/api/posts/1/', headers={'If-None-Match': response['ETag']})
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_4_asgi_urlconf_routes_only_the_read_endpoints_to_async_views(self):
+        self.assertIs(resolve('/api/posts/', ASGI_URLCONF).func.view_class, async_views.AsyncPostsListAPIView)
+        self.assertIs(resolve('/api/posts/1/', ASGI_URLCONF).func.view_class, async_views.AsyncPostsRetrieveAPIView)
+        self.assertIs(resolve('/api/posts/list_likes/1/', ASGI_URLCONF).func.view_class, async_views.AsyncPostsListLikesAPIView)
+        self.assertIs(resolve('/api/posts/list_comments/1/', ASGI_URLCONF).func.view_class, async_views.AsyncPostsListCommentsAPIView)
+        self.assertEqual(resolve('/api/posts/feed/', ASGI_URLCONF).url_name, 'posts-feed')
+        self.assertEqual(resolve('/api/users/create/', ASGI_URLCONF).url_name, 'users-create')
@@ -1,5 +1,18 @@
+# PYTHON IMPORTS
+import gzip
+import json
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
 # DJANGO IMPORTS
+from django.contrib.auth.models import AnonymousUser
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 
 # DJANGO REST FRAMEWORK IMPORTS
 from rest_framework import status
@@ -7,7 +20,24 @@ from rest_framework.test import APITestCase, APIClient
 
 # MODELS
 from user.models import CustomUsers
-from posts.models import Posts
+from posts.models import Posts, FeedEntries
+from likes.models import Likes
+from comments.models import Comments
+
+# QUERY SET
+from base.query_set import get_posts_queryset, get_visibility_key
+
+# FILTERS
+from base.filters import filter_posts
+
+# VISIBILITY
+from base.visibility import visibility_index
+
+# VIEWS
+from posts.views import PostsExportAPIView
+
+# SERIALIZERS
+from posts.serializers import PostsListModelSerializer
 
 # FACTORIES
 from . import factories
@@ -297,6 +327,244 @@ class PostsList(APITestCase):
         self.assertIsNotNone(response.data['next'])
         self.assertIsNone(response.data['previous'])
         self.assertEqual(len(response.data['results']), 10)
+    
+    def test_17_results_cursor_pagination_for_unauthenticated_user_if_all_posts_have_public_read_permission(self):
+        factories.CustomUsersFactory().save()
+
+        for i in range(1, 16):
+            factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title=f'Post {i}', read_permission='public').save()
+
+        response = self.client.get(self.endpoint, {'pagination': 'cursor'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(response.data), ['next', 'previous', 'results'])
+        self.assertIsNotNone(response.data['next'])
+        self.assertIsNone(response.data['previous'])
+        self.assertEqual([post['id'] for post in response.data['results']], list(range(1, 11)))
+
+        response = self.client.get(response.data['next'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data['next'])
+        self.assertIsNotNone(response.data['previous'])
+        self.assertEqual([post['id'] for post in response.data['results']], list(range(11, 16)))
+
+        response = self.client.get(response.data['previous'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNotNone(response.data['next'])
+        self.assertIsNone(response.data['previous'])
+        self.assertEqual([post['id'] for post in response.data['results']], list(range(1, 11)))
+    
+    def test_18_invalid_cursor_for_unauthenticated_user(self):
+        response = self.client.get(self.endpoint, {'pagination': 'cursor', 'cursor': 'invalid'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data['detail'], 'Invalid cursor')
+    
+    def test_19_results_pagination_without_count_for_unauthenticated_user_if_all_posts_have_public_read_permission(self):
+        factories.CustomUsersFactory().save()
+
+        for i in range(1, 16):
+            factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title=f'Post {i}', read_permission='public').save()
+
+        response = self.client.get(self.endpoint, {'count': 'false'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(response.data), ['current_page', 'has_more', 'next', 'previous', 'results'])
+        self.assertEqual(response.data['current_page'], 1)
+        self.assertTrue(response.data['has_more'])
+        self.assertIsNotNone(response.data['next'])
+        self.assertIsNone(response.data['previous'])
+        self.assertEqual(len(response.data['results']), 10)
+
+        response = self.client.get(response.data['next'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['current_page'], 2)
+        self.assertFalse(response.data['has_more'])
+        self.assertIsNone(response.data['next'])
+        self.assertIsNotNone(response.data['previous'])
+        self.assertEqual(len(response.data['results']), 5)
+    
+    def test_20_results_pagination_with_cached_count_for_unauthenticated_user_if_new_posts_are_created(self):
+        factories.CustomUsersFactory().save()
+
+        for i in range(1, 16):
+            factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title=f'Post {i}', read_permission='public').save()
+
+        response = self.client.get(self.endpoint, {'count': 'cached'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_count'], 15)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.endpoint, {'count': 'cached', 'page': 2})
+        self.assertEqual(response.data['total_count'], 15)
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 16', read_permission='public').save()
+
+        response = self.client.get(self.endpoint, {'count': 'cached'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_count'], 16)
+    
+    def test_21_cached_results_for_unauthenticated_user_are_invalidated_when_posts_change(self):
+        factories.CustomUsersFactory().save()
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', read_permission='public').save()
+
+        response = self.client.get(self.endpoint)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_count'], 1)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.endpoint)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_count'], 1)
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 2', read_permission='public').save()
+
+        response = self.client.get(self.endpoint)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_count'], 2)
+    
+    def test_22_cached_results_are_not_shared_between_visibility_classes(self):
+        factories.CustomUsersFactory().save()
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', read_permission='owner').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 2', read_permission='public').save()
+
+        response = self.client.get(self.endpoint)
+        self.assertEqual(response.data['total_count'], 1)
+
+        self.user.role = 'admin'
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get(self.endpoint)
+        self.assertEqual(response.data['total_count'], 2)
+    
+    def test_23_sparse_fieldset_for_unauthenticated_user_does_not_read_content(self):
+        factories.CustomUsersFactory().save()
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', content='Content 1', read_permission='public').save()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.endpoint, {'fields': 'id,title'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [{'id': 1, 'title': 'Post 1'}])
+        self.assertFalse(any('"content"' in query['sql'] for query in queries.captured_queries))
+    
+    def test_24_unknown_field_in_sparse_fieldset_for_unauthenticated_user(self):
+        response = self.client.get(self.endpoint, {'fields': 'id,password'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['errors'], ['Unknown fields: password. Available fields: id, author, title, content, read_permission, edit_permission, likes_count, comments_count, liked_by_me, like_count, comment_count.'])
+    
+    def test_25_filtered_results_for_authenticated_blogger(self):
+        self.user = factories.CustomUsersFactory(team='team 1')
+        self.user.save()
+        self.client.force_authenticate(user=self.user)
+
+        factories.CustomUsersFactory(email='test_2@example.com', team='team 2').save()
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', read_permission='owner').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=2), title='Post 2', read_permission='public').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=2), title='Post 3', read_permission='team').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=2), title='Post 4', read_permission='authenticated').save()
+
+        Posts.objects.filter(pk__in=[1, 2]).update(created_at='2024-01-01T10:00:00Z')
+        Posts.objects.filter(pk=4).update(created_at='2024-01-03T10:00:00Z')
+
+        response = self.client.get(self.endpoint, {'author': 2, 'fields': 'title'})
+        self.assertEqual(response.data['results'], [{'title': 'Post 2'}, {'title': 'Post 4'}])
+
+        response = self.client.get(self.endpoint, {'team': 'team 1', 'fields': 'title'})
+        self.assertEqual(response.data['results'], [{'title': 'Post 1'}])
+
+        response = self.client.get(self.endpoint, {'read_permission': 'authenticated', 'fields': 'title'})
+        self.assertEqual(response.data['results'], [{'title': 'Post 4'}])
+
+        response = self.client.get(self.endpoint, {'created_after': '2024-01-02', 'created_before': '2024-01-04', 'fields': 'title'})
+        self.assertEqual(response.data['total_count'], 1)
+        self.assertEqual(response.data['results'], [{'title': 'Post 4'}])
+
+        response = self.client.get(self.endpoint, {'created_before': '2024-01-01T12:00:00+00:00', 'author': 1, 'fields': 'title'})
+        self.assertEqual(response.data['results'], [{'title': 'Post 1'}])
+    
+    def test_26_invalid_filters_for_unauthenticated_user(self):
+        response = self.client.get(self.endpoint, {'author': 'me', 'read_permission': 'private', 'created_after': '2024-13-01', 'created_before': 'yesterday'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['errors'], [
+            'Author query param must be an integer (user id).',
+            'Read_permission query param must be one of: owner, team, authenticated, public.',
+            'Created_after query param must be an ISO 8601 date or datetime.',
+            'Created_before query param must be an ISO 8601 date or datetime.',
+        ])
+    
+    def test_27_compact_json_response_for_unauthenticated_user(self):
+        factories.CustomUsersFactory().save()
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Pöst 1', read_permission='public').save()
+
+        response = self.client.get(self.endpoint, {'fields': 'id,title'}, HTTP_ACCEPT='application/json')
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertIn('"results":[{"id":1,"title":"Pöst 1"}]'.encode(), response.content)
+
+        response = self.client.get(self.endpoint, {'fields': 'id,title'}, HTTP_ACCEPT='application/json; indent=2')
+        self.assertIn(b'"results": [\n', response.content)
+    
+    def test_28_liked_by_me_and_counts_are_only_included_on_request_for_authenticated_blogger(self):
+        self.user.save()
+        self.client.force_authenticate(user=self.user)
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', read_permission='public').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 2', read_permission='public').save()
+
+        factories.LikesFactory(user=CustomUsers.objects.get(pk=1), post=Posts.objects.get(pk=1)).save()
+        factories.CommentsFactory(user=CustomUsers.objects.get(pk=1), post=Posts.objects.get(pk=2), content='Comment 1').save()
+        factories.CommentsFactory(user=CustomUsers.objects.get(pk=1), post=Posts.objects.get(pk=2), content='Deleted', is_active=False).save()
+
+        response = self.client.get(self.endpoint)
+        self.assertNotIn('liked_by_me', response.data['results'][0])
+
+        # The count and a single page query, whatever the number of posts
+        with self.assertNumQueries(2):
+            response = self.client.get(self.endpoint, {'include': 'liked_by_me,like_count,comment_count'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(post['liked_by_me'], post['like_count'], post['comment_count']) for post in response.data['results']],
+            [(True, 1, 0), (False, 0, 1)]
+        )
+
+        response = self.client.get(self.endpoint, {'fields': 'id,liked_by_me'})
+        self.assertEqual(response.data['results'], [{'id': 1, 'liked_by_me': True}, {'id': 2, 'liked_by_me': False}])
+    
+    def test_29_cached_results_with_liked_by_me_are_personal_and_follow_the_likes_of_the_user(self):
+        self.user.save()
+        self.client.force_authenticate(user=self.user)
+
+        factories.CustomUsersFactory(email='test_2@example.com').save()
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', read_permission='public').save()
+
+        response = self.client.get(self.endpoint, {'include': 'liked_by_me'})
+        self.assertFalse(response.data['results'][0]['liked_by_me'])
+
+        self.client.post(reverse('posts-like', kwargs={'pk': 1}))
+
+        response = self.client.get(self.endpoint, {'include': 'liked_by_me'})
+        self.assertTrue(response.data['results'][0]['liked_by_me'])
+
+        self.client.force_authenticate(user=CustomUsers.objects.get(pk=2))
+
+        response = self.client.get(self.endpoint, {'include': 'liked_by_me'})
+        self.assertFalse(response.data['results'][0]['liked_by_me'])
+    
+    def test_30_liked_by_me_for_unauthenticated_user(self):
+        factories.CustomUsersFactory().save()
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', read_permission='public').save()
+
+        factories.LikesFactory(user=CustomUsers.objects.get(pk=1), post=Posts.objects.get(pk=1)).save()
+
+        response = self.client.get(self.endpoint, {'include': 'liked_by_me'})
+        self.assertFalse(response.data['results'][0]['liked_by_me'])
+
+        response = self.client.get(self.endpoint, {'include': 'liked_by_me,password'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['errors'], ['Unknown optional fields: password. Optional fields: liked_by_me, like_count, comment_count.'])
 
 
 class PostsRetrieve(APITestCase):
@@ -315,7 +583,7 @@ class PostsRetrieve(APITestCase):
 
         response = self.client.get(self.endpoint)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, {'author': 1, 'title': '', 'content': ''})
+        self.assertEqual(response.data, {'author': 1, 'title': '', 'content': '', 'likes_count': 0, 'comments_count': 0})
     
     def test_2_access_to_browsable_api_by_authenticated_bloggers(self):
         self.user.role = 'blogger'
@@ -328,7 +596,7 @@ class PostsRetrieve(APITestCase):
 
         response = self.client.get(self.endpoint)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, {'author': 2, 'title': '', 'content': ''})
+        self.assertEqual(response.data, {'author': 2, 'title': '', 'content': '', 'likes_count': 0, 'comments_count': 0})
     
     def test_3_access_to_browsable_api_by_unauthenticated_users(self):
         factories.CustomUsersFactory().save()
@@ -337,7 +605,7 @@ class PostsRetrieve(APITestCase):
 
         response = self.client.get(self.endpoint)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, {'author': 1, 'title': '', 'content': ''})
+        self.assertEqual(response.data, {'author': 1, 'title': '', 'content': '', 'likes_count': 0, 'comments_count': 0})
     
     def test_4_retrieve_posts_visible_for_authenticated_admin(self):
         self.user.role = 'admin'
@@ -353,7 +621,7 @@ class PostsRetrieve(APITestCase):
         for i in range(1, 5):
             response = self.client.get(reverse('posts-retrieve', kwargs={'pk': i}))
             self.assertEqual(response.status_code, status.HTTP_200_OK)
-            self.assertEqual(response.data, {'author': 1, 'title': f'Post {i}', 'content': ''})
+            self.assertEqual(response.data, {'author': 1, 'title': f'Post {i}', 'content': '', 'likes_count': 0, 'comments_count': 0})
     
     def test_5_retrieve_posts_visible_for_authenticated_blogger_if_posts_were_posted_by_blogger_from_same_team(self):
         self.user.role = 'blogger'
@@ -376,7 +644,7 @@ class PostsRetrieve(APITestCase):
             else:
                 response = self.client.get(reverse('posts-retrieve', kwargs={'pk': i}))
                 self.assertEqual(response.status_code, status.HTTP_200_OK)
-                self.assertEqual(response.data, {'author': 2, 'title': f'Post {i}', 'content': ''})
+                self.assertEqual(response.data, {'author': 2, 'title': f'Post {i}', 'content': '', 'likes_count': 0, 'comments_count': 0})
     
     def test_6_retrieve_posts_visible_for_authenticated_blogger_if_posts_were_posted_by_blogger_from_different_team(self):
         self.user.role = 'blogger'
@@ -398,7 +666,7 @@ class PostsRetrieve(APITestCase):
             else:
                 response = self.client.get(reverse('posts-retrieve', kwargs={'pk': i}))
                 self.assertEqual(response.status_code, status.HTTP_200_OK)
-                self.assertEqual(response.data, {'author': 2, 'title': f'Post {i}', 'content': ''})
+                self.assertEqual(response.data, {'author': 2, 'title': f'Post {i}', 'content': '', 'likes_count': 0, 'comments_count': 0})
     
     def test_7_retrieve_posts_visible_for_authenticated_blogger_if_posts_were_posted_by_him_or_herself(self):
         self.user.role = 'blogger'
@@ -413,7 +681,7 @@ class PostsRetrieve(APITestCase):
         for i in range(1, 5):
             response = self.client.get(reverse('posts-retrieve', kwargs={'pk': i}))
             self.assertEqual(response.status_code, status.HTTP_200_OK)
-            self.assertEqual(response.data, {'author': 1, 'title': f'Post {i}', 'content': ''})
+            self.assertEqual(response.data, {'author': 1, 'title': f'Post {i}', 'content': '', 'likes_count': 0, 'comments_count': 0})
     
     def test_8_retrieve_posts_visible_for_unauthenticated_user(self):
         factories.CustomUsersFactory().save()
@@ -427,7 +695,7 @@ class PostsRetrieve(APITestCase):
             if i == 4:
                 response = self.client.get(reverse('posts-retrieve', kwargs={'pk': i}))
                 self.assertEqual(response.status_code, status.HTTP_200_OK)
-                self.assertEqual(response.data, {'author': 1, 'title': f'Post {i}', 'content': ''})
+                self.assertEqual(response.data, {'author': 1, 'title': f'Post {i}', 'content': '', 'likes_count': 0, 'comments_count': 0})
             else:
                 response = self.client.get(reverse('posts-retrieve', kwargs={'pk': i}))
                 self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -447,7 +715,7 @@ class PostsRetrieve(APITestCase):
         for i in range(1, 5):
             response = self.client.get(reverse('posts-retrieve', kwargs={'pk': i}))
             self.assertEqual(response.status_code, status.HTTP_200_OK)
-            self.assertEqual(response.data, {'author': 1, 'title': f'Post {i}', 'content': ''})
+            self.assertEqual(response.data, {'author': 1, 'title': f'Post {i}', 'content': '', 'likes_count': 0, 'comments_count': 0})
     
     def test_10_retrieve_posts_visible_for_authenticated_blogger_if_he_or_she_is_author_of_all_posts_and_some_posts_were_deleted(self):
         self.user.role = 'blogger'
@@ -463,7 +731,7 @@ class PostsRetrieve(APITestCase):
             if i == 1 or i == 3:
                 response = self.client.get(reverse('posts-retrieve', kwargs={'pk': i}))
                 self.assertEqual(response.status_code, status.HTTP_200_OK)
-                self.assertEqual(response.data, {'author': 1, 'title': f'Post {i}', 'content': ''})
+                self.assertEqual(response.data, {'author': 1, 'title': f'Post {i}', 'content': '', 'likes_count': 0, 'comments_count': 0})
             else:
                 response = self.client.get(reverse('posts-retrieve', kwargs={'pk': i}))
                 self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -481,7 +749,7 @@ class PostsRetrieve(APITestCase):
             if i == 1 or i == 3:
                 response = self.client.get(reverse('posts-retrieve', kwargs={'pk': i}))
                 self.assertEqual(response.status_code, status.HTTP_200_OK)
-                self.assertEqual(response.data, {'author': 1, 'title': f'Post {i}', 'content': ''})
+                self.assertEqual(response.data, {'author': 1, 'title': f'Post {i}', 'content': '', 'likes_count': 0, 'comments_count': 0})
             else:
                 response = self.client.get(reverse('posts-retrieve', kwargs={'pk': i}))
                 self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -506,6 +774,85 @@ class PostsRetrieve(APITestCase):
         response = self.client.get(reverse('posts-retrieve', kwargs={'pk': 2}))
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         self.assertEqual(response.data['detail'], 'Not found.')
+    
+    def test_15_unchanged_post_is_not_sent_again_if_client_has_its_etag(self):
+        factories.CustomUsersFactory().save()
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', read_permission='public').save()
+
+        response = self.client.get(self.endpoint)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('ETag', response)
+        self.assertNotIn('Last-Modified', response)
+
+        etag = response['ETag']
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.endpoint, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+        post = Posts.objects.get(pk=1)
+        post.title = 'Post 1 (edited)'
+        post.save()
+
+        response = self.client.get(self.endpoint, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data['title'], 'Post 1 (edited)')
+    
+    def test_16_if_modified_since_alone_does_not_validate_the_client_copy(self):
+        factories.CustomUsersFactory().save()
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', read_permission='public').save()
+
+        response = self.client.get(self.endpoint, HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # Edits within the same second and counter changes leave updated_at's second as it was, the ETag catches them
+        etag = response['ETag']
+        Posts.objects.filter(pk=1).update(likes_count=1)
+
+        response = self.client.get(self.endpoint, HTTP_IF_NONE_MATCH=etag, HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['likes_count'], 1)
+    
+    def test_17_etag_of_post_not_visible_is_not_validated_for_unauthenticated_user(self):
+        factories.CustomUsersFactory().save()
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', read_permission='owner').save()
+
+        response = self.client.get(self.endpoint, HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+    
+    def test_18_sparse_fieldset_for_unauthenticated_user(self):
+        factories.CustomUsersFactory().save()
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', content='Content 1', read_permission='public').save()
+
+        response = self.client.get(self.endpoint)
+        etag = response['ETag']
+
+        response = self.client.get(self.endpoint, {'fields': 'title'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'title': 'Post 1'})
+        self.assertNotEqual(response['ETag'], etag)
+    
+    def test_19_liked_by_me_and_counts_on_request_for_authenticated_blogger(self):
+        self.user.save()
+        self.client.force_authenticate(user=self.user)
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', read_permission='public').save()
+
+        response = self.client.get(self.endpoint, {'include': 'liked_by_me,like_count'})
+        self.assertEqual(response.data, {'author': 1, 'title': 'Post 1', 'content': '', 'likes_count': 0, 'comments_count': 0, 'liked_by_me': False, 'like_count': 0})
+        etag = response['ETag']
+
+        self.client.post(reverse('posts-like', kwargs={'pk': 1}))
+
+        response = self.client.get(self.endpoint, {'include': 'liked_by_me,like_count'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data['liked_by_me'], response.data['like_count']), (True, 1))
 
 
 class PostsCreate(APITestCase):
@@ -618,6 +965,18 @@ class PostsCreate(APITestCase):
         response = self.client.post(self.endpoint, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(response.data['errors'], ['Post must have a title.', 'Post must have content.'])
+    
+    def test_12_new_post_creation_with_malformed_json_by_authenticated_user(self):
+        self.user.save()
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.post(self.endpoint, '{"title": "Post 1", "content": NaN}', content_type='application/json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue(response.data['detail'].startswith('JSON parse error'))
+
+        response = self.client.post(self.endpoint, '{"title": "Pöst 1", "content": "Content 1"}'.encode(), content_type='application/json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Posts.objects.get(pk=1).title, 'Pöst 1')
 
 
 class PostsUpdate(APITestCase):
@@ -888,7 +1247,34 @@ class PostsUpdate(APITestCase):
         response = self.client.put(reverse('posts-update', kwargs={'pk': 2}), data, format='json')
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         self.assertEqual(response.data['detail'], 'Not found.')
-        
+    
+    def test_18_post_update_writes_only_changed_columns_by_authenticated_blogger(self):
+        self.user.save()
+        self.client.force_authenticate(user=self.user)
+
+        factories.PostsFactory(author=self.user, title='Post 1', content='Content 1', read_permission='public').save()
+
+        etag = self.client.get(reverse('posts-retrieve', kwargs={'pk': 1}))['ETag']
+        updated_at = Posts.objects.get(pk=1).updated_at
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.put(self.endpoint, {'title': 'Post 1', 'content': 'Content 1', 'read_permission': 'public'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(any(query['sql'].startswith('UPDATE') for query in queries.captured_queries))
+        self.assertEqual(Posts.objects.get(pk=1).updated_at, updated_at)
+        self.assertEqual(self.client.get(reverse('posts-retrieve', kwargs={'pk': 1}))['ETag'], etag)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.put(self.endpoint, {'title': 'UPDATED POST 1', 'content': 'Content 1'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], 'UPDATED POST 1')
+
+        updates = [query['sql'] for query in queries.captured_queries if query['sql'].startswith('UPDATE "posts_posts"')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"title"', updates[0])
+        self.assertNotIn('"content"', updates[0])
+        self.assertNotEqual(self.client.get(reverse('posts-retrieve', kwargs={'pk': 1}))['ETag'], etag)
+
 
 class PostsDelete(APITestCase):
     def setUp(self):
@@ -1060,3 +1446,566 @@ class PostsDelete(APITestCase):
         response = self.client.delete(reverse('posts-delete', kwargs={'pk': 2}), format='json')
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         self.assertEqual(response.data['detail'], 'Not found.')
+    
+    def test_13_post_deletion_is_a_single_update_that_removes_the_post_from_the_feeds(self):
+        self.user.role = 'blogger'
+        self.user.save()
+        self.client.force_authenticate(user=self.user)
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), read_permission='public', edit_permission='owner').save()
+        self.assertTrue(FeedEntries.objects.filter(post_id=1).exists())
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.delete(self.endpoint, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Posts.objects.get(pk=1).is_active)
+        self.assertFalse(FeedEntries.objects.filter(post_id=1).exists())
+        self.assertEqual([query['sql'].split()[0] for query in queries if 'posts_posts' in query['sql'].split('WHERE')[0]], ['UPDATE'])
+
+
+class PostsVisibilityIndexes(APITestCase):
+
+    def setUp(self):
+        self.user = factories.CustomUsersFactory()
+
+    def test_1_read_visibility_filter_for_unauthenticated_users_uses_read_permission_index(self):
+        plan = get_posts_queryset(AnonymousUser(), 'GET').explain()
+        self.assertIn('posts_read_created_active_idx', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+    
+    def test_2_posts_ordering_for_authenticated_admins_uses_created_at_index(self):
+        self.user.role = 'admin'
+
+        plan = get_posts_queryset(self.user, 'GET').explain()
+        self.assertIn('posts_created_idx', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+    
+    def test_3_posts_list_filters_never_scan_the_posts_table(self):
+        viewers = [
+            (AnonymousUser(), 'GET'),
+            (CustomUsers(pk=1, role='blogger', team='team 1'), 'GET'),
+            (CustomUsers(pk=1, role='blogger', team='team 1'), 'PATCH'),
+            (CustomUsers(role='admin'), 'GET'),
+        ]
+        filters = [
+            {'author': '1'},
+            {'team': 'team 1'},
+            {'read_permission': 'team'},
+            {'created_after': '2024-01-01'},
+            {'created_before': '2024-01-01'},
+            {'author': '1', 'team': 'team 1', 'created_after': '2024-01-01'},
+        ]
+
+        for user, method in viewers:
+            for params in filters:
+                plan = filter_posts(get_posts_queryset(user, method), params)[:10].explain()
+
+                with self.subTest(user=get_visibility_key(user), method=method, params=params):
+                    self.assertNotIn('SCAN posts_posts', plan)
+    
+    def test_4_every_branch_of_the_visibility_filter_for_authenticated_bloggers_uses_a_partial_index(self):
+        blogger = CustomUsers(pk=1, role='blogger', team='team 1')
+
+        for method, indexes in (('GET', ['posts_read_created_active_idx', 'posts_read_team_created_idx']), ('PATCH', ['posts_edit_created_active_idx', 'posts_edit_team_created_idx'])):
+            plan = get_posts_queryset(blogger, method)[:10].explain()
+
+            with self.subTest(method=method):
+                self.assertNotIn('SCAN posts_posts', plan)
+
+                for index in indexes:
+                    self.assertIn(index, plan)
+    
+    def test_5_active_likes_and_comments_of_a_post_use_partial_indexes(self):
+        self.assertIn('likes_post_active_idx', Likes.objects.filter(post_id=1, is_active=True)[:10].explain())
+        self.assertIn('comments_post_active_idx', Comments.objects.filter(post_id=1, is_active=True)[:10].explain())
+
+
+class PostsCountersReconciliation(APITestCase):
+
+    def test_1_drifted_likes_and_comments_counts_are_fixed(self):
+        factories.CustomUsersFactory().save()
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 2', likes_count=5, comments_count=3).save()
+
+        factories.LikesFactory(user=CustomUsers.objects.get(pk=1), post=Posts.objects.get(pk=1)).save()
+        factories.CommentsFactory(user=CustomUsers.objects.get(pk=1), post=Posts.objects.get(pk=1)).save()
+        factories.CommentsFactory(user=CustomUsers.objects.get(pk=1), post=Posts.objects.get(pk=1), is_active=False).save()
+
+        output = StringIO()
+        call_command('reconcile_post_counters', batch_size=1, stdout=output)
+        self.assertIn('2 posts checked, 2 fixed', output.getvalue())
+        self.assertEqual(list(Posts.objects.order_by('id').values_list('likes_count', 'comments_count')), [(1, 1), (0, 0)])
+
+
+class PostsBatchRetrieve(APITestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.endpoint = reverse('posts-batch')
+        self.user = factories.CustomUsersFactory()
+    
+    def test_1_batch_retrieve_posts_visible_for_authenticated_blogger_with_one_query(self):
+        self.user.role = 'blogger'
+        self.user.team = 'team 1'
+        self.user.save()
+        self.client.force_authenticate(user=self.user)
+
+        factories.CustomUsersFactory(email='test_2@example.com', team='team 2').save()
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=2), title='Post 1', read_permission='owner').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=2), title='Post 2', read_permission='public').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 3', read_permission='owner').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=2), title='Post 4', read_permission='public', is_active=False).save()
+
+        visibility_index.sync()
+
+        # The posts and the split of the missing ones between forbidden and not_found
+        with self.assertNumQueries(2):
+            response = self.client.get(self.endpoint, {'ids': '3,1,2,4,5', 'fields': 'title'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], {
+            '3': {'title': 'Post 3'},
+            '1': {'error': 'forbidden'},
+            '2': {'title': 'Post 2'},
+            '4': {'error': 'not_found'},
+            '5': {'error': 'not_found'},
+        })
+        self.assertEqual(list(response.data['results']), ['3', '1', '2', '4', '5'])
+    
+    def test_2_batch_retrieve_all_posts_visible_for_authenticated_admin_with_one_query(self):
+        self.user.role = 'admin'
+        self.client.force_authenticate(user=self.user)
+
+        factories.CustomUsersFactory().save()
+
+        for i in range(1, 4):
+            factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title=f'Post {i}', read_permission='owner').save()
+
+        # Tests never commit, so the visibility index is reloaded (once) instead of patched
+        visibility_index.sync()
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.endpoint, {'ids': '1,2,3'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([post['title'] for post in response.data['results'].values()], ['Post 1', 'Post 2', 'Post 3'])
+    
+    def test_3_batch_retrieve_posts_the_index_doesnt_know_for_unauthenticated_user(self):
+        factories.CustomUsersFactory().save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', read_permission='public').save()
+        visibility_index.sync()
+
+        # Created and changed by another process: this copy of the index never hears of them
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 2', read_permission='public').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 3', read_permission='public').save()
+        Posts.objects.filter(pk=3).update(read_permission='owner')
+
+        response = self.client.get(self.endpoint, {'ids': '1,2,3,4', 'fields': 'title'})
+        self.assertEqual(response.data['results'], {
+            '1': {'title': 'Post 1'},
+            '2': {'title': 'Post 2'},
+            '3': {'error': 'forbidden'},
+            '4': {'error': 'not_found'},
+        })
+        self.assertEqual(self.client.get(reverse('posts-retrieve', kwargs={'pk': 2})).status_code, status.HTTP_200_OK)
+    
+    def test_4_batch_retrieve_without_ids_for_unauthenticated_user(self):
+        response = self.client.get(self.endpoint)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['errors'], ['No query param in the URL (ids).'])
+
+        response = self.client.get(self.endpoint, {'ids': '1,a'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['errors'], ['Ids query param must be a comma-separated list of integers.'])
+    
+    def test_5_batch_retrieve_too_many_posts_for_unauthenticated_user(self):
+        response = self.client.get(self.endpoint, {'ids': ','.join(str(i) for i in range(1, 102))})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['errors'], ['No more than 100 ids per request.'])
+
+
+class PostsSearch(APITestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.endpoint = reverse('posts-search')
+        self.user = factories.CustomUsersFactory()
+        self.user.save()
+    
+    def test_1_search_posts_ranked_by_relevance_for_unauthenticated_user(self):
+        factories.PostsFactory(author=self.user, title='Cooking at home', content='A post about django', read_permission='public').save()
+        factories.PostsFactory(author=self.user, title='Django tips', content='Some tips', read_permission='public').save()
+        factories.PostsFactory(author=self.user, title='Gardening', content='Nothing to see', read_permission='public').save()
+
+        response = self.client.get(self.endpoint, {'q': 'django'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_count'], 2)
+        self.assertEqual([post['title'] for post in response.data['results']], ['Django tips', 'Cooking at home'])
+    
+    def test_2_search_posts_visible_for_unauthenticated_user(self):
+        factories.PostsFactory(author=self.user, title='Django 1', read_permission='public').save()
+        factories.PostsFactory(author=self.user, title='Django 2', read_permission='authenticated').save()
+        factories.PostsFactory(author=self.user, title='Django 3', read_permission='owner').save()
+
+        response = self.client.get(self.endpoint, {'q': 'django', 'fields': 'title'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [{'title': 'Django 1'}])
+
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get(self.endpoint, {'q': 'django', 'fields': 'title'})
+        self.assertEqual(response.data['total_count'], 3)
+    
+    def test_3_search_index_follows_updates_and_soft_deletes(self):
+        factories.PostsFactory(author=self.user, title='Post 1', content='Old content', read_permission='public').save()
+        factories.PostsFactory(author=self.user, title='Post 2', content='Old content', read_permission='public').save()
+
+        Posts.objects.filter(pk=1).update(content='New content')
+        Posts.objects.filter(pk=2).update(is_active=False)
+
+        self.assertEqual(Posts.objects.search('old'), [])
+        self.assertEqual(Posts.objects.search('new content'), [1])
+
+        Posts.objects.filter(pk=2).update(is_active=True)
+        Posts.objects.filter(pk=1).delete()
+
+        self.assertEqual(Posts.objects.search('content'), [2])
+    
+    def test_4_search_posts_with_query_syntax_for_unauthenticated_user(self):
+        factories.PostsFactory(author=self.user, title='Post "quoted" AND (special)', read_permission='public').save()
+
+        response = self.client.get(self.endpoint, {'q': '"quoted" AND (special'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_count'], 1)
+
+        response = self.client.get(self.endpoint, {'q': 'title:NEAR'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_count'], 0)
+    
+    def test_5_search_posts_without_query_for_unauthenticated_user(self):
+        response = self.client.get(self.endpoint, {'q': ' '})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['errors'], ['No query param in the URL (q).'])
+    
+    @override_settings(POSTS_SEARCH_MAX_RESULTS=2)
+    def test_6_search_limit_applies_to_posts_visible_for_unauthenticated_user(self):
+        # The best matches are the ones the user can't read
+        for i in range(1, 4):
+            factories.PostsFactory(author=self.user, title=f'Django {i}', content='Django', read_permission='owner').save()
+
+        factories.PostsFactory(author=self.user, title='Post 4', content='About django', read_permission='public').save()
+        factories.PostsFactory(author=self.user, title='Post 5', content='About django too', read_permission='public').save()
+
+        response = self.client.get(self.endpoint, {'q': 'django', 'fields': 'title'})
+        self.assertEqual(response.data['total_count'], 2)
+        self.assertEqual(response.data['results'], [{'title': 'Post 4'}, {'title': 'Post 5'}])
+
+
+class PostsTrending(APITestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.endpoint = reverse('posts-trending')
+        self.user = factories.CustomUsersFactory(team='team 1')
+        self.user.save()
+    
+    def create_engagement(self):
+        factories.CustomUsersFactory(email='test_2@example.com', team='team 2').save()
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', read_permission='public').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 2', read_permission='public').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=2), title='Post 3', read_permission='owner').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 4', read_permission='public').save()
+
+        # Post 1: two likes of 2 days ago, Post 2: a comment of 1 day ago, Post 3: two new likes, Post 4: a like outside of the window
+        for user in (1, 2):
+            factories.LikesFactory(user=CustomUsers.objects.get(pk=user), post=Posts.objects.get(pk=1)).save()
+            factories.LikesFactory(user=CustomUsers.objects.get(pk=user), post=Posts.objects.get(pk=3)).save()
+
+        factories.CommentsFactory(user=CustomUsers.objects.get(pk=2), post=Posts.objects.get(pk=2)).save()
+        factories.LikesFactory(user=CustomUsers.objects.get(pk=2), post=Posts.objects.get(pk=4)).save()
+
+        Likes.objects.filter(post=1).update(updated_at=timezone.now() - timedelta(days=2))
+        Likes.objects.filter(post=4).update(updated_at=timezone.now() - timedelta(days=8))
+        Comments.objects.filter(post=2).update(created_at=timezone.now() - timedelta(days=1))
+
+        output = StringIO()
+        call_command('compute_trending', stdout=output)
+        self.assertIn('3 trending posts scored', output.getvalue())
+    
+    def test_1_trending_posts_visible_for_unauthenticated_user(self):
+        self.create_engagement()
+
+        response = self.client.get(self.endpoint, {'fields': 'title'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [{'title': 'Post 2'}, {'title': 'Post 1'}])
+    
+    def test_2_trending_posts_visible_for_authenticated_blogger(self):
+        self.create_engagement()
+        self.client.force_authenticate(user=CustomUsers.objects.get(pk=2))
+
+        response = self.client.get(self.endpoint, {'fields': 'title', 'limit': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [{'title': 'Post 3'}, {'title': 'Post 2'}])
+    
+    def test_3_trending_posts_with_invalid_limit_for_unauthenticated_user(self):
+        for limit in ('0', '101', 'ten'):
+            response = self.client.get(self.endpoint, {'limit': limit})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(response.data['errors'], ['Limit query param must be an integer between 1 and 100.'])
+
+
+class PostsExport(APITestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.endpoint = reverse('posts-export')
+        self.user = factories.CustomUsersFactory()
+        self.user.save()
+
+        for i in range(1, 6):
+            factories.PostsFactory(author=self.user, title=f'Post {i}', content=f'Content {i}', read_permission='public' if i % 2 else 'owner').save()
+    
+    def read_lines(self, response):
+        return [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+    
+    def test_1_export_posts_visible_for_unauthenticated_user_in_chunks(self):
+        with mock.patch.object(PostsExportAPIView, 'chunk_size', 2):
+            response = self.client.get(self.endpoint, {'fields': 'id,title'})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+            self.assertEqual(self.read_lines(response), [{'id': 1, 'title': 'Post 1'}, {'id': 3, 'title': 'Post 3'}, {'id': 5, 'title': 'Post 5'}])
+    
+    def test_2_export_filtered_posts_visible_for_authenticated_blogger_gzipped(self):
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get(self.endpoint, {'read_permission': 'owner'}, HTTP_ACCEPT_ENCODING='gzip, deflate')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+
+        lines = [json.loads(line) for line in gzip.decompress(b''.join(response.streaming_content)).splitlines()]
+        self.assertEqual([post['title'] for post in lines], ['Post 2', 'Post 4'])
+        self.assertEqual(lines[0], PostsListModelSerializer(Posts.objects.get(pk=2)).data)
+    
+    def test_3_export_with_invalid_params_for_unauthenticated_user(self):
+        response = self.client.get(self.endpoint, {'fields': 'password'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(self.endpoint, {'author': 'me'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['errors'], ['Author query param must be an integer (user id).'])
+
+
+class PostsBulkCreate(APITestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.endpoint = reverse('posts-bulk_create')
+        self.user = factories.CustomUsersFactory(team='team 1')
+        self.user.save()
+    
+    def test_1_bulk_creation_of_posts_by_authenticated_user_in_one_insert(self):
+        self.client.force_authenticate(user=self.user)
+
+        data = [
+            {'title': f'Post {i}', 'content': f'Content {i}', 'read_permission': 'public'}
+            for i in range(1, 51)
+        ]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.endpoint, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 50)
+        self.assertEqual(response.data[0], {'id': 1, 'author': 1, 'title': 'Post 1', 'content': 'Content 1', 'read_permission': 'public', 'edit_permission': 'owner', 'likes_count': 0, 'comments_count': 0})
+        self.assertEqual(sum(query['sql'].startswith('INSERT INTO "posts_posts"') for query in queries.captured_queries), 1)
+        self.assertEqual(Posts.objects.filter(author_team='team 1').count(), 50)
+        self.assertEqual(Posts.objects.search('content 50'), [50])
+
+        response = self.client.get(reverse('posts-feed'))
+        self.assertEqual(response.data['total_count'], 50)
+    
+    def test_2_bulk_creation_with_invalid_posts_by_authenticated_user_creates_none(self):
+        self.client.force_authenticate(user=self.user)
+
+        factories.PostsFactory(author=self.user, title='Post 1').save()
+
+        data = [
+            {'title': 'Post 1', 'content': 'Content 1'},
+            {'title': 'Post 2', 'content': 'Content 2'},
+            {'title': 'Post 2', 'content': ''},
+            {'title': 'Post 4', 'content': 'Content 4', 'read_permission': 'everybody'},
+            'Post 5',
+            {'content': 'Content 6'},
+        ]
+
+        response = self.client.post(self.endpoint, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['errors'], [
+            {'index': 0, 'errors': ['posts with this title already exists.']},
+            {'index': 2, 'errors': ['Title is repeated in post 1.', 'Post must have content.']},
+            {'index': 3, 'errors': ['read_permission: "everybody" is not a valid choice.']},
+            {'index': 4, 'errors': ['Invalid data. Expected a dictionary, but got str.']},
+            {'index': 5, 'errors': ['Post must have a title.']},
+        ])
+        self.assertEqual(Posts.objects.count(), 1)
+    
+    def test_3_bulk_creation_with_invalid_body_by_authenticated_user(self):
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.post(self.endpoint, {'title': 'Post 1', 'content': 'Content 1'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['errors'], ['Request body must be a non-empty list of posts.'])
+
+        response = self.client.post(self.endpoint, [{'title': f'Post {i}', 'content': 'Content'} for i in range(501)], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['errors'], ['No more than 500 posts per request.'])
+    
+    def test_4_forbidden_bulk_creation_by_unauthenticated_user(self):
+        response = self.client.post(self.endpoint, [{'title': 'Post 1', 'content': 'Content 1'}], format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class PostsBulkDelete(APITestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.endpoint = reverse('posts-bulk_delete')
+        self.user = factories.CustomUsersFactory(team='team 1')
+        self.user.save()
+
+        factories.CustomUsersFactory(email='test_2@example.com', team='team 2').save()
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', read_permission='public').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=2), title='Post 2', read_permission='public', edit_permission='authenticated').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=2), title='Post 3', read_permission='public').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 4', read_permission='public', is_active=False).save()
+    
+    def test_1_bulk_deletion_of_posts_with_edit_permission_by_authenticated_blogger_in_one_update(self):
+        self.client.force_authenticate(user=self.user)
+
+        self.assertEqual(self.client.get(reverse('posts-list')).data['total_count'], 3)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.endpoint, {'ids': [1, 2, 3, 4]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'deleted': 2})
+        self.assertEqual(sum(query['sql'].startswith('UPDATE "posts_posts"') for query in queries.captured_queries), 1)
+        self.assertEqual(list(Posts.objects.filter(is_active=True).values_list('id', flat=True)), [3])
+
+        self.assertEqual(self.client.get(reverse('posts-list')).data['total_count'], 1)
+        self.assertEqual(self.client.get(reverse('posts-feed')).data['total_count'], 1)
+    
+    def test_2_bulk_deletion_of_filtered_posts_by_authenticated_admin(self):
+        self.user.role = 'admin'
+        self.user.save()
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.post(self.endpoint, {'filters': {'author': 2}}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'deleted': 2})
+        self.assertEqual(list(Posts.objects.filter(is_active=True).values_list('id', flat=True)), [1])
+    
+    def test_3_bulk_deletion_without_valid_selection_by_authenticated_blogger(self):
+        self.client.force_authenticate(user=self.user)
+
+        for data, message in [
+            ({}, 'Send ids and/or filters to select the posts.'),
+            ({'ids': [1, 'a']}, 'Ids must be a list of integers.'),
+            ({'filters': 'author=1'}, 'Filters must be an object.'),
+            ({'ids': list(range(1001))}, 'No more than 1000 ids per request.'),
+            ({'filters': {'read_permission': 'everybody'}}, 'Read_permission query param must be one of: owner, team, authenticated, public.'),
+        ]:
+            response = self.client.post(self.endpoint, data, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(response.data['errors'], [message])
+
+        self.assertEqual(Posts.objects.filter(is_active=True).count(), 3)
+    
+    def test_4_forbidden_bulk_deletion_by_unauthenticated_user(self):
+        response = self.client.post(self.endpoint, {'ids': [1]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+    
+    def test_5_bulk_deletion_with_unknown_or_blank_filters_by_authenticated_admin(self):
+        self.user.role = 'admin'
+        self.user.save()
+        self.client.force_authenticate(user=self.user)
+
+        for data, messages in [
+            ({'filters': {'auhtor': 99}}, ['Unknown filters: auhtor. Filters: author, team, read_permission, created_after, created_before.']),
+            ({'filters': {'team': ''}}, ['Filters can\'t be blank: team.']),
+            ({'filters': {'author': None, 'created_after': ' '}}, ['Filters can\'t be blank: author, created_after.']),
+            ({'filters': {'teams': 'team 1', 'team': ''}}, [
+                'Unknown filters: teams. Filters: author, team, read_permission, created_after, created_before.', 'Filters can\'t be blank: team.'
+            ]),
+            ({'filters': {}}, ['Send ids and/or filters to select the posts.']),
+        ]:
+            with self.subTest(data=data):
+                response = self.client.post(self.endpoint, data, format='json')
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertEqual(response.data['errors'], messages)
+
+        self.assertEqual(Posts.objects.filter(is_active=True).count(), 3)
+
+
+class PostsBulkUpdatePermissions(APITestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.endpoint = reverse('posts-bulk_update_permissions')
+        self.user = factories.CustomUsersFactory(team='team 1')
+        self.user.save()
+
+        factories.CustomUsersFactory(email='test_2@example.com', team='team 2').save()
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', read_permission='public').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 2', read_permission='owner').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=2), title='Post 3', read_permission='public').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=2), title='Post 4', read_permission='public', edit_permission='team').save()
+    
+    def test_1_bulk_permissions_change_of_posts_with_edit_permission_by_authenticated_blogger(self):
+        self.client.force_authenticate(user=CustomUsers.objects.get(pk=2))
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.endpoint, {'read_permission': 'owner', 'edit_permission': 'owner', 'filters': {'created_after': '2024-01-01'}}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'updated': 2})
+        self.assertEqual(sum(query['sql'].startswith('UPDATE "posts_posts"') for query in queries.captured_queries), 1)
+        self.assertEqual(list(Posts.objects.order_by('id').values_list('read_permission', 'edit_permission')), [
+            ('public', 'owner'), ('owner', 'owner'), ('owner', 'owner'), ('owner', 'owner')
+        ])
+
+        response = self.client.post(self.endpoint, {'read_permission': 'owner', 'filters': {'author': 2}}, format='json')
+        self.assertEqual(response.data, {'updated': 0})
+
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get(reverse('posts-feed'), {'fields': 'title'})
+        self.assertEqual(response.data['results'], [{'title': 'Post 2'}, {'title': 'Post 1'}])
+    
+    def test_2_bulk_permissions_change_with_invalid_permissions_by_authenticated_blogger(self):
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.post(self.endpoint, {'ids': [1]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['errors'], ['Send read_permission and/or edit_permission.'])
+
+        response = self.client.post(self.endpoint, {'ids': [1], 'read_permission': 'everybody'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['errors'], ['Read_permission must be one of: owner, team, authenticated, public.'])
+    
+    def test_3_bulk_permissions_change_with_unknown_or_blank_filters_by_authenticated_admin(self):
+        self.user.role = 'admin'
+        self.user.save()
+        self.client.force_authenticate(user=self.user)
+
+        for filters, message in [
+            ({'auhtor': 99}, 'Unknown filters: auhtor. Filters: author, team, read_permission, created_after, created_before.'),
+            ({'team': ''}, 'Filters can\'t be blank: team.'),
+        ]:
+            with self.subTest(filters=filters):
+                response = self.client.post(self.endpoint, {'read_permission': 'owner', 'filters': filters}, format='json')
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertEqual(response.data['errors'], [message])
+
+        self.assertEqual(Posts.objects.filter(read_permission='owner').count(), 1)
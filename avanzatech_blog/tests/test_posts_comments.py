@@ -1,4 +1,9 @@
+# PYTHON IMPORTS
+from unittest import mock
+
 # DJANGO IMPORTS
+from django.db import DatabaseError, connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 # DJANGO REST FRAMEWORK IMPORTS
@@ -478,6 +483,19 @@ class PostsComment(APITestCase):
         response = self.client.post(reverse('posts-comment', kwargs={'pk': 2}), data, format='json')
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         self.assertEqual(response.data['detail'], 'Not found.')
+    
+    def test_12_comment_is_not_saved_if_comments_count_of_post_cannot_be_updated(self):
+        self.user.save()
+        self.client.force_authenticate(user=self.user)
+
+        factories.PostsFactory(author=self.user, title='Post 1').save()
+
+        with mock.patch.object(Posts.objects, 'add_to_counter', side_effect=DatabaseError):
+            with self.assertRaises(DatabaseError):
+                self.client.post(self.endpoint, {'content': 'Lorem Ipsum'}, format='json')
+
+        self.assertFalse(Comments.objects.exists())
+        self.assertEqual(Posts.objects.get(pk=1).comments_count, 0)
 
 
 class PostsDeleteComment(APITestCase):
@@ -584,3 +602,40 @@ class PostsDeleteComment(APITestCase):
             self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
             self.assertEqual(response.data, None)
             self.assertFalse(Comments.objects.get(post__id=i).is_active)
+    
+    def test_8_comment_and_comment_deletion_update_comments_count_of_post_for_authenticated_admin(self):
+        self.user.role = 'admin'
+        self.user.save()
+        self.client.force_authenticate(user=self.user)
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', read_permission='public').save()
+
+        response = self.client.post(reverse('posts-comment', kwargs={'pk': 1}), {'content': 'Comment 1'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Posts.objects.get(pk=1).comments_count, 1)
+
+        for _ in range(2):
+            response = self.client.delete(reverse('posts-delete_comment', kwargs={'pk': 1}) + '?comment_id=1')
+            self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+            self.assertEqual(Posts.objects.get(pk=1).comments_count, 0)
+    
+    def test_9_comment_deletion_is_a_single_update_and_only_counts_once(self):
+        self.user.role = 'admin'
+        self.user.save()
+        self.client.force_authenticate(user=self.user)
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), read_permission='public').save()
+        factories.CommentsFactory(user=CustomUsers.objects.get(pk=1), post=Posts.objects.get(pk=1)).save()
+        Posts.objects.filter(pk=1).update(comments_count=1)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.delete(self.endpoint)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Comments.objects.get(pk=1).is_active)
+        self.assertEqual([query['sql'].split()[0] for query in queries if 'comments_comments' in query['sql'].split('WHERE')[0]], ['UPDATE'])
+
+        # Deleting it again (admins only) writes nothing
+        response = self.client.delete(self.endpoint)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(Posts.objects.get(pk=1).comments_count, 0)
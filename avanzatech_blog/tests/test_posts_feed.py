@@ -0,0 +1,130 @@
+# PYTHON IMPORTS
+from io import StringIO
+
+# DJANGO IMPORTS
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+
+# DJANGO REST FRAMEWORK IMPORTS
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+
+# MODELS
+from user.models import CustomUsers
+from posts.models import Posts, FeedEntries
+
+# FACTORIES
+from . import factories
+
+
+class PostsFeed(APITestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+        self.endpoint = reverse('posts-feed')
+
+        factories.CustomUsersFactory(email='test_1@example.com', team='team 1').save()
+        factories.CustomUsersFactory(email='test_2@example.com', team='team 1').save()
+        factories.CustomUsersFactory(email='test_3@example.com', team='team 2').save()
+
+        self.user = CustomUsers.objects.get(pk=1)
+    
+    def create_posts(self):
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', read_permission='owner').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=2), title='Post 2', read_permission='owner').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=2), title='Post 3', read_permission='team').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=3), title='Post 4', read_permission='team').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=3), title='Post 5', read_permission='authenticated').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=3), title='Post 6', read_permission='public').save()
+    
+    def get_feed_titles(self):
+        response = self.client.get(self.endpoint, {'fields': 'title'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return [post['title'] for post in response.data['results']]
+    
+    def test_1_feed_for_authenticated_blogger_newest_first(self):
+        self.client.force_authenticate(user=self.user)
+
+        self.create_posts()
+
+        self.assertEqual(self.get_feed_titles(), ['Post 6', 'Post 5', 'Post 3', 'Post 1'])
+        self.assertEqual(FeedEntries.objects.filter(audience='user:1').count(), 4)
+    
+    def test_2_feed_for_authenticated_admin_shows_every_post(self):
+        self.user.role = 'admin'
+        self.user.save()
+        self.client.force_authenticate(user=self.user)
+
+        self.create_posts()
+        Posts.objects.filter(pk=2).update(is_active=False)
+
+        self.assertEqual(self.get_feed_titles(), ['Post 6', 'Post 5', 'Post 4', 'Post 3', 'Post 2', 'Post 1'])
+        self.assertFalse(FeedEntries.objects.filter(audience='user:1').exists())
+    
+    def test_3_feed_for_unauthenticated_user(self):
+        response = self.client.get(self.endpoint)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+    
+    def test_4_feed_follows_permission_changes_and_soft_deletes(self):
+        self.client.force_authenticate(user=self.user)
+
+        self.create_posts()
+
+        post = Posts.objects.get(pk=6)
+        post.read_permission = 'owner'
+        post.save()
+
+        post = Posts.objects.get(pk=3)
+        post.is_active = False
+        post.save()
+
+        post = Posts.objects.get(pk=4)
+        post.read_permission = 'public'
+        post.save()
+
+        self.assertEqual(self.get_feed_titles(), ['Post 5', 'Post 4', 'Post 1'])
+    
+    def test_5_feed_of_new_users_and_users_changing_team(self):
+        self.create_posts()
+
+        factories.CustomUsersFactory(email='test_4@example.com', team='team 2').save()
+        self.client.force_authenticate(user=CustomUsers.objects.get(pk=4))
+
+        self.assertEqual(self.get_feed_titles(), ['Post 6', 'Post 5', 'Post 4'])
+
+        superuser = factories.CustomUsersFactory(email='admin@example.com', role='admin', is_superuser=True)
+        superuser.save()
+        self.client.force_authenticate(user=superuser)
+
+        response = self.client.put(reverse('users-update', kwargs={'pk': 2}), {'team': 'team 2'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.client.force_authenticate(user=CustomUsers.objects.get(pk=1))
+        self.assertEqual(self.get_feed_titles(), ['Post 6', 'Post 5', 'Post 1'])
+
+        self.client.force_authenticate(user=CustomUsers.objects.get(pk=2))
+        self.assertEqual(self.get_feed_titles(), ['Post 6', 'Post 5', 'Post 4', 'Post 3', 'Post 2'])
+    
+    @override_settings(FEED_FANOUT_LIMIT=1)
+    def test_6_feed_in_hybrid_mode_for_big_audiences(self):
+        self.client.force_authenticate(user=self.user)
+
+        self.create_posts()
+
+        self.assertEqual(list(FeedEntries.objects.filter(post=5).values_list('audience', flat=True)), ['all'])
+        self.assertEqual(list(FeedEntries.objects.filter(post=3).values_list('audience', flat=True)), ['team:team 1'])
+        self.assertEqual(list(FeedEntries.objects.filter(post=4).values_list('audience', flat=True)), ['user:3'])
+        self.assertEqual(self.get_feed_titles(), ['Post 6', 'Post 5', 'Post 3', 'Post 1'])
+    
+    def test_7_backfill_command_rewrites_every_feed_entry(self):
+        self.client.force_authenticate(user=self.user)
+
+        self.create_posts()
+        FeedEntries.objects.all().delete()
+
+        output = StringIO()
+        call_command('backfill_feed', batch_size=2, stdout=output)
+        self.assertIn('6 posts fanned out, 11 feed entries written', output.getvalue())
+        self.assertEqual(self.get_feed_titles(), ['Post 6', 'Post 5', 'Post 3', 'Post 1'])
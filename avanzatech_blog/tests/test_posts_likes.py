@@ -1,4 +1,8 @@
+# PYTHON IMPORTS
+from unittest import mock
+
 # DJANGO IMPORTS
+from django.db import IntegrityError, connection
 from django.urls import reverse
 
 # DJANGO REST FRAMEWORK IMPORTS
@@ -302,6 +306,25 @@ class PostsListLikes(APITestCase):
         self.assertIsNotNone(response.data['next'])
         self.assertIsNone(response.data['previous'])
         self.assertEqual(len(response.data['results']), 20)
+    
+    def test_16_results_pagination_without_count_for_unauthenticated_user_if_all_posts_have_public_read_permission(self):
+        factories.CustomUsersFactory(email='test_1@example.com').save()
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', read_permission='public').save()
+
+        for i in range(1, 31):
+            factories.CustomUsersFactory(email=f'test_{i + 1}@example.com').save()
+
+            factories.LikesFactory(user=CustomUsers.objects.get(pk=i + 1), post=Posts.objects.get(pk=1)).save()
+
+        response = self.client.get(self.endpoint, {'count': 'false', 'page': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['current_page'], 2)
+        self.assertFalse(response.data['has_more'])
+        self.assertNotIn('total_count', response.data)
+        self.assertIsNone(response.data['next'])
+        self.assertIsNotNone(response.data['previous'])
+        self.assertEqual(len(response.data['results']), 10)
 
 
 class PostsLike(APITestCase):
@@ -528,3 +551,53 @@ class PostsLike(APITestCase):
         response = self.client.post(reverse('posts-like', kwargs={'pk': 2}))
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         self.assertEqual(response.data['detail'], 'Not found.')
+    
+    def test_15_like_and_unlike_update_likes_count_of_post_for_authenticated_blogger(self):
+        self.user.role = 'blogger'
+        self.user.save()
+        self.client.force_authenticate(user=self.user)
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', read_permission='public').save()
+
+        response = self.client.post(reverse('posts-like', kwargs={'pk': 1}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Posts.objects.get(pk=1).likes_count, 1)
+
+        response = self.client.post(reverse('posts-like', kwargs={'pk': 1}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Posts.objects.get(pk=1).likes_count, 0)
+
+        response = self.client.get(reverse('posts-retrieve', kwargs={'pk': 1}))
+        self.assertEqual(response.data['likes_count'], 0)
+    
+    def test_16_like_toggles_never_create_duplicated_likes_for_authenticated_blogger(self):
+        self.user.role = 'blogger'
+        self.user.save()
+        self.client.force_authenticate(user=self.user)
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', read_permission='public').save()
+
+        for is_active in [True, False, True]:
+            response = self.client.post(reverse('posts-like', kwargs={'pk': 1}))
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(list(Likes.objects.values_list('id', 'is_active')), [(1, is_active)])
+
+        with self.assertRaises(IntegrityError):
+            factories.LikesFactory(user=CustomUsers.objects.get(pk=1), post=Posts.objects.get(pk=1)).save()
+    
+    def test_17_like_toggles_without_returning_support_for_authenticated_blogger(self):
+        # e.g. SQLite before 3.35
+        self.user.role = 'blogger'
+        self.user.save()
+        self.client.force_authenticate(user=self.user)
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', read_permission='public').save()
+
+        with mock.patch.object(connection.features, 'can_return_columns_from_insert', False), mock.patch.object(Likes.objects, '_toggle_without_upsert', wraps=Likes.objects._toggle_without_upsert) as toggle:
+            for is_active in [True, False, True]:
+                response = self.client.post(reverse('posts-like', kwargs={'pk': 1}))
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(list(Likes.objects.values_list('id', 'is_active')), [(1, is_active)])
+
+        self.assertEqual(toggle.call_count, 3)
+        self.assertEqual(Posts.objects.get(pk=1).likes_count, 1)
@@ -0,0 +1,103 @@
+# PYTHON IMPORTS
+from unittest import mock
+
+# DJANGO IMPORTS
+from django.urls import reverse
+
+# DJANGO REST FRAMEWORK IMPORTS
+from rest_framework import serializers, status
+from rest_framework.test import APITestCase, APIClient
+
+# MODELS
+from user.models import CustomUsers
+from posts.models import Posts
+from likes.models import Likes
+from comments.models import Comments
+
+# SERIALIZERS
+from base.serializers import get_values_fields, serialize_values
+from posts.serializers import PostsListModelSerializer
+from likes.serializers import ListLikesModelSerializer
+from comments.serializers import ListCommentsModelSerializer
+
+# FACTORIES
+from . import factories
+
+
+class ValuesFastPath(APITestCase):
+
+    def setUp(self):
+        factories.CustomUsersFactory(email='test_1@example.com').save()
+        factories.CustomUsersFactory(email='test_2@example.com').save()
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1', content='Content 1', read_permission='public').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=2), title='Pöst 2  ', content='', edit_permission='team', likes_count=3).save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=2), title='Post 3', content='Content 3', is_active=False).save()
+
+        for post in (1, 2):
+            factories.LikesFactory(user=CustomUsers.objects.get(pk=1), post=Posts.objects.get(pk=post)).save()
+            factories.CommentsFactory(user=CustomUsers.objects.get(pk=2), post=Posts.objects.get(pk=post), content=f'Comment {post}').save()
+
+        factories.CommentsFactory(user=CustomUsers.objects.get(pk=1), post=Posts.objects.get(pk=1), content='', is_active=False).save()
+    
+    def assert_equivalent(self, serializer_class, queryset, **kwargs):
+        fields = get_values_fields(serializer_class(**kwargs))
+        self.assertIsNotNone(fields)
+
+        expected = serializer_class(queryset, many=True, **kwargs).data
+        self.assertEqual(serialize_values(queryset.values(*fields.values()), fields), [dict(row) for row in expected])
+    
+    def test_1_posts_list_serializer_and_values_rows_are_equivalent(self):
+        self.assert_equivalent(PostsListModelSerializer, Posts.objects.all())
+        self.assert_equivalent(PostsListModelSerializer, Posts.objects.all(), fields=['id', 'title', 'likes_count'])
+    
+    def test_2_likes_list_serializer_and_values_rows_are_equivalent(self):
+        self.assert_equivalent(ListLikesModelSerializer, Likes.objects.all())
+    
+    def test_3_comments_list_serializer_and_values_rows_are_equivalent(self):
+        self.assert_equivalent(ListCommentsModelSerializer, Comments.objects.all())
+    
+    def test_4_serializers_that_are_not_passthroughs_have_no_values_fields(self):
+        class SourceSerializer(serializers.ModelSerializer):
+            author_email = serializers.CharField(source='author.email')
+
+            class Meta:
+                model = Posts
+                fields = ('id', 'author_email')
+
+        class MethodSerializer(serializers.ModelSerializer):
+            upper_title = serializers.SerializerMethodField()
+
+            class Meta:
+                model = Posts
+                fields = ('id', 'upper_title')
+
+            def get_upper_title(self, post):
+                return post.title.upper()
+
+        class RepresentationSerializer(PostsListModelSerializer):
+            def to_representation(self, instance):
+                return {'title': instance.title}
+
+        class DateSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = Posts
+                fields = ('id', 'created_at')
+
+        for serializer_class in (SourceSerializer, MethodSerializer, RepresentationSerializer, DateSerializer):
+            self.assertIsNone(get_values_fields(serializer_class()))
+    
+    def test_5_list_endpoints_do_not_instantiate_models(self):
+        client = APIClient()
+        client.force_authenticate(user=CustomUsers(pk=1, role='admin'))
+
+        with mock.patch.object(Posts, 'from_db', side_effect=AssertionError('Posts instantiated')):
+            response = client.get(reverse('posts-list'), {'pagination': 'cursor', 'page_size': 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [PostsListModelSerializer(Posts.objects.get(pk=1)).data])
+        self.assertIsNotNone(response.data['next'])
+
+        with mock.patch.object(Comments, 'from_db', side_effect=AssertionError('Comments instantiated')):
+            response = client.get(reverse('posts-list_comments', kwargs={'pk': 1}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], ListCommentsModelSerializer(Comments.objects.filter(post=1), many=True).data)
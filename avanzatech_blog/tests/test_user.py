@@ -1,4 +1,6 @@
 # DJANGO IMPORTS
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 # DJANGO REST FRAMEWORK IMPORTS
@@ -7,6 +9,7 @@ from rest_framework.test import APITestCase, APIClient
 
 # MODELS
 from user.models import CustomUsers
+from posts.models import Posts
 
 # FACTORIES
 from . import factories
@@ -352,6 +355,44 @@ class UsersUpdate(APITestCase):
         response = self.client.put(reverse('users-update', kwargs={'pk': 2}), data, format='json')
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         self.assertEqual(response.data['detail'], 'Not found.')
+    
+    def test_16_team_update_for_blogger_user_restamps_his_or_her_posts_by_authenticated_superuser(self):
+        self.user.is_superuser = True
+        self.client.force_authenticate(user=self.user)
+
+        factories.CustomUsersFactory(email='test_1@example.com', role='blogger', team='team 1').save()
+        factories.CustomUsersFactory(email='test_2@example.com', role='blogger', team='team 1').save()
+
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 1').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='Post 2').save()
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=2), title='Post 3').save()
+
+        data = {'team': 'team 2'}
+
+        response = self.client.put(self.endpoint, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(Posts.objects.order_by('id').values_list('author_team', flat=True)), ['team 2', 'team 2', 'team 1'])
+    
+    def test_17_idempotent_user_update_skips_the_write_by_authenticated_superuser(self):
+        self.user.is_superuser = True
+        self.client.force_authenticate(user=self.user)
+
+        CustomUsers.objects.create_user('test_1@example.com', 'password 1', role='blogger', team='team 1', first_name='Test')
+        password, updated_at = CustomUsers.objects.values_list('password', 'updated_at').get(pk=1)
+
+        data = {'email': 'test_1@example.com', 'password': 'password 1', 'role': 'blogger', 'team': 'team 1', 'first_name': 'Test'}
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.put(self.endpoint, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(any(query['sql'].startswith('UPDATE') for query in queries.captured_queries))
+        self.assertEqual(CustomUsers.objects.values_list('password', 'updated_at').get(pk=1), (password, updated_at))
+
+        data['password'] = 'password 2'
+
+        response = self.client.put(self.endpoint, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(CustomUsers.objects.get(pk=1).check_password('password 2'))
 
 
 class UsersDelete(APITestCase):
@@ -399,3 +440,16 @@ class UsersDelete(APITestCase):
         response = self.client.delete(reverse('users-delete', kwargs={'pk': 2}))
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         self.assertEqual(response.data['detail'], 'Not found.')
+    
+    def test_6_user_deletion_is_a_single_update(self):
+        self.user.is_superuser = True
+        self.client.force_authenticate(user=self.user)
+
+        factories.CustomUsersFactory().save()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.delete(self.endpoint)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(CustomUsers.objects.get(pk=1).is_active)
+        self.assertEqual([query['sql'].split()[0] for query in queries], ['UPDATE'])
@@ -0,0 +1,210 @@
+# PYTHON IMPORTS
+import tempfile
+
+# DJANGO IMPORTS
+from django.contrib.auth.models import AnonymousUser
+from django.db import transaction
+from django.urls import reverse
+
+# DJANGO REST FRAMEWORK IMPORTS
+from rest_framework import status
+from rest_framework.test import APITestCase, APIClient
+
+# MODELS
+from user.models import CustomUsers
+from posts.models import Posts
+
+# QUERY SET
+from base.query_set import get_posts_queryset
+
+# CACHE
+from base.cache import get_generation
+
+# VISIBILITY
+from base.visibility import VisibilityIndex as Index, visibility_index
+
+# FACTORIES
+from . import factories
+
+
+class VisibilityIndex(APITestCase):
+
+    def setUp(self):
+        self.client = APIClient()
+
+        factories.CustomUsersFactory(email='test_1@example.com', team='team 1').save()
+        factories.CustomUsersFactory(email='test_2@example.com', team='team 1').save()
+        factories.CustomUsersFactory(email='test_3@example.com', team='team 2').save()
+        factories.CustomUsersFactory(email='test_4@example.com', role='admin').save()
+
+        title = 0
+
+        for author in (1, 2, 3):
+            for read_permission, edit_permission in (('owner', 'owner'), ('team', 'owner'), ('authenticated', 'team'), ('public', 'authenticated'), ('public', 'public')):
+                for is_active in (True, False):
+                    title += 1
+                    factories.PostsFactory(
+                        author=CustomUsers.objects.get(pk=author), title=f'Post {title}', read_permission=read_permission,
+                        edit_permission=edit_permission, is_active=is_active
+                    ).save()
+    
+    def test_1_index_answers_like_the_visibility_filter(self):
+        viewers = [AnonymousUser()] + list(CustomUsers.objects.order_by('id'))
+        ids = list(Posts.objects.order_by('id').values_list('id', flat=True)) + [1000]
+
+        for user in viewers:
+            for method in ('GET', 'PATCH'):
+                expected = list(get_posts_queryset(user, method).order_by('id').values_list('id', flat=True))
+
+                with self.subTest(user=getattr(user, 'email', 'anonymous'), method=method):
+                    self.assertEqual(visibility_index.visible_ids(user, method), expected)
+                    self.assertEqual([pk for pk in ids if visibility_index.can_access(user, pk, method)], expected)
+    
+    def test_2_writes_patch_the_index_on_commit_without_reloading_it(self):
+        user = CustomUsers.objects.get(pk=3)
+        visibility_index.sync()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='New post', read_permission='team').save()
+
+        with self.assertNumQueries(0):
+            self.assertFalse(visibility_index.can_access(user, 31))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CustomUsers.objects.get(pk=1).save_changes(team='team 2')
+            Posts.objects.restamp_author_team(CustomUsers.objects.get(pk=1), 'team 2')
+            visibility_index.refresh([31])
+
+        with self.assertNumQueries(0):
+            self.assertTrue(visibility_index.can_access(user, 31))
+    
+    def test_3_the_generation_moves_only_once_the_write_commits(self):
+        user = CustomUsers.objects.get(pk=3)
+        visibility_index.sync()
+        generation = get_generation('visibility')
+
+        with transaction.atomic():
+            Posts.objects.get(pk=7).save_changes(read_permission='owner')
+            transaction.set_rollback(True)
+
+        self.assertEqual(get_generation('visibility'), generation)
+        self.assertTrue(visibility_index.can_access(user, 7))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Posts.objects.get(pk=7).save_changes(read_permission='owner')
+            self.assertEqual(get_generation('visibility'), generation)
+
+        self.assertEqual(get_generation('visibility'), generation + 1)
+
+        with self.assertNumQueries(0):
+            self.assertFalse(visibility_index.can_access(user, 7))
+    
+    def test_4_posts_the_user_cant_read_are_404s_without_any_query_with_a_shared_cache(self):
+        self.client.force_authenticate(user=CustomUsers.objects.get(pk=3))
+
+        with tempfile.TemporaryDirectory() as location:
+            with self.settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': location}}):
+                visibility_index.sync()
+
+                for endpoint in ('posts-retrieve', 'posts-list_likes', 'posts-list_comments'):
+                    with self.assertNumQueries(0):
+                        response = self.client.get(reverse(endpoint, kwargs={'pk': 1}))
+
+                    self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+    
+    def test_5_likes_of_a_readable_post_dont_load_the_post(self):
+        self.client.force_authenticate(user=CustomUsers.objects.get(pk=3))
+        visibility_index.sync()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse('posts-like', kwargs={'pk': 7}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Posts.objects.get(pk=7).likes_count, 1)
+
+        response = self.client.post(reverse('posts-like', kwargs={'pk': 8}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+    
+    def test_6_deleted_posts_leave_the_index(self):
+        user = CustomUsers.objects.get(pk=1)
+        self.client.force_authenticate(user=user)
+        visibility_index.sync()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(reverse('posts-delete', kwargs={'pk': 9}))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        with self.assertNumQueries(0):
+            self.assertFalse(visibility_index.can_access(user, 9))
+            self.assertTrue(visibility_index.can_access(CustomUsers(role='admin'), 9))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Posts.objects.filter(pk=9).delete()
+
+        with self.assertNumQueries(0):
+            self.assertFalse(visibility_index.can_access(CustomUsers(role='admin'), 9))
+    
+    def test_7_the_database_decides_what_a_stale_index_allows(self):
+        # Writes of another process: this copy of the index never hears of them
+        self.client.force_authenticate(user=CustomUsers.objects.get(pk=3))
+        visibility_index.sync()
+
+        Posts.objects.filter(pk=7).update(read_permission='owner')
+        self.assertTrue(visibility_index.can_access(CustomUsers.objects.get(pk=3), 7))
+
+        for endpoint, method in (('posts-like', 'post'), ('posts-comment', 'post'), ('posts-list_likes', 'get'), ('posts-list_comments', 'get')):
+            with self.subTest(endpoint=endpoint):
+                response = getattr(self.client, method)(reverse(endpoint, kwargs={'pk': 7}), {'content': 'Comment'})
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        self.assertEqual(Posts.objects.get(pk=7).likes_count, 0)
+        self.assertEqual(Posts.objects.get(pk=7).comments_count, 0)
+    
+    def test_8_posts_the_index_doesnt_know_are_checked_in_the_database(self):
+        self.client.force_authenticate(user=CustomUsers.objects.get(pk=3))
+        visibility_index.sync()
+
+        # Not committed in this test case, so the index isn't patched
+        factories.PostsFactory(author=CustomUsers.objects.get(pk=1), title='New post', read_permission='public').save()
+        self.assertFalse(visibility_index.can_access(CustomUsers.objects.get(pk=3), 31))
+
+        response = self.client.post(reverse('posts-like', kwargs={'pk': 31}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Posts.objects.get(pk=31).likes_count, 1)
+    
+    def test_9_copies_behind_reload_only_the_changed_rows(self):
+        user = CustomUsers.objects.get(pk=3)
+        visibility_index.sync()
+
+        # The copy of another process that shares the cache
+        other = Index()
+        other.load()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Posts.objects.get(pk=7).save_changes(read_permission='owner')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Posts.objects.filter(pk=8).update(read_permission='public', is_active=True)
+            visibility_index.refresh([8])
+
+        with self.assertNumQueries(1):
+            other.sync()
+
+        self.assertFalse(other.can_access(user, 7))
+        self.assertTrue(other.can_access(user, 8))
+        self.assertEqual(other.visible_ids(user), visibility_index.visible_ids(user))
+    
+    def test_10_a_per_process_cache_leaves_the_denials_to_the_database(self):
+        user = CustomUsers.objects.get(pk=3)
+        self.client.force_authenticate(user=user)
+        visibility_index.sync()
+
+        # Written by another process: with LocMemCache this copy never hears of it
+        Posts.objects.filter(pk=1).update(read_permission='public')
+        self.assertFalse(visibility_index.can_access(user, 1))
+        self.assertFalse(visibility_index.denies(user, 1))
+
+        for endpoint in ('posts-retrieve', 'posts-list_likes', 'posts-list_comments'):
+            with self.subTest(endpoint=endpoint):
+                response = self.client.get(reverse(endpoint, kwargs={'pk': 1}))
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
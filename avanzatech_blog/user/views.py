@@ -1,6 +1,7 @@
 # DJANGO IMPORTS
 from django.contrib.auth.models import BaseUserManager
-from django.contrib.auth.hashers import make_password
+from django.contrib.auth.hashers import check_password, make_password
+from django.http import Http404
 
 # DJANGO REST FRAMEWORK IMPORTS
 from rest_framework import generics, status
@@ -8,6 +9,13 @@ from rest_framework.response import Response
 
 # MODELS
 from .models import CustomUsers
+from posts.models import Posts
+
+# FEED
+from posts.feed import FAN_OUT_FIELDS, fan_out, rebuild_feed
+
+# VISIBILITY
+from base.visibility import visibility_index
 
 # SERIALIZERS
 from .serializers import UsersModelSerializer
@@ -99,6 +107,7 @@ class UsersUpdateAPIView(generics.UpdateAPIView):
         email = serializer.validated_data.get('email')
         password = serializer.validated_data.get('password')
         instance_role = serializer.instance.role
+        instance_team = serializer.instance.team
         role = serializer.validated_data.get('role')
         team = serializer.validated_data.get('team')
         first_name = serializer.validated_data.get('first_name')
@@ -111,9 +120,10 @@ class UsersUpdateAPIView(generics.UpdateAPIView):
         else:
             email = serializer.instance.email
         
-        if password:
+        if password and not check_password(password, serializer.instance.password):
             password = make_password(password)
         else:
+            # Same password: the stored hash is kept (a new salt would rewrite the row for nothing)
             password = serializer.instance.password
         
         if instance_role == 'admin' and role == 'blogger' and not team:
@@ -126,13 +136,25 @@ class UsersUpdateAPIView(generics.UpdateAPIView):
         elif not team:
             team = serializer.instance.team
         
+        if not role:
+            role = instance_role
+        
         if not first_name:
             first_name = serializer.instance.first_name
         
         if error['errors']:
             return Response(error, status=status.HTTP_400_BAD_REQUEST)
 
-        serializer.save(is_active=is_active, email=email, password=password, role=role, team=team, first_name=first_name)
+        instance.save_changes(**{**serializer.validated_data, 'is_active': is_active, 'email': email, 'password': password, 'role': role, 'team': team, 'first_name': first_name})
+
+        if team != instance_team:
+            if Posts.objects.restamp_author_team(instance, team):
+                visibility_index.refresh(Posts.objects.filter(author=instance).values_list('id', flat=True))
+
+            fan_out(Posts.objects.filter(author=instance, read_permission='team').only(*FAN_OUT_FIELDS))
+
+        if team != instance_team or role != instance_role:
+            rebuild_feed(instance)
 
         if getattr(instance, '_prefetched_objects_cache', None):
             instance._prefetched_objects_cache = {}
@@ -148,6 +170,11 @@ class UsersDeleteAPIView(generics.DestroyAPIView):
     serializer_class = UsersModelSerializer
     permission_classes = [IsSuperuser]
 
-    def perform_destroy(self, instance):
-        instance.is_active = False
-        instance.save()
+    def destroy(self, request, *args, **kwargs):
+        # A single UPDATE, instead of loading the user just to flip is_active
+        users = self.get_queryset().filter(pk=kwargs['pk'])
+
+        if not users.soft_delete() and not users.exists():
+            raise Http404
+
+        return Response(status=status.HTTP_204_NO_CONTENT)